@@ -1,7 +1,30 @@
-from .coingecko_py import CoingeckoApi, error_msgs
+import importlib
 
-# Uncomment when generating a client and no existing client
-# try:
-#     from .coingecko_py import CoingeckoApi, error_msgs
-# except:
-#     pass
+# public name ---> module it's imported from on first access (PEP 562), so importing coingecko_py
+# doesn't import requests, the generated client or optional dependencies until they're used
+_LAZY_IMPORTS = {
+    "CoingeckoApi": ".coingecko_py",
+    "RawResponse": ".coingecko_py",
+    "error_msgs": ".coingecko_py",
+    "AsyncCoingeckoApi": ".coingecko_py_async",
+    "SqliteCache": ".utils.cache",
+    "MemoryCache": ".utils.cache",
+    "Sink": ".utils.sinks",
+    "NdjsonSink": ".utils.sinks",
+    "ParquetSink": ".utils.sinks",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    # cached, so later accesses don't call __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,30 +1,48 @@
 import time
 import math
+import threading
 import logging
-import json
+import copy
 import requests
+from types import MappingProxyType
 from collections import defaultdict
 from functools import partial
 from contextlib import contextmanager
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util import Retry
+from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.structures import CaseInsensitiveDict
 
-from coingecko_py.swagger_generated.swagger_client import (
-    ApiClient as ApiClientSwagger,
-    CoingeckoApi as CoinGeckoApiSwagger,
-)
+from coingecko_py.swagger_generated.endpoints import CoingeckoEndpoints
 
-from coingecko_py.utils.utils import without_keys, dict_get
+from coingecko_py.utils.utils import without_keys, sort_querystring
 from coingecko_py.utils.api_meta import api_meta
+from coingecko_py.utils.rate_limit import TokenBucket, Backoff, parse_retry_after
+from coingecko_py.utils.singleflight import SingleFlight
+from coingecko_py.utils.batch import batch_key, merge_batch, split_batch_result
+from coingecko_py.utils.market_chart import plan_windows, stitch_market_chart
+from coingecko_py.utils.json_decode import get_json_loads, is_utf8
+from coingecko_py.utils.json_stream import STREAM_KEYS, JsonArrayParser
+from coingecko_py.utils.columnar import COLUMNAR_METHODS, validate_columnar, to_columnar
+from coingecko_py.utils.transport import (
+    DEFAULT_TIMEOUT,
+    Transport,
+    get_transport,
+    get_transport_class,
+)
 
 
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 RATE_LIMIT_STATUS_CODE = 429
+# bytes read from the response body at a time when streaming
+STREAM_CHUNK_SIZE = 2 ** 16
+# response headers kept with raw results
+RAW_HEADERS = ("Date", "Per-Page", "Total")
 
 error_msgs = dict(
     exp_limit_reached="Waited for maximum specified time but was still rate limited. Try increasing exp_limit. Queued calls are retained.",
+    backoff_deadline_reached="Rate limited and retrying would exceed backoff_deadline. Try increasing backoff_deadline.",
     failed_decode_bytes="Unable to decode bytes to utf-8 string",
     failed_decode_json="Unable to decode json from string",
     page_start_undefined="page_start must be defined",
@@ -32,20 +50,85 @@ error_msgs = dict(
     page_end_not_int="page_end was specified but was not an int",
     page_end_before_page_start=r"page_end: \d+ less than page_start: \d+",
     page_start_lte_zero=r"page_start: \d+ was less than or equal to 0",
+    queued_while_executing="Calls can't be queued while queued calls are executed, as the queue is cleared once they complete. Queue them after execute_queued / iter_queued returns.",
 )
 
 
-class CoingeckoApiClient(ApiClientSwagger):
-    def __init__(self):
-        super().__init__()
-        # setup HTTP session
-        # TODO: compare benefits of session vs pool
-        self.request_timeout = 120
-        self.session = requests.Session()
+class RawResponse:
+    """Result of a call made with raw=True: the undecoded response content and the RAW_HEADERS
+    present in the response
+    """
+
+    __slots__ = ("content", "headers", "url")
+
+    def __init__(self, content: bytes, headers, url=None):
+        self.content = content
+        self.headers = CaseInsensitiveDict(
+            {k: headers[k] for k in RAW_HEADERS if k in headers}
+        )
+        self.url = url
+
+    def __repr__(self):
+        return f"RawResponse({self.url}, {len(self.content)} bytes)"
+
+
+class CoingeckoApiClient:
+    def __init__(
+        self,
+        url_base=None,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        rate_limiter=None,
+        cache=None,
+        coalesce=True,
+        json_loads=None,
+        transport=None,
+        keep_alive=True,
+        timeout=DEFAULT_TIMEOUT,
+    ):
+        # sends requests, see utils.transport. Created on first use (see transport), an unknown
+        # transport name still raises here
+        if not isinstance(transport, Transport):
+            get_transport_class(transport)
+        # the pool must hold a connection per worker thread when executing queued calls concurrently
+        self._transport_factory = partial(
+            get_transport,
+            transport,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            timeout=timeout,
+        )
+        self._transport = None
+        self._transport_lock = threading.Lock()
         self.scheme = "https"
-        retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504])
-        self.session.mount(f"{self.scheme}://", HTTPAdapter(max_retries=retries))
-        self._include_response = False
+        # url_base overrides the base url from the spec (e.g. for a local test server)
+        self.url_base = url_base
+        # optional TokenBucket that paces every outgoing request
+        self.rate_limiter = rate_limiter
+        # optional persistent response cache (e.g. utils.cache.SqliteCache)
+        self.cache = cache
+        # concurrent calls for the same url share a single request
+        self.single_flight = SingleFlight() if coalesce else None
+        # decodes response content (bytes), orjson when installed
+        self.json_loads = get_json_loads(json_loads)
+        # context local so concurrent calls on other threads are unaffected
+        self._include_response = ContextVar("include_response", default=False)
+        # set to a JsonArrayParser factory while making a streaming call
+        self._stream_parser = ContextVar("stream_parser", default=None)
+
+    @property
+    def transport(self) -> Transport:
+        """The Transport requests are sent on, created on first use so constructing a client
+        opens no session or connection pool
+        """
+        if self._transport is None:
+            with self._transport_lock:
+                if self._transport is None:
+                    self._transport = self._transport_factory()
+        return self._transport
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
 
     @contextmanager
     def request_with_response(self):
@@ -54,26 +137,36 @@ class CoingeckoApiClient(ApiClientSwagger):
         The main use case for this is for page range queries, where we need the raw response object to
         be returned from the api client.
         """
-        self._include_response = True
-        yield
-        self._include_response = False
+        token = self._include_response.set(True)
+        try:
+            yield
+        finally:
+            self._include_response.reset(token)
 
-    def call_api(
-        self, resource_path, method, path_params, query_params, header_params, **kwargs
-    ):
-        path_args = list(
-            path_params.values()
-        )  # dictionaries are ordered from python 3.6 on so this is fine.
-        query_args = {v[0]: v[1] for v in query_params}
-        url = api_meta.materialize_url_template(resource_path, path_args, query_args)
-        logger.debug(f"{self.scheme} request: {url}")
-        assert method == "GET"
+    def call_with_http_info(self, fn, *args, **kwargs):
+        """Returns (data, status code, headers) of the response to fn(*args, **kwargs), a generated
+        endpoint method, as the *_with_http_info methods of the swagger generated api did.
+        """
+        with self.request_with_response():
+            data, response = fn(*args, **kwargs)
+        return data, response.status_code, response.headers
 
+    @contextmanager
+    def request_streaming(self, key=None):
+        """Context manager under which api calls return a generator of the elements of the json array
+        in the response (or of its key member), parsed as the response body is downloaded.
+        """
+        token = self._stream_parser.set(partial(JsonArrayParser, key))
         try:
-            response = self.session.get(url, timeout=self.request_timeout)
-        except requests.exceptions.RequestException:
-            raise
+            yield
+        finally:
+            self._stream_parser.reset(token)
+
+    def build_url(self, resource_path, path_args, query_args):
+        build_url = api_meta.get_url_builder(resource_path)
+        return build_url(path_args, query_args, url_base=self.url_base)
 
+    def raise_for_status(self, response) -> None:
         try:
             response.raise_for_status()
         except requests.HTTPError as e:
@@ -82,72 +175,383 @@ class CoingeckoApiClient(ApiClientSwagger):
             )
             raise e
 
+    def handle_response(self, response, include_response, raw=False):
+        """Checks the status code of a response and decodes its json content (unless raw)"""
+        self.raise_for_status(response)
+
+        if raw:
+            result = RawResponse(response.content, response.headers, response.url)
+            return (result, response) if include_response else result
+
         try:
-            content = json.loads(response.content.decode("utf-8", "strict"))
+            content = self.json_loads(response.content)
+        except ValueError:
+            # UnicodeDecodeError and JSONDecodeError are ValueErrors. Decoders differ in which they
+            # raise for invalid utf-8, so failures are classified by checking the content
+            if not is_utf8(response.content):
+                raise requests.exceptions.ContentDecodingError(
+                    0, error_msgs["failed_decode_bytes"], response=response
+                )
+            raise requests.exceptions.JSONDecodeError(
+                0, error_msgs["failed_decode_json"], response=response
+            )
+
+        if include_response:
+            return content, response
+        else:
+            return content
+
+    def get_cached_response(self, resource_path, url):
+        """Returns a requests.Response built from the cache entry for url, or None on a cache miss"""
+        cached = self.cache.get(
+            sort_querystring(url),
+            api_meta.get_endpoint(resource_path).method_name,
+            revalidate=partial(self.revalidate, resource_path, url),
+        )
+        if cached is None:
+            return None
+        logger.debug(f"cache hit: {url}")
+        content, headers = cached
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(headers)
+        response.url = url
+        response._content = content
+        return response
+
+    def put_cached_response(self, resource_path, url, response) -> None:
+        self.cache.put(
+            sort_querystring(url),
+            response.content,
+            response.headers,
+            api_meta.get_endpoint(resource_path).method_name,
+        )
+
+    def revalidate(self, resource_path, url) -> None:
+        """Refreshes the stale cache entry for url on a background thread"""
+        thread = threading.Thread(
+            target=self.refresh_cached_response, args=(resource_path, url), daemon=True
+        )
+        thread.start()
+
+    def refresh_cached_response(self, resource_path, url) -> None:
+        logger.debug(f"refreshing cache entry: {url}")
+        try:
+            response = self.send_request(url)
+            self.handle_response(response, False)
+            self.put_cached_response(resource_path, url, response)
+        except Exception as e:
+            logger.warning(f"Failed to refresh cache entry: {url} {e}")
+        finally:
+            self.cache.refresh_done(sort_querystring(url))
+
+    def send_request(self, url, stream=False) -> requests.Response:
+        """Sends a GET request for url, paced by the rate limiter"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        try:
+            response = self.transport.get(url, stream=stream)
+        except requests.exceptions.RequestException:
+            raise
+        return response
+
+    def iter_stream(self, response, parser: JsonArrayParser):
+        """Yields the elements parsed from the body of a streamed response as it is downloaded"""
+        try:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                yield from parser.feed(chunk)
+            yield from parser.close()
         except UnicodeDecodeError:
             raise requests.exceptions.ContentDecodingError(
                 0, error_msgs["failed_decode_bytes"], response=response
             )
-        except json.decoder.JSONDecodeError:
+        except ValueError:
             raise requests.exceptions.JSONDecodeError(
                 0, error_msgs["failed_decode_json"], response=response
             )
+        finally:
+            response.close()
 
-        if self._include_response:
-            return content, response
+    def call_api(
+        self, resource_path, method, path_params, query_params, header_params, **kwargs
+    ):
+        """Entry point of the swagger generated api, see call_endpoint"""
+        assert method == "GET"
+        # dictionaries are ordered from python 3.6 on so this is fine.
+        path_args = list(path_params.values())
+        query_args = {v[0]: v[1] for v in query_params}
+        # swagger's flag for returning the response without deserializing it, set by raw=True
+        raw = kwargs.get("_preload_content") is False
+        return self.call_endpoint(resource_path, path_args, query_args, raw)
+
+    def select_header_accept(self, accepts):
+        """Read by the swagger generated api, whose headers call_api doesn't send. The swagger
+        ApiClient isn't a base class, so the generated client is only imported where it's used.
+        """
+        return "application/json"
+
+    def call_endpoint(self, resource_path, path_args, query_args, raw=False):
+        """Requests the endpoint of resource_path (its url template), called by the generated
+        endpoint methods (see swagger_generated.endpoints)
+        """
+        url = self.build_url(resource_path, path_args, query_args)
+        logger.debug(f"{self.scheme} request: {url}")
+        include_response = self._include_response.get()
+        stream_parser = self._stream_parser.get()
+        if stream_parser is not None:
+            # streamed responses bypass the cache and aren't coalesced
+            response = self.send_request(url, stream=True)
+            try:
+                self.raise_for_status(response)
+            except requests.HTTPError:
+                response.close()
+                raise
+            return self.iter_stream(response, stream_parser())
+
+        if self.cache is not None:
+            response = self.get_cached_response(resource_path, url)
+            if response is not None:
+                return self.handle_response(response, include_response, raw)
+
+        if self.single_flight is not None:
+            response = self.single_flight.do(url, partial(self.send_request, url))
         else:
-            return content
+            response = self.send_request(url)
+        result = self.handle_response(response, include_response, raw)
+        # only responses that decoded successfully are cached
+        if self.cache is not None and not raw:
+            self.put_cached_response(resource_path, url, response)
+        return result
 
 
-class ResultsCache:
-    def __init__(self):
-        self.cache = dict()
-        self.page_range_query_first_call_keys = set()
+# kwargs of queued calls without any, shared rather than an empty dict per call
+_NO_KWARGS = MappingProxyType(dict())
+
+
+def call_key(fn, args, kwargs):
+    """Returns a key that is equal for calls of the same api method with the same arguments"""
+    items = tuple(sorted(kwargs.items())) if kwargs else ()
+    # True == 1 == 1.0 but they're different in a url, so other types are compared by repr
+    for v in args:
+        if type(v) is not str and type(v) is not int:
+            return (fn.__name__, repr(args), repr(items))
+    for _, v in items:
+        if type(v) is not str and type(v) is not int:
+            return (fn.__name__, repr(args), repr(items))
+    return (fn.__name__, args, items)
+
+
+class QueuedCall:
+    """A queued call of fn, or with pages (a range) a call per page of a bounded page range query.
+    Pages are expanded into calls as they're executed, so a page range query is queued as one record.
+    """
+
+    __slots__ = ("fn", "args", "kwargs", "pages")
+
+    def __init__(self, fn, args, kwargs, pages=None):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs or _NO_KWARGS
+        self.pages = pages
 
-    def put_page_range_unbounded_first_result(self, qid, page, data):
-        assert page is not None
-        self.page_range_query_first_call_keys.add((page, qid))
-        self.put_page_range_query(qid, data)
+    def __len__(self):
+        return 1 if self.pages is None else len(self.pages)
 
-    def check_contains_page_range_unbounded_first_result(self, qid, page):
-        return (page, qid) in self.page_range_query_first_call_keys
+    def __iter__(self):
+        """Yields (fn, args, kwargs) of each call"""
+        if self.pages is None:
+            yield self.fn, self.args, self.kwargs
+            return
+        for page in self.pages:
+            yield self.fn, self.args, {**self.kwargs, "page": page}
+
+
+# placeholder of a qid in ResultsCache until its result is stored
+_NO_RESULT = object()
+
+
+class ResultsCache:
+    """Results keyed by qid. Results complete out of queue order (concurrent and merged calls),
+    so the qids are inserted up front to keep the results in the order they were queued.
+    """
+
+    def __init__(self, qids=()):
+        self.cache = dict.fromkeys(qids, _NO_RESULT)
 
     def put(self, qid, data):
         self.cache[qid] = data
 
     def put_page_range_query(self, qid, data):
-        if qid not in self.cache:
+        if self.cache.get(qid, _NO_RESULT) is _NO_RESULT:
             self.cache[qid] = list()
         self.cache[qid].append(data)
 
     def data(self):
-        return self.cache
+        return {qid: data for qid, data in self.cache.items() if data is not _NO_RESULT}
 
 
-class CoingeckoApi(CoinGeckoApiSwagger):
+class ReorderBuffer:
+    """Releases the results of each qid in order of their position n within the calls of the qid.
+
+    Results of different qids are released independently, so a slow page only holds back later
+    pages of the same page range query. When ordered is False results are released immediately.
+    """
+
+    def __init__(self, ordered=True):
+        self.ordered = ordered
+        self.released = defaultdict(int)
+        self.buffer = dict()
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def put(self, qid, n, item) -> list:
+        """Buffers the item at position n and returns the items of qid that can now be released.
+        n is None for the only item of a qid, which is released immediately.
+        """
+        if not self.ordered or n is None:
+            return [item]
+        self.buffer[(qid, n)] = item
+        items = list()
+        while (qid, self.released[qid]) in self.buffer:
+            items.append(self.buffer.pop((qid, self.released[qid])))
+            self.released[qid] += 1
+        return items
 
-    defaults = dict(exp_limit=8, progress_interval=10, log_level=logging.INFO)
+
+class ProgressLogger:
+    """Logs the percentage of completed calls each time it grows by at least interval"""
+
+    def __init__(self, num_calls, interval):
+        self.num_calls = num_calls
+        self.interval = interval
+        self.call_count = 0
+        self.last_progress = 0
+
+    def update(self):
+        self.call_count += 1
+        progress = self.call_count / self.num_calls * 100
+        next_progress = self.last_progress + self.interval
+        if progress >= next_progress:
+            logger.info(f"Progress: {math.floor(progress)}%")
+            self.last_progress = progress
+
+
+class ApiEndpoint:
+    """Class level wrapper of a generated api method, see CoingeckoApi._wrap_api_endpoint.
+
+    Accessed from an instance it returns the method bound to the instance, wrapped to add queueing
+    and page range queries. The wrapper is stored on the instance, so later accesses are plain
+    attribute lookups and constructing a client does no per method work.
+    """
+
+    __slots__ = ("fn", "name", "page_range_query")
+
+    def __init__(self, fn, page_range_query):
+        self.fn = fn
+        self.name = fn.__name__
+        self.page_range_query = page_range_query
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        wrapped = partial(
+            instance._wrap_api_endpoint,
+            self.fn.__get__(instance, owner),
+            self.page_range_query,
+        )
+        instance.__dict__[self.name] = wrapped
+        return wrapped
+
+
+def wrap_api_endpoints(cls):
+    """Class decorator replacing the api methods of cls with ApiEndpoint wrappers"""
+    paginated_method_names = set(api_meta.get_paginated_method_names())
+    for name in api_meta.get_api_method_names():
+        setattr(
+            cls, name, ApiEndpoint(getattr(cls, name), name in paginated_method_names)
+        )
+    return cls
+
+
+@wrap_api_endpoints
+class CoingeckoApi(CoingeckoEndpoints):
+
+    api_client_class = CoingeckoApiClient
+    # returned by calls queued with qid
+    _queued_result = None
+    defaults = dict(
+        exp_limit=8,
+        progress_interval=10,
+        log_level=logging.INFO,
+        max_workers=1,
+        probe_workers=None,
+        url_base=None,
+        calls_per_minute=None,
+        burst=1,
+        backoff_max=60,
+        backoff_deadline=None,
+        cache=None,
+        coalesce=True,
+        batch_calls=False,
+        columnar=None,
+        json_loads=None,
+        raw=False,
+        transport=None,
+        keep_alive=True,
+        timeout=DEFAULT_TIMEOUT,
+    )
 
     def __init__(self, *args, **kwargs):
+        config = {
+            k: v if kwargs.get(k) is None else kwargs[k]
+            for k, v in self.defaults.items()
+        }
+        # probes are only concurrent when opted into, like queued calls (see max_workers)
+        if config["probe_workers"] is None:
+            config["probe_workers"] = config["max_workers"]
+        rate_limiter = None
+        if config["calls_per_minute"]:
+            rate_limiter = TokenBucket(config["calls_per_minute"], config["burst"])
         super().__init__(
             *args,
-            api_client=CoingeckoApiClient(),
+            api_client=self.api_client_class(
+                url_base=config["url_base"],
+                pool_maxsize=max(config["max_workers"], config["probe_workers"]),
+                rate_limiter=rate_limiter,
+                cache=config["cache"],
+                coalesce=config["coalesce"],
+                json_loads=config["json_loads"],
+                transport=config["transport"],
+                keep_alive=config["keep_alive"],
+                timeout=config["timeout"],
+            ),
             **without_keys(kwargs, *self.defaults.keys()),
         )
         # setup wrapper instance fields, for managing queued calls, rate limit behavior, page range queries
         self._reset_state()
-        for k, v in self.defaults.items():
-            setattr(self, k, kwargs.get(k) or v)
+        for k, v in config.items():
+            setattr(self, k, v)
         logger.setLevel(self.log_level)
-        # decorate bound methods on base class that correspond to api calls to enable
-        # queueing and page range query support for page range query enabled functions
-        method_names = api_meta.get_api_method_names()
-        paginated_method_names = api_meta.get_paginated_method_names()
-        for name in method_names:
-            v = getattr(self, name)
-            page_range_query = name in paginated_method_names
-            logger.debug(f"Decorating: {name:60} page_range_query: {page_range_query}")
-            setattr(self, name, partial(self._wrap_api_endpoint, v, page_range_query))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Closes the transport of the api client (its connection pool and, for httpx, its event
+        loop thread). Also called on leaving a with block.
+        """
+        self.api_client.close()
+
+    @property
+    def rate_limiter(self):
+        """The client side TokenBucket (None unless calls_per_minute was configured)"""
+        return self.api_client.rate_limiter
 
     def _validate_page_range(self, page_start, page_end) -> None:
         """Validates user supplied values for page_start and page_end"""
@@ -164,55 +568,107 @@ class CoingeckoApi(CoinGeckoApiSwagger):
 
     def _reset_state(self) -> None:
         """Resets internal state. State is used to support queueing and page range queries"""
-        self._queued_calls = defaultdict(list)
-        self._page_range_qids = list()
-        self._infer_page_end_qids = list()
+        # qid ---> [QueuedCall, ...]
+        self._queued_calls = dict()
+        self._page_range_qids = set()
+        # qids of unbounded page range queries, a dict to keep them in order of queueing
+        self._infer_page_end_qids = dict()
+        # qid ---> [start, end, number of windows, completed window results] of market chart range queries
+        self._range_qids = dict()
+        # qid ---> (fn, mode) of queued calls with columnar results
+        self._columnar_qids = dict()
+        # set while queued calls are executed, when queueing more would be lost on reset
+        self._executing = False
         logger.debug("Resetting state")
 
-    def _queue_single(self, qid, fn, dup_check, *args, **kwargs) -> None:
+    def _queue_single(self, qid, call: QueuedCall, dup_check=True) -> None:
         """Queue a single API call. Optionally perform a duplicate check to see if qid is being overwritten"""
-        if dup_check and qid in self._queued_calls:
+        calls = self._queued_calls.get(qid)
+        if calls is None:
+            self._queued_calls[qid] = [call]
+            return
+        if dup_check:
             # TODO: Test that this log appears when queueing two calls with same qid
             logger.warning(
                 f"Warning: multiple calls queued with identical qid: {qid}. Most recent call will overwrite old call."
             )
-        self._queued_calls[qid].append((fn, args, kwargs))
+        calls.append(call)
 
-    def _impute_page_range_calls(self, res_cache: ResultsCache):
+    def _impute_page_range_calls(self):
         """Finds each queued call that is a page range query where page_start is defined and page_end is not included.
         Executes each of these calls to get an HTTP header back containing information on how many pages exist. With
-        this information, we queue the remainder of calls. We cache the result of the call we already executed in
-        res_cache and return this value.
+        this information, we queue the remainder of calls. Returns a list of (qid, page, result) for the calls we
+        already executed.
+
+        The first page calls are executed concurrently (up to probe_workers at once, max_workers
+        unless set), so the time spent here stays close to a single round trip rather than growing
+        with the number of queries.
         """
-        include_response = True
+        first_results = list()
+        probes = self._execute_calls(
+            self._iter_first_page_calls(),
+            include_response=True,
+            ordered=False,
+            max_workers=self.probe_workers,
+        )
+        for qid, page, (res, response) in probes:
+            self._queue_remaining_pages(qid, response)
+            first_results.append((qid, page, res))
+        return first_results
+
+    def _iter_first_page_calls(self):
+        """Yields a call (see _execute_calls) for the first page of each unbounded page range query"""
         for qid in self._infer_page_end_qids:
             call_list = self._queued_calls[qid]
             if len(call_list) != 1:
                 raise ValueError(
                     "Implementation error. infer page_end was true but more than one call in call_list"
                 )
-            fn, args, kwargs = call_list[0]
-            page_start = kwargs["page"]
-            res, response = self._execute_single(include_response, fn, *args, **kwargs)
-            res_cache.put_page_range_unbounded_first_result(qid, page_start, res)
-            per_page = int(response.headers["Per-Page"])
-            total = int(response.headers["Total"])
-            page_end = math.ceil(total / per_page)
-            logger.debug(
-                f"page range query: {qid} page_start: {page_start:4} page_end: {page_end:4} per_page: {per_page:4} total: {total}"
-            )
-            # note: we already queued a request for page_start so we begin at page_start + 1
-            for page in range(page_start + 1, page_end + 1):
-                logger.debug(f"queueing page: {page}")
-                self._queue_single(qid, fn, False, *args, **{**kwargs, "page": page})
+            call = call_list[0]
+            yield call.fn, call.args, call.kwargs, [(qid, 0, call.kwargs["page"], None)]
+
+    def _queue_remaining_pages(self, qid, response):
+        """Given the response of the first call of an unbounded page range query, replaces the
+        executed first call with a call for each of the remaining pages
+        """
+        call = self._queued_calls[qid].pop()
+        page_start = call.kwargs["page"]
+        per_page = int(response.headers["Per-Page"])
+        total = int(response.headers["Total"])
+        page_end = math.ceil(total / per_page)
+        logger.debug(
+            f"page range query: {qid} page_start: {page_start:4} page_end: {page_end:4} per_page: {per_page:4} total: {total}"
+        )
+        # note: we already queued a request for page_start so we begin at page_start + 1
+        pages = range(page_start + 1, page_end + 1)
+        self._queue_single(
+            qid, QueuedCall(call.fn, call.args, call.kwargs, pages), False
+        )
+
+    def _backoff(self) -> Backoff:
+        return Backoff(max_sleep=self.backoff_max, deadline=self.backoff_deadline)
+
+    def _rate_limit_sleep(
+        self, backoff: Backoff, e: requests.exceptions.RequestException
+    ):
+        """Returns seconds to sleep before retrying a rate limited call. Honors the Retry-After
+        header of the response when present.
+        """
+        headers = getattr(e.response, "headers", None) or dict()
+        secs = backoff.next_sleep(parse_retry_after(headers.get("Retry-After")))
+        if secs is None:
+            raise Exception(error_msgs["backoff_deadline_reached"])
+        logger.info(f"Rate limited: sleeping {secs:.2f} seconds")
+        return secs
 
     def _execute_single(self, include_response, fn, *args, **kwargs):
-        """Execute a single API call with exponential backoff retries to deal with server side rate limiting.
+        """Execute a single API call with backoff retries to deal with server side rate limiting.
 
         Maximum of exp_limit + 1 request attempts.
         """
         exp = 0
         res = None
+        backoff = self._backoff()
         while exp < self.exp_limit + 1:
             try:
                 if include_response:
@@ -227,10 +683,9 @@ class CoingeckoApi(CoinGeckoApiSwagger):
                 raise
             except requests.exceptions.RequestException as e:
                 if e.response.status_code == RATE_LIMIT_STATUS_CODE:
-                    secs = 2 ** exp
-                    logger.info(f"Rate limited: sleeping {secs} seconds")
-                    time.sleep(secs)
                     exp += 1
+                    if exp < self.exp_limit + 1:
+                        time.sleep(self._rate_limit_sleep(backoff, e))
                 else:
                     # Any non 429 http respose error code is a failure condition
                     raise e
@@ -238,93 +693,384 @@ class CoingeckoApi(CoinGeckoApiSwagger):
             raise Exception(error_msgs["exp_limit_reached"])
         return res
 
-    def _execute_queued(self):
-        """Execute all queued calls
+    def _progress_logger(self, num_executed=0) -> ProgressLogger:
+        num_calls = num_executed
+        for calls in self._queued_calls.values():
+            for call in calls:
+                num_calls += len(call)
+        logger.info(f"Begin executing {num_calls} queued calls")
+        return ProgressLogger(num_calls, self.progress_interval)
+
+    def _store_result(self, cache: ResultsCache, qid, res) -> None:
+        if qid in self._page_range_qids:
+            cache.put_page_range_query(qid, res)
+        else:
+            cache.put(qid, res)
+
+    def _pending_calls(self):
+        """Yields a call (see _execute_calls) for each distinct queued call.
+
+        Queued calls of the same api method with the same arguments request the same url, so they
+        are merged into one call with a consumer for each. When batch_calls is set, calls that
+        only differ in a comma separated list parameter (e.g. the ids of simple_price_get) are
+        merged into as few calls as fit a url, and each consumer gets its part of the result.
+
+        The consumers of each call are collected in a first pass over the queue. Calls are then
+        yielded in a second pass, expanding the pages of page range queries again, so only a key
+        and a consumer are held per queued call rather than the call itself.
+        """
+        # qids queued while calls are executed (e.g. by the consumer of iter_queued) are left out
+        qids = list(self._queued_calls)
+        # call key ---> consumer, or a list of consumers once a call is queued more than once
+        consumers_of = dict()
+        batches = defaultdict(list)
+
+        def add(key, consumer):
+            consumers = consumers_of.get(key)
+            if consumers is None:
+                consumers_of[key] = consumer
+            elif isinstance(consumers, list):
+                consumers.append(consumer)
+            else:
+                consumers_of[key] = [consumers, consumer]
+
+        def iter_calls(batches=None):
+            """Yields (key, qid, n, fn, args, kwargs) of each queued call that isn't merged in a
+            batch. The calls that are, are added to batches if given.
+            """
+            for qid in qids:
+                call_list = self._queued_calls[qid]
+                batch_calls = self.batch_calls and qid not in self._page_range_qids
+                # the result of a qid with a single call needs no position (see ReorderBuffer)
+                single = len(call_list) == 1 and len(call_list[0]) == 1
+                calls_of_qid = (c for call in call_list for c in call)
+                for n, (fn, args, kwargs) in enumerate(calls_of_qid):
+                    n = None if single else n
+                    if batch_calls:
+                        endpoint = api_meta.get_endpoint_by_method(fn.__name__)
+                        batch = batch_key(endpoint, args, kwargs)
+                        if batch is not None:
+                            if batches is not None:
+                                key, ids = batch
+                                consumer = (qid, n, kwargs.get("page"))
+                                batches[key].append((fn, args, kwargs, ids, consumer))
+                            continue
+                    yield call_key(fn, args, kwargs), qid, n, fn, args, kwargs
+
+        for key, qid, n, fn, args, kwargs in iter_calls(batches):
+            add(key, (qid, n, kwargs.get("page"), None))
+        logger.debug(f"{len(consumers_of)} distinct queued calls")
+        for key, _, _, fn, args, kwargs in iter_calls():
+            # calls queued more than once are yielded at their first position, with every consumer
+            consumers = consumers_of.pop(key, None)
+            if consumers is None:
+                continue
+            if not isinstance(consumers, list):
+                consumers = [consumers]
+            yield fn, args, kwargs, consumers
+        for batch in batches.values():
+            endpoint = api_meta.get_endpoint_by_method(batch[0][0].__name__)
+            for fn, args, kwargs, consumers in merge_batch(endpoint, batch):
+                yield fn, args, kwargs, [(*c, ids) for c, ids in consumers]
+
+    def _result_page(self, qid, page):
+        return page if qid in self._page_range_qids else None
+
+    def _release_result(self, reorder: ReorderBuffer, consumers, res):
+        """Yields (qid, page, result) for each consumer of a completed call that can be released.
+        Consumers of a merged call receive the part of the result for their ids. Other consumers
+        after the first receive a copy so results can be modified independently.
+        """
+        for i, (qid, n, page, ids) in enumerate(consumers):
+            if ids is not None:
+                data = split_batch_result(res, ids)
+            else:
+                data = res if i == 0 else copy.deepcopy(res)
+            for item_page, item in reorder.put(qid, n, (page, data)):
+                yield qid, item_page, item
+
+    def _execute_calls(
+        self, calls, include_response=False, ordered=True, max_workers=None
+    ):
+        """Executes each call in calls, yielding (qid, page, result) as calls complete.
+
+        Each call is (fn, args, kwargs, consumers), where consumers is a list of (qid, n, page, ids)
+        that want the result, n being the position of the call within the calls queued for qid, page
+        the page argument of the call and ids the ids the consumer requested of a merged call
+        (otherwise None). The result of a call is
+        yielded once per consumer.
+
+        When max_workers (self.max_workers unless given) > 1, up to 2 * max_workers calls are
+        submitted at once to a thread pool that shares the api client's session. Each call retains
+        its own rate limit backoff. If ordered, the results of each qid are yielded in order of n.
+        Calls are pulled from calls lazily and completed results waiting on an earlier call count
+        towards the bound, so memory use doesn't grow with the queue.
+        """
+        if max_workers is None:
+            max_workers = self.max_workers
+        reorder = ReorderBuffer(ordered)
+        if max_workers <= 1:
+            for fn, args, kwargs, consumers in calls:
+                res = self._execute_single(include_response, fn, *args, **kwargs)
+                yield from self._release_result(reorder, consumers, res)
+            return
+        window = 2 * max_workers
+        pending = dict()
+        calls = iter(calls)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                exhausted = False
+                while True:
+                    # buffered results may wait on calls that haven't been submitted yet, so
+                    # submission never stops while nothing is pending
+                    while (
+                        not exhausted
+                        and len(pending) < window
+                        and (len(pending) + len(reorder) < window or not pending)
+                    ):
+                        call = next(calls, None)
+                        if call is None:
+                            exhausted = True
+                            break
+                        fn, args, kwargs, consumers = call
+                        future = executor.submit(
+                            self._execute_single, include_response, fn, *args, **kwargs
+                        )
+                        pending[future] = consumers
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        consumers = pending.pop(future)
+                        yield from self._release_result(
+                            reorder, consumers, future.result()
+                        )
+            finally:
+                # on failure, don't start any calls that haven't been started yet
+                for future in pending:
+                    future.cancel()
+
+    def _iter_queued(self, ordered=True):
+        """Executes all queued calls, yielding (qid, page, result) as each call completes
 
         - Prior to execution, we impute calls for page range queries
         - Logs progress at configurable intervals
         """
         # impute calls related to page range queries where page_end is not specified
-        cache = ResultsCache()
-        self._impute_page_range_calls(cache)
+        first_results = self._impute_page_range_calls()
+        progress = self._progress_logger(len(first_results))
+        for qid, page, res in first_results:
+            progress.update()
+            yield qid, page, res
         # execute all queued calls
-        last_progress = 0
-        call_count = 0
-        num_calls = sum([len(v) for v in self._queued_calls.values()]) + len(
-            self._infer_page_end_qids
-        )
-        include_response = False
-        logger.info(f"Begin executing {num_calls} queued calls")
-        for (qid, call_list) in self._queued_calls.items():
-            for fn, args, kwargs in call_list:
-                # check if this call was already completed (first call in unbounded page range query)
-                if cache.check_contains_page_range_unbounded_first_result(
-                    qid, kwargs.get("page", None)
-                ):
-                    continue
-                # if cache miss, make api call (with retries)
-                res = self._execute_single(
-                    include_response,
-                    fn,
-                    *args,
-                    **kwargs,
-                )
-                # store the result
-                if qid in self._page_range_qids:
-                    cache.put_page_range_query(qid, res)
-                else:
-                    cache.put(qid, res)
-                # log progress
-                call_count += 1
-                progress = call_count / num_calls * 100
-                next_progress = last_progress + self.progress_interval
-                if progress >= next_progress:
-                    logger.info(f"Progress: {math.floor(progress)}%")
-                    last_progress = progress
+        for qid, page, res in self._execute_calls(
+            self._pending_calls(), ordered=ordered
+        ):
+            progress.update()
+            complete, res = self._complete_result(qid, res)
+            if complete:
+                yield qid, self._result_page(qid, page), res
+
+    def _execute_queued(self, sink=None):
+        """Execute all queued calls, returning a dictionary of results keyed by qid. If a sink is
+        given, results are written to it as they complete instead.
+        """
+        if sink is not None:
+            for qid, page, res in self._iter_queued():
+                sink.write(qid, page, res)
+            sink.flush()
+            return None
+        cache = ResultsCache(self._queued_calls)
+        for qid, page, res in self._iter_queued():
+            self._store_result(cache, qid, res)
         return cache.data()
 
-    def _queue_page_range_query(self, qid, fn, *args, **kwargs) -> None:
-        page, page_start, page_end = dict_get(kwargs, "page", "page_start", "page_end")
-        kwargs = without_keys(kwargs, "page_start", "page_end")
+    def _queue_page_range_query(self, qid, fn, args, kwargs) -> None:
+        """Queues a call of a paginated endpoint. kwargs is owned by the call, page_start and
+        page_end are popped from it.
+        """
+        page_start = kwargs.pop("page_start", None)
+        page_end = kwargs.pop("page_end", None)
+        page = kwargs.get("page")
         if not (page or page_start or page_end) or page:
             # 1. paged endpoint but no paging arguments specified (api uses default of page 1)
             # 2. paged endpoint and single page specified (supported by base api client)
-            self._queue_single(qid, fn, True, *args, **kwargs)
+            self._queue_single(qid, QueuedCall(fn, args, kwargs))
         else:
             # one or more of page_start and page_end is defined ---> is page range query
             self._validate_page_range(page_start, page_end)
-            self._page_range_qids.append(qid)
+            self._page_range_qids.add(qid)
             if page_end:
-                for i, page in enumerate(range(page_start, page_end + 1)):
-                    # all queued requests after first are allowed to have same qid, as they are part of a page range query
-                    dup_check = i == 0
-                    self._queue_single(qid, fn, dup_check, *args, page=page, **kwargs)
+                # a single record for all pages, expanded as the calls are executed
+                pages = range(page_start, page_end + 1)
+                self._queue_single(qid, QueuedCall(fn, args, kwargs, pages))
             else:
                 # when only page_start is specified we are dealing with an unbounded page range query.
                 # the total number of queries can only be determined at execution time. we queue first
                 # now and the rest will be queued and executed when `execute_many` is called
-                self._queue_single(qid, fn, True, *args, page=page_start, **kwargs)
-                self._infer_page_end_qids.append(qid)
+                kwargs["page"] = page_start
+                self._queue_single(qid, QueuedCall(fn, args, kwargs))
+                self._infer_page_end_qids[qid] = None
+
+    def _range_query_calls(self, fn, granularity, *args, **kwargs):
+        """Returns (start, end, calls) for a market chart range query, where calls is a (fn, args, kwargs)
+        for each window of the range planned for granularity.
+        """
+        endpoint = api_meta.get_endpoint_by_method(fn.__name__)
+        positional = endpoint.path_names + endpoint.required_query_names
+        if "from" not in positional or "to" not in positional:
+            raise ValueError(
+                f"granularity is not supported by {fn.__name__}, only by market chart range endpoints"
+            )
+        # arguments passed by keyword are moved to their position. from is passed as _from in python
+        args = list(args)
+        for name in positional[len(args) :]:
+            name = "_from" if name == "from" else name
+            if name not in kwargs:
+                break
+            args.append(kwargs[name])
+            kwargs = without_keys(kwargs, name)
+        i_from, i_to = positional.index("from"), positional.index("to")
+        if len(args) <= max(i_from, i_to):
+            raise ValueError(f"{fn.__name__} requires from and to")
+        start, end = args[i_from], args[i_to]
+        calls = list()
+        for window_start, window_end in plan_windows(start, end, granularity):
+            args[i_from], args[i_to] = str(window_start), str(window_end)
+            calls.append((fn, tuple(args), kwargs))
+        return start, end, calls
+
+    def _queue_range_query(self, qid, fn, granularity, *args, **kwargs) -> None:
+        start, end, calls = self._range_query_calls(fn, granularity, *args, **kwargs)
+        for i, (fn, args, kwargs) in enumerate(calls):
+            self._queue_single(qid, QueuedCall(fn, args, kwargs), i == 0)
+        self._range_qids[qid] = [start, end, len(calls), list()]
+
+    def _collect_range_result(self, qid, res):
+        """Collects the result of a window of a market chart range query. Returns the stitched result
+        once every window completed, otherwise None.
+        """
+        start, end, num_windows, results = self._range_qids[qid]
+        results.append(res)
+        if len(results) < num_windows:
+            return None
+        return stitch_market_chart(results, start, end)
+
+    def _complete_result(self, qid, res):
+        """Returns (complete, result) for the result of a queued call. Windows of market chart range
+        queries are incomplete until the last one is stitched. Columnar results are converted.
+        """
+        if qid in self._range_qids:
+            res = self._collect_range_result(qid, res)
+            if res is None:
+                return False, None
+        if qid in self._columnar_qids:
+            fn, columnar = self._columnar_qids[qid]
+            res = to_columnar(fn.__name__, res, columnar)
+        return True, res
+
+    def _columnar_result(self, fn, columnar, res):
+        """Converts the result of a direct (not queued) call to columnar"""
+        return to_columnar(fn.__name__, res, columnar)
+
+    def _execute_range_query(self, fn, granularity, *args, **kwargs):
+        """Executes the windows of a market chart range query, up to probe_workers at once. Like the
+        first page probes of page range queries, a direct call can't start until its windows
+        complete, so they share that bound rather than max_workers. It defaults to max_workers, so
+        windows are fetched one at a time unless concurrency is opted into.
+        """
+        start, end, calls = self._range_query_calls(fn, granularity, *args, **kwargs)
+        calls = [
+            (fn, args, kwargs, [(None, n, None, None)])
+            for n, (fn, args, kwargs) in enumerate(calls)
+        ]
+        executed = self._execute_calls(
+            calls, ordered=False, max_workers=self.probe_workers
+        )
+        results = [res for _, _, res in executed]
+        return stitch_market_chart(results, start, end)
+
+    def _stream_call(self, fn, *args, **kwargs):
+        """Makes a call with stream=True, returning a generator of the elements of the response"""
+        options = ["qid", "page_start", "page_end", "granularity", "columnar", "raw"]
+        used = [k for k in options if kwargs.get(k) not in (None, False)]
+        if used:
+            raise ValueError(f"stream=True can't be used with: {used}")
+        kwargs = without_keys(kwargs, "stream", *options)
+        with self.api_client.request_streaming(STREAM_KEYS.get(fn.__name__)):
+            return fn(*args, **kwargs)
 
     def _wrap_api_endpoint(self, fn, page_range_query, *args, **kwargs):
         """Decorator that will be applied to all API endpoints on base class.
 
-        Adds support for method queueing and page range queries.
+        Adds support for method queueing, page range queries, market chart range queries split
+        into windows by granularity and columnar (numpy) results.
         """
-        qid = kwargs.get("qid")
+        if kwargs.get("stream"):
+            return self._stream_call(fn, *args, **kwargs)
+        # kwargs is a new dict for each call, so options are popped from it rather than copied out
+        kwargs.pop("stream", None)
+        qid = kwargs.pop("qid", None)
+        granularity = kwargs.pop("granularity", None)
+        raw = kwargs.pop("raw", self.raw)
+        # the client wide columnar mode only applies to endpoints that support it
+        columnar_method = fn.__name__ in COLUMNAR_METHODS
+        default_columnar = self.columnar if columnar_method and not raw else None
+        columnar = kwargs.pop("columnar", default_columnar)
+        if raw:
+            if granularity or columnar:
+                raise ValueError(
+                    "raw results can't be used with granularity or columnar"
+                )
+            kwargs["_preload_content"] = False
+        if columnar:
+            validate_columnar(fn.__name__, columnar)
         if qid:
+            if self._executing:
+                raise RuntimeError(error_msgs["queued_while_executing"])
             qid = str(qid)
-            kwargs = without_keys(kwargs, "qid")
-            if page_range_query:
-                self._queue_page_range_query(qid, fn, *args, **kwargs)
+            if granularity:
+                self._queue_range_query(qid, fn, granularity, *args, **kwargs)
+            elif page_range_query:
+                self._queue_page_range_query(qid, fn, args, kwargs)
             else:
-                self._queue_single(qid, fn, True, *args, **kwargs)
+                self._queue_single(qid, QueuedCall(fn, args, kwargs))
+            if columnar:
+                self._columnar_qids[qid] = (fn, columnar)
+            return self._queued_result
+        if granularity:
+            res = self._execute_range_query(fn, granularity, *args, **kwargs)
         else:
-            return fn(*args, **kwargs)
+            res = fn(*args, **kwargs)
+        if columnar:
+            return self._columnar_result(fn, columnar, res)
+        return res
 
-    def execute_queued(self):
+    def iter_queued(self, ordered=True):
+        """Generator version of execute_queued. Yields (qid, page, data) as each queued call completes.
+
+        page is the page number for calls of a page range query, otherwise None. If ordered, the
+        pages of each page range query are yielded in page order. Otherwise results are yielded in
+        completion order, which has the most throughput when max_workers > 1. Results are not
+        retained, so results can be processed (e.g. written to storage) with constant memory.
+        The queue is cleared once the generator is exhausted or closed, so queueing calls while
+        iterating raises a RuntimeError.
+        """
+        self._executing = True
+        try:
+            yield from self._iter_queued(ordered)
+        finally:
+            self._reset_state()
+
+    def execute_queued(self, sink=None):
+        """Executes all queued calls, returning a dictionary of results keyed by qid.
+
+        If sink (see utils.sinks) is given, each result is written to it as a (qid, page, data) row
+        as soon as it completes and None is returned, so memory use doesn't grow with the results.
+        """
+        self._executing = True
         try:
-            results = self._execute_queued()
+            results = self._execute_queued(sink)
         except BaseException:
             raise
         finally:
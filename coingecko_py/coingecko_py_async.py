@@ -0,0 +1,388 @@
+import asyncio
+import logging
+from contextvars import ContextVar
+
+import requests
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.structures import CaseInsensitiveDict
+
+from coingecko_py.coingecko_py import (
+    CoingeckoApi,
+    CoingeckoApiClient,
+    ResultsCache,
+    ReorderBuffer,
+    RATE_LIMIT_STATUS_CODE,
+    STREAM_CHUNK_SIZE,
+    error_msgs,
+)
+from coingecko_py.utils.utils import sort_querystring
+from coingecko_py.utils.market_chart import stitch_market_chart
+from coingecko_py.utils.json_decode import get_json_loads
+from coingecko_py.utils.json_stream import JsonArrayParser
+from coingecko_py.utils.columnar import to_columnar
+from coingecko_py.utils.transport import DEFAULT_TIMEOUT
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueuedCallResult:
+    """Returned by calls queued with qid on AsyncCoingeckoApi.
+
+    Awaiting it is a no-op that returns None, so queued calls can be awaited like every other
+    api method or left un-awaited.
+    """
+
+    def __await__(self):
+        return iter(())
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class AsyncCoingeckoApiClient(CoingeckoApiClient):
+    """Api client where call_endpoint returns a coroutine, so every generated endpoint method
+    becomes awaitable. Requests are sent on an aiohttp session with a bounded connection pool.
+    """
+
+    def __init__(
+        self,
+        url_base=None,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        rate_limiter=None,
+        cache=None,
+        coalesce=True,
+        json_loads=None,
+        transport=None,
+        keep_alive=True,
+        timeout=DEFAULT_TIMEOUT,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncCoingeckoApi requires aiohttp. Install it with: pip install coingecko_py[async]"
+            )
+        if transport is not None:
+            raise ValueError(
+                "AsyncCoingeckoApi sends requests with aiohttp, transport is unsupported"
+            )
+        # skip the transport setup of CoingeckoApiClient
+        self.request_timeout = timeout
+        self.keep_alive = keep_alive
+        self.scheme = "https"
+        self.url_base = url_base
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        # references to background cache refreshes, so they aren't garbage collected while running
+        self._refresh_tasks = set()
+        # in flight requests by url, shared by concurrent calls for the same url
+        self.coalesce = coalesce
+        self._in_flight = dict()
+        self.json_loads = get_json_loads(json_loads)
+        self.pool_maxsize = max(pool_maxsize, DEFAULT_POOLSIZE)
+        self.session = None
+        self._include_response = ContextVar("include_response", default=False)
+        self._stream_parser = ContextVar("stream_parser", default=None)
+
+    def _get_session(self):
+        # the session is bound to the running event loop, so it's created on first use
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize, force_close=not self.keep_alive
+            )
+            timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self.session
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def call_endpoint(self, resource_path, path_args, query_args, raw=False):
+        url = self.build_url(resource_path, path_args, query_args)
+        # read here rather than in the coroutine, which may run in a different context
+        stream_parser = self._stream_parser.get()
+        if stream_parser is not None:
+            return self.iter_stream(url, stream_parser())
+        return self._request(resource_path, url, self._include_response.get(), raw)
+
+    async def call_with_http_info(self, fn, *args, **kwargs):
+        with self.request_with_response():
+            # include_response is read when the coroutine is created
+            coro = fn(*args, **kwargs)
+        data, response = await coro
+        return data, response.status_code, response.headers
+
+    def revalidate(self, resource_path, url) -> None:
+        """Refreshes the stale cache entry for url in a task on the running event loop"""
+        task = asyncio.ensure_future(self.refresh_cached_response(resource_path, url))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def refresh_cached_response(self, resource_path, url) -> None:
+        logger.debug(f"refreshing cache entry: {url}")
+        try:
+            response = await self.send_request(url)
+            self.handle_response(response, False)
+            self.put_cached_response(resource_path, url, response)
+        except Exception as e:
+            logger.warning(f"Failed to refresh cache entry: {url} {e}")
+        finally:
+            self.cache.refresh_done(sort_querystring(url))
+
+    async def _request(self, resource_path, url, include_response, raw=False):
+        logger.debug(f"{self.scheme} request: {url}")
+        if self.cache is not None:
+            response = self.get_cached_response(resource_path, url)
+            if response is not None:
+                return self.handle_response(response, include_response, raw)
+        if self.coalesce:
+            response = await self._send_request_coalesced(url)
+        else:
+            response = await self.send_request(url)
+        result = self.handle_response(response, include_response, raw)
+        if self.cache is not None and not raw:
+            self.put_cached_response(resource_path, url, response)
+        return result
+
+    async def _send_request_coalesced(self, url) -> requests.Response:
+        task = self._in_flight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self.send_request(url))
+            self._in_flight[url] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(url, None))
+        # shielded so a cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _wait_rate_limit(self) -> None:
+        if self.rate_limiter is not None:
+            secs = self.rate_limiter.reserve()
+            if secs > 0:
+                await asyncio.sleep(secs)
+
+    async def send_request(self, url) -> requests.Response:
+        await self._wait_rate_limit()
+        session = self._get_session()
+        try:
+            async with session.get(url) as resp:
+                content = await resp.read()
+        except aiohttp.ClientConnectionError as e:
+            raise requests.exceptions.ConnectionError(e)
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(e)
+        return self._build_response(resp, content)
+
+    async def iter_stream(self, url, parser: JsonArrayParser):
+        """Async version of CoingeckoApiClient.iter_stream. The request is sent on first iteration."""
+        await self._wait_rate_limit()
+        session = self._get_session()
+        try:
+            async with session.get(url) as resp:
+                if resp.status >= 400:
+                    self.raise_for_status(self._build_response(resp, await resp.read()))
+                response = self._build_response(resp, None)
+                try:
+                    async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+                        for element in parser.feed(chunk):
+                            yield element
+                    for element in parser.close():
+                        yield element
+                except UnicodeDecodeError:
+                    raise requests.exceptions.ContentDecodingError(
+                        0, error_msgs["failed_decode_bytes"], response=response
+                    )
+                except ValueError:
+                    raise requests.exceptions.JSONDecodeError(
+                        0, error_msgs["failed_decode_json"], response=response
+                    )
+        except aiohttp.ClientConnectionError as e:
+            raise requests.exceptions.ConnectionError(e)
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(e)
+
+    def _build_response(self, resp, content) -> requests.Response:
+        # build a requests.Response so status / decode failures surface identically to the sync client
+        response = requests.Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.url = str(resp.url)
+        response._content = content
+        return response
+
+
+class AsyncCoingeckoApi(CoingeckoApi):
+    """asyncio variant of CoingeckoApi.
+
+    Every api method returns a coroutine and execute_queued is a coroutine. Queueing with qid and
+    bounded / unbounded page range queries behave as in CoingeckoApi. A queued call returns an
+    awaitable that resolves to None, so it may be awaited or not. Up to max_workers queued calls
+    are in flight at once.
+
+        async with AsyncCoingeckoApi(max_workers=8) as cg:
+            coins = await cg.coins_list_get()
+            cg.coins_id_tickers_get("bitcoin", qid="tickers", page_start=1)
+            results = await cg.execute_queued()
+    """
+
+    api_client_class = AsyncCoingeckoApiClient
+    _queued_result = QueuedCallResult()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        await self.api_client.close()
+
+    async def _execute_single(self, include_response, fn, *args, **kwargs):
+        """Async version of CoingeckoApi._execute_single"""
+        exp = 0
+        res = None
+        backoff = self._backoff()
+        while exp < self.exp_limit + 1:
+            try:
+                if include_response:
+                    with self.api_client.request_with_response():
+                        coro = fn(*args, **kwargs)
+                    res, response = await coro
+                    return res, response
+                else:
+                    res = await fn(*args, **kwargs)
+                    return res
+            except requests.exceptions.ConnectionError:
+                raise
+            except requests.exceptions.RequestException as e:
+                if e.response.status_code == RATE_LIMIT_STATUS_CODE:
+                    exp += 1
+                    if exp < self.exp_limit + 1:
+                        await asyncio.sleep(self._rate_limit_sleep(backoff, e))
+                else:
+                    raise e
+        if exp == self.exp_limit + 1:
+            raise Exception(error_msgs["exp_limit_reached"])
+        return res
+
+    async def _impute_page_range_calls(self):
+        """Async version of CoingeckoApi._impute_page_range_calls"""
+        first_results = list()
+        probes = self._execute_calls(
+            self._iter_first_page_calls(),
+            include_response=True,
+            ordered=False,
+            max_workers=self.probe_workers,
+        )
+        async for qid, page, (res, response) in probes:
+            self._queue_remaining_pages(qid, response)
+            first_results.append((qid, page, res))
+        return first_results
+
+    async def _execute_calls(
+        self, calls, include_response=False, ordered=True, max_workers=None
+    ):
+        """Async version of CoingeckoApi._execute_calls. Up to max_workers calls are in flight at once."""
+        if max_workers is None:
+            max_workers = self.max_workers
+        num_workers = max(max_workers, 1)
+        reorder = ReorderBuffer(ordered)
+        pending = dict()
+        calls = iter(calls)
+        try:
+            exhausted = False
+            while True:
+                while (
+                    not exhausted
+                    and len(pending) < num_workers
+                    and (len(pending) + len(reorder) < 2 * num_workers or not pending)
+                ):
+                    call = next(calls, None)
+                    if call is None:
+                        exhausted = True
+                        break
+                    fn, args, kwargs, consumers = call
+                    task = asyncio.ensure_future(
+                        self._execute_single(include_response, fn, *args, **kwargs)
+                    )
+                    pending[task] = consumers
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    consumers = pending.pop(task)
+                    for item in self._release_result(reorder, consumers, task.result()):
+                        yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _iter_queued(self, ordered=True):
+        first_results = await self._impute_page_range_calls()
+        progress = self._progress_logger(len(first_results))
+        for qid, page, res in first_results:
+            progress.update()
+            yield qid, page, res
+        async for qid, page, res in self._execute_calls(
+            self._pending_calls(), ordered=ordered
+        ):
+            progress.update()
+            complete, res = self._complete_result(qid, res)
+            if complete:
+                yield qid, self._result_page(qid, page), res
+
+    async def _columnar_result(self, fn, columnar, res):
+        """Async version of CoingeckoApi._columnar_result, res is the coroutine of the call"""
+        return to_columnar(fn.__name__, await res, columnar)
+
+    async def _execute_range_query(self, fn, granularity, *args, **kwargs):
+        """Async version of CoingeckoApi._execute_range_query"""
+        start, end, calls = self._range_query_calls(fn, granularity, *args, **kwargs)
+        calls = [
+            (fn, args, kwargs, [(None, n, None, None)])
+            for n, (fn, args, kwargs) in enumerate(calls)
+        ]
+        executed = self._execute_calls(
+            calls, ordered=False, max_workers=self.probe_workers
+        )
+        results = [res async for _, _, res in executed]
+        return stitch_market_chart(results, start, end)
+
+    async def _execute_queued(self, sink=None):
+        if sink is not None:
+            async for qid, page, res in self._iter_queued():
+                sink.write(qid, page, res)
+            sink.flush()
+            return None
+        cache = ResultsCache(self._queued_calls)
+        async for qid, page, res in self._iter_queued():
+            self._store_result(cache, qid, res)
+        return cache.data()
+
+    async def iter_queued(self, ordered=True):
+        """Async generator version of CoingeckoApi.iter_queued
+
+        async for qid, page, data in cg.iter_queued():
+            ...
+        """
+        self._executing = True
+        try:
+            async for item in self._iter_queued(ordered):
+                yield item
+        finally:
+            self._reset_state()
+
+    async def execute_queued(self, sink=None):
+        self._executing = True
+        try:
+            results = await self._execute_queued(sink)
+        finally:
+            self._reset_state()
+        return results
@@ -4,6 +4,11 @@ import tempfile
 import logging
 
 import coingecko_py
+from dotenv import load_dotenv
+
+# .env may override the default paths of utils.constants, so it's loaded before they are read
+load_dotenv()
+
 from coingecko_py.utils.api_meta import api_meta
 from coingecko_py.utils.constants import (
     FORMATTED_SPEC_PATH,
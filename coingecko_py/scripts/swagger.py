@@ -9,7 +9,17 @@ import logging
 import urllib3
 from deepdiff import DeepDiff
 
-from coingecko_py.utils.api_meta import api_meta
+from dotenv import load_dotenv
+
+# .env may override the default paths of utils.constants, so it's loaded before they are read
+load_dotenv()
+
+from coingecko_py.utils.api_meta import (
+    api_meta,
+    build_spec_index,
+    render_spec_index_module,
+    render_endpoints_module,
+)
 from coingecko_py.utils.utils import logger_temp_level
 from coingecko_py.utils.constants import (
     RAW_SPEC_PATH,
@@ -19,6 +29,8 @@ from coingecko_py.utils.constants import (
     SWAGGER_DATA_PATH,
     SWAGGER_API_DOCS_PATH,
     PROCESSED_DOCS_PATH,
+    SPEC_INDEX_MODULE_PATH,
+    ENDPOINTS_MODULE_PATH,
 )
 
 
@@ -127,6 +139,21 @@ def generate_url_to_method_map(spec):
         assert method_name in methods
         url_to_method[url_template] = method_name
     api_meta.write_url_to_method(url_to_method)
+    return url_to_method
+
+
+def generate_spec_index_module(spec, url_to_method):
+    # precompute the endpoint metadata read by api_meta, so loading it at runtime is an import
+    logger.info(f"Generating: {SPEC_INDEX_MODULE_PATH}")
+    index = build_spec_index(spec, url_to_method)
+    api_meta.write_spec_index_module(render_spec_index_module(index))
+    return index
+
+
+def generate_endpoints_module(index):
+    # thin api methods in place of those of the swagger generated api
+    logger.info(f"Generating: {ENDPOINTS_MODULE_PATH}")
+    api_meta.write_endpoints_module(render_endpoints_module(index))
 
 
 def generate_readme():
@@ -223,11 +250,14 @@ def generate_client():
     # generate directory for swagger metadata
     if not os.path.isdir(SWAGGER_DATA_PATH):
         os.mkdir(SWAGGER_DATA_PATH)
-    generate_url_to_method_map(spec)
+    url_to_method = generate_url_to_method_map(spec)
+    index = generate_spec_index_module(spec, url_to_method)
+    generate_endpoints_module(index)
     generate_readme()
     generated_code_cleanup()
     generated_code_fix_imports()
     subprocess.run(f"poetry run black .".split(" "), check=True)
+    api_meta.reload_spec_index()
 
 
 @logger_temp_level(logger, logging.INFO)
@@ -0,0 +1,1145 @@
+"""Api methods of the processed spec, each passing its arguments straight to the api client
+rather than through the generic swagger ApiClient.call_api.
+
+Generated by coingecko_py.scripts.swagger.generate_endpoints_module, do not edit.
+"""
+
+
+class CoingeckoEndpoints:
+    def __init__(self, api_client):
+        self.api_client = api_client
+
+    def ping_get(self, *, _preload_content=True):
+        """GET /ping"""
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/ping", (), query_args, _preload_content is False
+        )
+
+    def ping_get_with_http_info(self, *args, **kwargs):
+        """GET /ping, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.ping_get, self, *args, **kwargs
+        )
+
+    def simple_price_get(
+        self,
+        ids,
+        vs_currencies,
+        *,
+        include_market_cap=None,
+        include_24hr_vol=None,
+        include_24hr_change=None,
+        include_last_updated_at=None,
+        _preload_content=True
+    ):
+        """GET /simple/price
+
+        :param str ids: id of coins, comma-separated if querying more than 1 coin *refers to <b>`coins/list`</b> (required)
+        :param str vs_currencies: vs_currency of coins, comma-separated if querying more than 1 vs_currency *refers to <b>`simple/supported_vs_currencies`</b> (required)
+        :param str include_market_cap: <b>true/false</b> to include market_cap, <b>default: false</b>
+        :param str include_24hr_vol: <b>true/false</b> to include 24hr_vol, <b>default: false</b>
+        :param str include_24hr_change: <b>true/false</b> to include 24hr_change, <b>default: false</b>
+        :param str include_last_updated_at: <b>true/false</b> to include last_updated_at of price, <b>default: false</b>
+        """
+        if ids is None:
+            raise ValueError(
+                "Missing the required parameter `ids` when calling `simple_price_get`"
+            )
+        if vs_currencies is None:
+            raise ValueError(
+                "Missing the required parameter `vs_currencies` when calling `simple_price_get`"
+            )
+        query_args = {"ids": ids, "vs_currencies": vs_currencies}
+        if include_market_cap is not None:
+            query_args["include_market_cap"] = include_market_cap
+        if include_24hr_vol is not None:
+            query_args["include_24hr_vol"] = include_24hr_vol
+        if include_24hr_change is not None:
+            query_args["include_24hr_change"] = include_24hr_change
+        if include_last_updated_at is not None:
+            query_args["include_last_updated_at"] = include_last_updated_at
+        return self.api_client.call_endpoint(
+            "/simple/price", (), query_args, _preload_content is False
+        )
+
+    def simple_price_get_with_http_info(self, *args, **kwargs):
+        """GET /simple/price, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.simple_price_get, self, *args, **kwargs
+        )
+
+    def simple_token_price_id_get(
+        self,
+        id,
+        contract_addresses,
+        vs_currencies,
+        *,
+        include_market_cap=None,
+        include_24hr_vol=None,
+        include_24hr_change=None,
+        include_last_updated_at=None,
+        _preload_content=True
+    ):
+        """GET /simple/token_price/{id}
+
+        :param str id: The id of the platform issuing tokens (See asset_platforms endpoint for list of options) (required)
+        :param str contract_addresses: The contract address of tokens, comma separated (required)
+        :param str vs_currencies: vs_currency of coins, comma-separated if querying more than 1 vs_currency *refers to <b>`simple/supported_vs_currencies`</b> (required)
+        :param str include_market_cap: <b>true/false</b> to include market_cap, <b>default: false</b>
+        :param str include_24hr_vol: <b>true/false</b> to include 24hr_vol, <b>default: false</b>
+        :param str include_24hr_change: <b>true/false</b> to include 24hr_change, <b>default: false</b>
+        :param str include_last_updated_at: <b>true/false</b> to include last_updated_at of price, <b>default: false</b>
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `simple_token_price_id_get`"
+            )
+        if contract_addresses is None:
+            raise ValueError(
+                "Missing the required parameter `contract_addresses` when calling `simple_token_price_id_get`"
+            )
+        if vs_currencies is None:
+            raise ValueError(
+                "Missing the required parameter `vs_currencies` when calling `simple_token_price_id_get`"
+            )
+        query_args = {
+            "contract_addresses": contract_addresses,
+            "vs_currencies": vs_currencies,
+        }
+        if include_market_cap is not None:
+            query_args["include_market_cap"] = include_market_cap
+        if include_24hr_vol is not None:
+            query_args["include_24hr_vol"] = include_24hr_vol
+        if include_24hr_change is not None:
+            query_args["include_24hr_change"] = include_24hr_change
+        if include_last_updated_at is not None:
+            query_args["include_last_updated_at"] = include_last_updated_at
+        return self.api_client.call_endpoint(
+            "/simple/token_price/{id}", (id,), query_args, _preload_content is False
+        )
+
+    def simple_token_price_id_get_with_http_info(self, *args, **kwargs):
+        """GET /simple/token_price/{id}, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.simple_token_price_id_get, self, *args, **kwargs
+        )
+
+    def simple_supported_vs_currencies_get(self, *, _preload_content=True):
+        """GET /simple/supported_vs_currencies"""
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/simple/supported_vs_currencies", (), query_args, _preload_content is False
+        )
+
+    def simple_supported_vs_currencies_get_with_http_info(self, *args, **kwargs):
+        """GET /simple/supported_vs_currencies, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.simple_supported_vs_currencies_get, self, *args, **kwargs
+        )
+
+    def coins_list_get(self, *, include_platform=None, _preload_content=True):
+        """GET /coins/list
+
+        :param bool include_platform: flag to include platform contract addresses (eg. 0x.... for Ethereum based tokens). valid values: true, false
+        """
+        query_args = {}
+        if include_platform is not None:
+            query_args["include_platform"] = include_platform
+        return self.api_client.call_endpoint(
+            "/coins/list", (), query_args, _preload_content is False
+        )
+
+    def coins_list_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/list, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_list_get, self, *args, **kwargs
+        )
+
+    def coins_markets_get(
+        self,
+        vs_currency,
+        *,
+        ids=None,
+        category=None,
+        order=None,
+        per_page=None,
+        page=None,
+        sparkline=None,
+        price_change_percentage=None,
+        _preload_content=True
+    ):
+        """GET /coins/markets
+
+        :param str vs_currency: The target currency of market data (usd, eur, jpy, etc.) (required)
+        :param str ids: The ids of the coin, comma separated crytocurrency symbols (base). refers to `/coins/list`. <b>When left empty, returns numbers the coins observing the params `limit` and `start`</b>
+        :param str category: filter by coin category. Refer to /coin/categories/list
+        :param str order: valid values: <b>market_cap_desc, gecko_desc, gecko_asc, market_cap_asc, market_cap_desc, volume_asc, volume_desc, id_asc, id_desc</b> sort results by field.
+        :param int per_page: valid values: 1..250 Total results per page
+        :param int page: Page through results
+        :param bool sparkline: Include sparkline 7 days data (eg. true, false)
+        :param str price_change_percentage: Include price change percentage in <b>1h, 24h, 7d, 14d, 30d, 200d, 1y</b> (eg. '`1h,24h,7d`' comma-separated, invalid values will be discarded)
+        """
+        if vs_currency is None:
+            raise ValueError(
+                "Missing the required parameter `vs_currency` when calling `coins_markets_get`"
+            )
+        query_args = {"vs_currency": vs_currency}
+        if ids is not None:
+            query_args["ids"] = ids
+        if category is not None:
+            query_args["category"] = category
+        if order is not None:
+            query_args["order"] = order
+        if per_page is not None:
+            query_args["per_page"] = per_page
+        if page is not None:
+            query_args["page"] = page
+        if sparkline is not None:
+            query_args["sparkline"] = sparkline
+        if price_change_percentage is not None:
+            query_args["price_change_percentage"] = price_change_percentage
+        return self.api_client.call_endpoint(
+            "/coins/markets", (), query_args, _preload_content is False
+        )
+
+    def coins_markets_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/markets, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_markets_get, self, *args, **kwargs
+        )
+
+    def coins_id_get(
+        self,
+        id,
+        *,
+        localization=None,
+        tickers=None,
+        market_data=None,
+        community_data=None,
+        developer_data=None,
+        sparkline=None,
+        _preload_content=True
+    ):
+        """GET /coins/{id}
+
+        :param str id: pass the coin id (can be obtained from /coins) eg. bitcoin (required)
+        :param str localization: Include all localized languages in response (true/false) <b>[default: true]</b>
+        :param bool tickers: Include tickers data (true/false) <b>[default: true]</b>
+        :param bool market_data: Include market_data (true/false) <b>[default: true]</b>
+        :param bool community_data: Include community_data data (true/false) <b>[default: true]</b>
+        :param bool developer_data: Include developer_data data (true/false) <b>[default: true]</b>
+        :param bool sparkline: Include sparkline 7 days data (eg. true, false) <b>[default: false]</b>
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `coins_id_get`"
+            )
+        query_args = {}
+        if localization is not None:
+            query_args["localization"] = localization
+        if tickers is not None:
+            query_args["tickers"] = tickers
+        if market_data is not None:
+            query_args["market_data"] = market_data
+        if community_data is not None:
+            query_args["community_data"] = community_data
+        if developer_data is not None:
+            query_args["developer_data"] = developer_data
+        if sparkline is not None:
+            query_args["sparkline"] = sparkline
+        return self.api_client.call_endpoint(
+            "/coins/{id}", (id,), query_args, _preload_content is False
+        )
+
+    def coins_id_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/{id}, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_id_get, self, *args, **kwargs
+        )
+
+    def coins_id_tickers_get(
+        self,
+        id,
+        *,
+        exchange_ids=None,
+        include_exchange_logo=None,
+        page=None,
+        order=None,
+        depth=None,
+        _preload_content=True
+    ):
+        """GET /coins/{id}/tickers
+
+        :param str id: pass the coin id (can be obtained from /coins/list) eg. bitcoin (required)
+        :param str exchange_ids: filter results by exchange_ids (ref: v3/exchanges/list)
+        :param str include_exchange_logo: flag to show exchange_logo
+        :param int page: Page through results
+        :param str order: valid values: <b>trust_score_desc (default), trust_score_asc and volume_desc</b>
+        :param str depth: flag to show 2% orderbook depth. valid values: true, false
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `coins_id_tickers_get`"
+            )
+        query_args = {}
+        if exchange_ids is not None:
+            query_args["exchange_ids"] = exchange_ids
+        if include_exchange_logo is not None:
+            query_args["include_exchange_logo"] = include_exchange_logo
+        if page is not None:
+            query_args["page"] = page
+        if order is not None:
+            query_args["order"] = order
+        if depth is not None:
+            query_args["depth"] = depth
+        return self.api_client.call_endpoint(
+            "/coins/{id}/tickers", (id,), query_args, _preload_content is False
+        )
+
+    def coins_id_tickers_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/{id}/tickers, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_id_tickers_get, self, *args, **kwargs
+        )
+
+    def coins_id_history_get(
+        self, id, _date, *, localization=None, _preload_content=True
+    ):
+        """GET /coins/{id}/history
+
+        :param str id: pass the coin id (can be obtained from /coins) eg. bitcoin (required)
+        :param str _date: The date of data snapshot in dd-mm-yyyy eg. 30-12-2017 (required)
+        :param str localization: Set to false to exclude localized languages in response
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `coins_id_history_get`"
+            )
+        if _date is None:
+            raise ValueError(
+                "Missing the required parameter `_date` when calling `coins_id_history_get`"
+            )
+        query_args = {"date": _date}
+        if localization is not None:
+            query_args["localization"] = localization
+        return self.api_client.call_endpoint(
+            "/coins/{id}/history", (id,), query_args, _preload_content is False
+        )
+
+    def coins_id_history_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/{id}/history, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_id_history_get, self, *args, **kwargs
+        )
+
+    def coins_id_market_chart_get(
+        self, id, vs_currency, days, *, interval=None, _preload_content=True
+    ):
+        """GET /coins/{id}/market_chart
+
+        :param str id: pass the coin id (can be obtained from /coins) eg. bitcoin (required)
+        :param str vs_currency: The target currency of market data (usd, eur, jpy, etc.) (required)
+        :param str days: Data up to number of days ago (eg. 1,14,30,max) (required)
+        :param str interval: Data interval. Possible value: daily
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `coins_id_market_chart_get`"
+            )
+        if vs_currency is None:
+            raise ValueError(
+                "Missing the required parameter `vs_currency` when calling `coins_id_market_chart_get`"
+            )
+        if days is None:
+            raise ValueError(
+                "Missing the required parameter `days` when calling `coins_id_market_chart_get`"
+            )
+        query_args = {"vs_currency": vs_currency, "days": days}
+        if interval is not None:
+            query_args["interval"] = interval
+        return self.api_client.call_endpoint(
+            "/coins/{id}/market_chart", (id,), query_args, _preload_content is False
+        )
+
+    def coins_id_market_chart_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/{id}/market_chart, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_id_market_chart_get, self, *args, **kwargs
+        )
+
+    def coins_id_market_chart_range_get(
+        self, id, vs_currency, _from, to, *, _preload_content=True
+    ):
+        """GET /coins/{id}/market_chart/range
+
+        :param str id: pass the coin id (can be obtained from /coins) eg. bitcoin (required)
+        :param str vs_currency: The target currency of market data (usd, eur, jpy, etc.) (required)
+        :param str _from: From date in UNIX Timestamp (eg. 1392577232) (required)
+        :param str to: To date in UNIX Timestamp (eg. 1422577232) (required)
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `coins_id_market_chart_range_get`"
+            )
+        if vs_currency is None:
+            raise ValueError(
+                "Missing the required parameter `vs_currency` when calling `coins_id_market_chart_range_get`"
+            )
+        if _from is None:
+            raise ValueError(
+                "Missing the required parameter `_from` when calling `coins_id_market_chart_range_get`"
+            )
+        if to is None:
+            raise ValueError(
+                "Missing the required parameter `to` when calling `coins_id_market_chart_range_get`"
+            )
+        query_args = {"vs_currency": vs_currency, "from": _from, "to": to}
+        return self.api_client.call_endpoint(
+            "/coins/{id}/market_chart/range",
+            (id,),
+            query_args,
+            _preload_content is False,
+        )
+
+    def coins_id_market_chart_range_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/{id}/market_chart/range, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_id_market_chart_range_get, self, *args, **kwargs
+        )
+
+    def coins_id_status_updates_get(
+        self, id, *, per_page=None, page=None, _preload_content=True
+    ):
+        """GET /coins/{id}/status_updates
+
+        :param str id: pass the coin id (can be obtained from /coins) eg. bitcoin (required)
+        :param int per_page: Total results per page
+        :param int page: Page through results
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `coins_id_status_updates_get`"
+            )
+        query_args = {}
+        if per_page is not None:
+            query_args["per_page"] = per_page
+        if page is not None:
+            query_args["page"] = page
+        return self.api_client.call_endpoint(
+            "/coins/{id}/status_updates", (id,), query_args, _preload_content is False
+        )
+
+    def coins_id_status_updates_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/{id}/status_updates, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_id_status_updates_get, self, *args, **kwargs
+        )
+
+    def coins_id_contract_contract_address_get(
+        self, id, contract_address, *, _preload_content=True
+    ):
+        """GET /coins/{id}/contract/{contract_address}
+
+        :param str id: Asset platform (See asset_platforms endpoint for list of options) (required)
+        :param str contract_address: Token's contract address (required)
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `coins_id_contract_contract_address_get`"
+            )
+        if contract_address is None:
+            raise ValueError(
+                "Missing the required parameter `contract_address` when calling `coins_id_contract_contract_address_get`"
+            )
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/coins/{id}/contract/{contract_address}",
+            (
+                id,
+                contract_address,
+            ),
+            query_args,
+            _preload_content is False,
+        )
+
+    def coins_id_contract_contract_address_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/{id}/contract/{contract_address}, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_id_contract_contract_address_get,
+            self,
+            *args,
+            **kwargs
+        )
+
+    def coins_id_contract_contract_address_market_chart_get(
+        self, id, contract_address, vs_currency, days, *, _preload_content=True
+    ):
+        """GET /coins/{id}/contract/{contract_address}/market_chart/
+
+        :param str id: The id of the platform issuing tokens (See asset_platforms endpoint for list of options) (required)
+        :param str contract_address: Token's contract address (required)
+        :param str vs_currency: The target currency of market data (usd, eur, jpy, etc.) (required)
+        :param str days: Data up to number of days ago (eg. 1,14,30,max) (required)
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `coins_id_contract_contract_address_market_chart_get`"
+            )
+        if contract_address is None:
+            raise ValueError(
+                "Missing the required parameter `contract_address` when calling `coins_id_contract_contract_address_market_chart_get`"
+            )
+        if vs_currency is None:
+            raise ValueError(
+                "Missing the required parameter `vs_currency` when calling `coins_id_contract_contract_address_market_chart_get`"
+            )
+        if days is None:
+            raise ValueError(
+                "Missing the required parameter `days` when calling `coins_id_contract_contract_address_market_chart_get`"
+            )
+        query_args = {"vs_currency": vs_currency, "days": days}
+        return self.api_client.call_endpoint(
+            "/coins/{id}/contract/{contract_address}/market_chart/",
+            (
+                id,
+                contract_address,
+            ),
+            query_args,
+            _preload_content is False,
+        )
+
+    def coins_id_contract_contract_address_market_chart_get_with_http_info(
+        self, *args, **kwargs
+    ):
+        """GET /coins/{id}/contract/{contract_address}/market_chart/, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_id_contract_contract_address_market_chart_get,
+            self,
+            *args,
+            **kwargs
+        )
+
+    def coins_id_contract_contract_address_market_chart_range_get(
+        self, id, contract_address, vs_currency, _from, to, *, _preload_content=True
+    ):
+        """GET /coins/{id}/contract/{contract_address}/market_chart/range
+
+        :param str id: The id of the platform issuing tokens (See asset_platforms endpoint for list of options) (required)
+        :param str contract_address: Token's contract address (required)
+        :param str vs_currency: The target currency of market data (usd, eur, jpy, etc.) (required)
+        :param str _from: From date in UNIX Timestamp (eg. 1392577232) (required)
+        :param str to: To date in UNIX Timestamp (eg. 1422577232) (required)
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `coins_id_contract_contract_address_market_chart_range_get`"
+            )
+        if contract_address is None:
+            raise ValueError(
+                "Missing the required parameter `contract_address` when calling `coins_id_contract_contract_address_market_chart_range_get`"
+            )
+        if vs_currency is None:
+            raise ValueError(
+                "Missing the required parameter `vs_currency` when calling `coins_id_contract_contract_address_market_chart_range_get`"
+            )
+        if _from is None:
+            raise ValueError(
+                "Missing the required parameter `_from` when calling `coins_id_contract_contract_address_market_chart_range_get`"
+            )
+        if to is None:
+            raise ValueError(
+                "Missing the required parameter `to` when calling `coins_id_contract_contract_address_market_chart_range_get`"
+            )
+        query_args = {"vs_currency": vs_currency, "from": _from, "to": to}
+        return self.api_client.call_endpoint(
+            "/coins/{id}/contract/{contract_address}/market_chart/range",
+            (
+                id,
+                contract_address,
+            ),
+            query_args,
+            _preload_content is False,
+        )
+
+    def coins_id_contract_contract_address_market_chart_range_get_with_http_info(
+        self, *args, **kwargs
+    ):
+        """GET /coins/{id}/contract/{contract_address}/market_chart/range, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_id_contract_contract_address_market_chart_range_get,
+            self,
+            *args,
+            **kwargs
+        )
+
+    def coins_id_ohlc_get(self, id, vs_currency, days, *, _preload_content=True):
+        """GET /coins/{id}/ohlc
+
+        :param str id: pass the coin id (can be obtained from /coins/list) eg. bitcoin (required)
+        :param str vs_currency: The target currency of market data (usd, eur, jpy, etc.) (required)
+        :param int days: Data up to number of days ago (1/7/14/30/90/180/365/max) (required)
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `coins_id_ohlc_get`"
+            )
+        if vs_currency is None:
+            raise ValueError(
+                "Missing the required parameter `vs_currency` when calling `coins_id_ohlc_get`"
+            )
+        if days is None:
+            raise ValueError(
+                "Missing the required parameter `days` when calling `coins_id_ohlc_get`"
+            )
+        query_args = {"vs_currency": vs_currency, "days": days}
+        return self.api_client.call_endpoint(
+            "/coins/{id}/ohlc", (id,), query_args, _preload_content is False
+        )
+
+    def coins_id_ohlc_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/{id}/ohlc, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_id_ohlc_get, self, *args, **kwargs
+        )
+
+    def asset_platforms_get(self, *, _preload_content=True):
+        """GET /asset_platforms"""
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/asset_platforms", (), query_args, _preload_content is False
+        )
+
+    def asset_platforms_get_with_http_info(self, *args, **kwargs):
+        """GET /asset_platforms, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.asset_platforms_get, self, *args, **kwargs
+        )
+
+    def coins_categories_list_get(self, *, _preload_content=True):
+        """GET /coins/categories/list"""
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/coins/categories/list", (), query_args, _preload_content is False
+        )
+
+    def coins_categories_list_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/categories/list, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_categories_list_get, self, *args, **kwargs
+        )
+
+    def coins_categories_get(self, *, order=None, _preload_content=True):
+        """GET /coins/categories
+
+        :param str order: valid values: <b>market_cap_desc (default), market_cap_asc, name_desc, name_asc, market_cap_change_24h_desc and market_cap_change_24h_asc</b>
+        """
+        query_args = {}
+        if order is not None:
+            query_args["order"] = order
+        return self.api_client.call_endpoint(
+            "/coins/categories", (), query_args, _preload_content is False
+        )
+
+    def coins_categories_get_with_http_info(self, *args, **kwargs):
+        """GET /coins/categories, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.coins_categories_get, self, *args, **kwargs
+        )
+
+    def exchanges_get(self, *, per_page=None, page=None, _preload_content=True):
+        """GET /exchanges
+
+        :param int per_page: Valid values: 1...250 Total results per page Default value:: 100
+        :param str page: page through results
+        """
+        query_args = {}
+        if per_page is not None:
+            query_args["per_page"] = per_page
+        if page is not None:
+            query_args["page"] = page
+        return self.api_client.call_endpoint(
+            "/exchanges", (), query_args, _preload_content is False
+        )
+
+    def exchanges_get_with_http_info(self, *args, **kwargs):
+        """GET /exchanges, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.exchanges_get, self, *args, **kwargs
+        )
+
+    def exchanges_list_get(self, *, _preload_content=True):
+        """GET /exchanges/list"""
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/exchanges/list", (), query_args, _preload_content is False
+        )
+
+    def exchanges_list_get_with_http_info(self, *args, **kwargs):
+        """GET /exchanges/list, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.exchanges_list_get, self, *args, **kwargs
+        )
+
+    def exchanges_id_get(self, id, *, _preload_content=True):
+        """GET /exchanges/{id}
+
+        :param str id: pass the exchange id (can be obtained from /exchanges/list) eg. binance (required)
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `exchanges_id_get`"
+            )
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/exchanges/{id}", (id,), query_args, _preload_content is False
+        )
+
+    def exchanges_id_get_with_http_info(self, *args, **kwargs):
+        """GET /exchanges/{id}, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.exchanges_id_get, self, *args, **kwargs
+        )
+
+    def exchanges_id_tickers_get(
+        self,
+        id,
+        *,
+        coin_ids=None,
+        include_exchange_logo=None,
+        page=None,
+        depth=None,
+        order=None,
+        _preload_content=True
+    ):
+        """GET /exchanges/{id}/tickers
+
+        :param str id: pass the exchange id (can be obtained from /exchanges/list) eg. binance (required)
+        :param str coin_ids: filter tickers by coin_ids (ref: v3/coins/list)
+        :param str include_exchange_logo: flag to show exchange_logo
+        :param int page: Page through results
+        :param str depth: flag to show 2% orderbook depth i.e., cost_to_move_up_usd and cost_to_move_down_usd
+        :param str order: valid values: <b>trust_score_desc (default), trust_score_asc and volume_desc</b>
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `exchanges_id_tickers_get`"
+            )
+        query_args = {}
+        if coin_ids is not None:
+            query_args["coin_ids"] = coin_ids
+        if include_exchange_logo is not None:
+            query_args["include_exchange_logo"] = include_exchange_logo
+        if page is not None:
+            query_args["page"] = page
+        if depth is not None:
+            query_args["depth"] = depth
+        if order is not None:
+            query_args["order"] = order
+        return self.api_client.call_endpoint(
+            "/exchanges/{id}/tickers", (id,), query_args, _preload_content is False
+        )
+
+    def exchanges_id_tickers_get_with_http_info(self, *args, **kwargs):
+        """GET /exchanges/{id}/tickers, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.exchanges_id_tickers_get, self, *args, **kwargs
+        )
+
+    def finance_platforms_get(self, *, per_page=None, page=None, _preload_content=True):
+        """GET /finance_platforms
+
+        :param int per_page: Total results per page
+        :param str page: page of results (paginated to 100 by default)
+        """
+        query_args = {}
+        if per_page is not None:
+            query_args["per_page"] = per_page
+        if page is not None:
+            query_args["page"] = page
+        return self.api_client.call_endpoint(
+            "/finance_platforms", (), query_args, _preload_content is False
+        )
+
+    def finance_platforms_get_with_http_info(self, *args, **kwargs):
+        """GET /finance_platforms, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.finance_platforms_get, self, *args, **kwargs
+        )
+
+    def finance_products_get(
+        self,
+        *,
+        per_page=None,
+        page=None,
+        start_at=None,
+        end_at=None,
+        _preload_content=True
+    ):
+        """GET /finance_products
+
+        :param int per_page: Total results per page
+        :param str page: page of results (paginated to 100 by default)
+        :param str start_at: start date of the financial products
+        :param str end_at: end date of the financial products
+        """
+        query_args = {}
+        if per_page is not None:
+            query_args["per_page"] = per_page
+        if page is not None:
+            query_args["page"] = page
+        if start_at is not None:
+            query_args["start_at"] = start_at
+        if end_at is not None:
+            query_args["end_at"] = end_at
+        return self.api_client.call_endpoint(
+            "/finance_products", (), query_args, _preload_content is False
+        )
+
+    def finance_products_get_with_http_info(self, *args, **kwargs):
+        """GET /finance_products, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.finance_products_get, self, *args, **kwargs
+        )
+
+    def indexes_get(self, *, per_page=None, page=None, _preload_content=True):
+        """GET /indexes
+
+        :param int per_page: Total results per page
+        :param int page: Page through results
+        """
+        query_args = {}
+        if per_page is not None:
+            query_args["per_page"] = per_page
+        if page is not None:
+            query_args["page"] = page
+        return self.api_client.call_endpoint(
+            "/indexes", (), query_args, _preload_content is False
+        )
+
+    def indexes_get_with_http_info(self, *args, **kwargs):
+        """GET /indexes, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.indexes_get, self, *args, **kwargs
+        )
+
+    def indexes_market_id_id_get(self, market_id, id, *, _preload_content=True):
+        """GET /indexes/{market_id}/{id}
+
+        :param str market_id: pass the market id (can be obtained from /exchanges/list) (required)
+        :param str id: pass the index id (can be obtained from /indexes/list) (required)
+        """
+        if market_id is None:
+            raise ValueError(
+                "Missing the required parameter `market_id` when calling `indexes_market_id_id_get`"
+            )
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `indexes_market_id_id_get`"
+            )
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/indexes/{market_id}/{id}",
+            (
+                market_id,
+                id,
+            ),
+            query_args,
+            _preload_content is False,
+        )
+
+    def indexes_market_id_id_get_with_http_info(self, *args, **kwargs):
+        """GET /indexes/{market_id}/{id}, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.indexes_market_id_id_get, self, *args, **kwargs
+        )
+
+    def indexes_list_get(self, *, _preload_content=True):
+        """GET /indexes/list"""
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/indexes/list", (), query_args, _preload_content is False
+        )
+
+    def indexes_list_get_with_http_info(self, *args, **kwargs):
+        """GET /indexes/list, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.indexes_list_get, self, *args, **kwargs
+        )
+
+    def derivatives_get(self, *, include_tickers=None, _preload_content=True):
+        """GET /derivatives
+
+        :param str include_tickers: ['all', 'unexpired'] - expired to show unexpired tickers, all to list all tickers, defaults to unexpired
+        """
+        query_args = {}
+        if include_tickers is not None:
+            query_args["include_tickers"] = include_tickers
+        return self.api_client.call_endpoint(
+            "/derivatives", (), query_args, _preload_content is False
+        )
+
+    def derivatives_get_with_http_info(self, *args, **kwargs):
+        """GET /derivatives, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.derivatives_get, self, *args, **kwargs
+        )
+
+    def derivatives_exchanges_get(
+        self, *, order=None, per_page=None, page=None, _preload_content=True
+    ):
+        """GET /derivatives/exchanges
+
+        :param str order: order results using following params name_asc，name_desc，open_interest_btc_asc，open_interest_btc_desc，trade_volume_24h_btc_asc，trade_volume_24h_btc_desc
+        :param int per_page: Total results per page
+        :param int page: Page through results
+        """
+        query_args = {}
+        if order is not None:
+            query_args["order"] = order
+        if per_page is not None:
+            query_args["per_page"] = per_page
+        if page is not None:
+            query_args["page"] = page
+        return self.api_client.call_endpoint(
+            "/derivatives/exchanges", (), query_args, _preload_content is False
+        )
+
+    def derivatives_exchanges_get_with_http_info(self, *args, **kwargs):
+        """GET /derivatives/exchanges, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.derivatives_exchanges_get, self, *args, **kwargs
+        )
+
+    def derivatives_exchanges_id_get(
+        self, id, *, include_tickers=None, _preload_content=True
+    ):
+        """GET /derivatives/exchanges/{id}
+
+        :param str id: pass the exchange id (can be obtained from derivatives/exchanges/list) eg. bitmex (required)
+        :param str include_tickers: ['all', 'unexpired'] - expired to show unexpired tickers, all to list all tickers, leave blank to omit tickers data in response
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `derivatives_exchanges_id_get`"
+            )
+        query_args = {}
+        if include_tickers is not None:
+            query_args["include_tickers"] = include_tickers
+        return self.api_client.call_endpoint(
+            "/derivatives/exchanges/{id}", (id,), query_args, _preload_content is False
+        )
+
+    def derivatives_exchanges_id_get_with_http_info(self, *args, **kwargs):
+        """GET /derivatives/exchanges/{id}, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.derivatives_exchanges_id_get, self, *args, **kwargs
+        )
+
+    def derivatives_exchanges_list_get(self, *, _preload_content=True):
+        """GET /derivatives/exchanges/list"""
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/derivatives/exchanges/list", (), query_args, _preload_content is False
+        )
+
+    def derivatives_exchanges_list_get_with_http_info(self, *args, **kwargs):
+        """GET /derivatives/exchanges/list, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.derivatives_exchanges_list_get, self, *args, **kwargs
+        )
+
+    def exchanges_id_status_updates_get(
+        self, id, *, per_page=None, page=None, _preload_content=True
+    ):
+        """GET /exchanges/{id}/status_updates
+
+        :param str id: pass the exchange id (can be obtained from /exchanges/list) eg. binance (required)
+        :param int per_page: Total results per page
+        :param int page: Page through results
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `exchanges_id_status_updates_get`"
+            )
+        query_args = {}
+        if per_page is not None:
+            query_args["per_page"] = per_page
+        if page is not None:
+            query_args["page"] = page
+        return self.api_client.call_endpoint(
+            "/exchanges/{id}/status_updates",
+            (id,),
+            query_args,
+            _preload_content is False,
+        )
+
+    def exchanges_id_status_updates_get_with_http_info(self, *args, **kwargs):
+        """GET /exchanges/{id}/status_updates, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.exchanges_id_status_updates_get, self, *args, **kwargs
+        )
+
+    def exchanges_id_volume_chart_get(self, id, days, *, _preload_content=True):
+        """GET /exchanges/{id}/volume_chart
+
+        :param str id: pass the exchange id (can be obtained from /exchanges/list) eg. binance (required)
+        :param int days: Data up to number of days ago (eg. 1,14,30) (required)
+        """
+        if id is None:
+            raise ValueError(
+                "Missing the required parameter `id` when calling `exchanges_id_volume_chart_get`"
+            )
+        if days is None:
+            raise ValueError(
+                "Missing the required parameter `days` when calling `exchanges_id_volume_chart_get`"
+            )
+        query_args = {"days": days}
+        return self.api_client.call_endpoint(
+            "/exchanges/{id}/volume_chart", (id,), query_args, _preload_content is False
+        )
+
+    def exchanges_id_volume_chart_get_with_http_info(self, *args, **kwargs):
+        """GET /exchanges/{id}/volume_chart, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.exchanges_id_volume_chart_get, self, *args, **kwargs
+        )
+
+    def status_updates_get(
+        self,
+        *,
+        category=None,
+        project_type=None,
+        per_page=None,
+        page=None,
+        _preload_content=True
+    ):
+        """GET /status_updates
+
+        :param str category: Filtered by category (eg. general, milestone, partnership, exchange_listing, software_release, fund_movement, new_listings, event)
+        :param str project_type: Filtered by Project Type (eg. coin, market). If left empty returns both status from coins and markets.
+        :param int per_page: Total results per page
+        :param int page: Page through results
+        """
+        query_args = {}
+        if category is not None:
+            query_args["category"] = category
+        if project_type is not None:
+            query_args["project_type"] = project_type
+        if per_page is not None:
+            query_args["per_page"] = per_page
+        if page is not None:
+            query_args["page"] = page
+        return self.api_client.call_endpoint(
+            "/status_updates", (), query_args, _preload_content is False
+        )
+
+    def status_updates_get_with_http_info(self, *args, **kwargs):
+        """GET /status_updates, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.status_updates_get, self, *args, **kwargs
+        )
+
+    def exchange_rates_get(self, *, _preload_content=True):
+        """GET /exchange_rates"""
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/exchange_rates", (), query_args, _preload_content is False
+        )
+
+    def exchange_rates_get_with_http_info(self, *args, **kwargs):
+        """GET /exchange_rates, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.exchange_rates_get, self, *args, **kwargs
+        )
+
+    def search_get(self, query, *, _preload_content=True):
+        """GET /search
+
+        :param str query: Search string (required)
+        """
+        if query is None:
+            raise ValueError(
+                "Missing the required parameter `query` when calling `search_get`"
+            )
+        query_args = {"query": query}
+        return self.api_client.call_endpoint(
+            "/search", (), query_args, _preload_content is False
+        )
+
+    def search_get_with_http_info(self, *args, **kwargs):
+        """GET /search, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.search_get, self, *args, **kwargs
+        )
+
+    def search_trending_get(self, *, _preload_content=True):
+        """GET /search/trending"""
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/search/trending", (), query_args, _preload_content is False
+        )
+
+    def search_trending_get_with_http_info(self, *args, **kwargs):
+        """GET /search/trending, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.search_trending_get, self, *args, **kwargs
+        )
+
+    def global_get(self, *, _preload_content=True):
+        """GET /global"""
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/global", (), query_args, _preload_content is False
+        )
+
+    def global_get_with_http_info(self, *args, **kwargs):
+        """GET /global, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.global_get, self, *args, **kwargs
+        )
+
+    def global_decentralized_finance_defi_get(self, *, _preload_content=True):
+        """GET /global/decentralized_finance_defi"""
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/global/decentralized_finance_defi",
+            (),
+            query_args,
+            _preload_content is False,
+        )
+
+    def global_decentralized_finance_defi_get_with_http_info(self, *args, **kwargs):
+        """GET /global/decentralized_finance_defi, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.global_decentralized_finance_defi_get,
+            self,
+            *args,
+            **kwargs
+        )
+
+    def companies_public_treasury_coin_id_get(self, coin_id, *, _preload_content=True):
+        """GET /companies/public_treasury/{coin_id}
+
+        :param str coin_id: bitcoin or ethereum (required)
+        """
+        if coin_id is None:
+            raise ValueError(
+                "Missing the required parameter `coin_id` when calling `companies_public_treasury_coin_id_get`"
+            )
+        query_args = {}
+        return self.api_client.call_endpoint(
+            "/companies/public_treasury/{coin_id}",
+            (coin_id,),
+            query_args,
+            _preload_content is False,
+        )
+
+    def companies_public_treasury_coin_id_get_with_http_info(self, *args, **kwargs):
+        """GET /companies/public_treasury/{coin_id}, returns (data, status code, headers)"""
+        return self.api_client.call_with_http_info(
+            CoingeckoEndpoints.companies_public_treasury_coin_id_get,
+            self,
+            *args,
+            **kwargs
+        )
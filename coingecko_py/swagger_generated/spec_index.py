@@ -0,0 +1,1191 @@
+"""Endpoint metadata of the processed spec, loaded by ApiMeta.get_spec_index.
+
+Generated by coingecko_py.scripts.swagger.generate_spec_index_module, do not edit.
+"""
+
+URL_BASE = "https://api.coingecko.com/api/v3"
+API_VERSION = "3.0.0"
+# url template ---> fields of its EndpointMeta
+ENDPOINTS = {
+    "/ping": {
+        "method_name": "ping_get",
+        "parameters": (),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/simple/price": {
+        "method_name": "simple_price_get",
+        "parameters": (
+            {
+                "name": "ids",
+                "in": "query",
+                "description": "id of coins, comma-separated if querying more than 1 coin\n*refers to <b>`coins/list`</b>",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "vs_currencies",
+                "in": "query",
+                "description": "vs_currency of coins, comma-separated if querying more than 1 vs_currency\n*refers to <b>`simple/supported_vs_currencies`</b>",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "include_market_cap",
+                "in": "query",
+                "description": "<b>true/false</b> to include market_cap, <b>default: false</b>",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "include_24hr_vol",
+                "in": "query",
+                "description": "<b>true/false</b> to include 24hr_vol, <b>default: false</b>",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "include_24hr_change",
+                "in": "query",
+                "description": "<b>true/false</b> to include 24hr_change, <b>default: false</b>",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "include_last_updated_at",
+                "in": "query",
+                "description": "<b>true/false</b> to include last_updated_at of price, <b>default: false</b>",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": ("ids", "vs_currencies"),
+        "optional_query_names": (
+            "include_market_cap",
+            "include_24hr_vol",
+            "include_24hr_change",
+            "include_last_updated_at",
+        ),
+        "paginated": False,
+        "batch_param": "ids",
+        "max_per_page": None,
+    },
+    "/simple/token_price/{id}": {
+        "method_name": "simple_token_price_id_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "The id of the platform issuing tokens (See asset_platforms endpoint for list of options)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "contract_addresses",
+                "in": "query",
+                "description": "The contract address of tokens, comma separated",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "vs_currencies",
+                "in": "query",
+                "description": "vs_currency of coins, comma-separated if querying more than 1 vs_currency\n*refers to <b>`simple/supported_vs_currencies`</b>",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "include_market_cap",
+                "in": "query",
+                "description": "<b>true/false</b> to include market_cap, <b>default: false</b>",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "include_24hr_vol",
+                "in": "query",
+                "description": "<b>true/false</b> to include 24hr_vol, <b>default: false</b>",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "include_24hr_change",
+                "in": "query",
+                "description": "<b>true/false</b> to include 24hr_change, <b>default: false</b>",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "include_last_updated_at",
+                "in": "query",
+                "description": "<b>true/false</b> to include last_updated_at of price, <b>default: false</b>",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": ("contract_addresses", "vs_currencies"),
+        "optional_query_names": (
+            "include_market_cap",
+            "include_24hr_vol",
+            "include_24hr_change",
+            "include_last_updated_at",
+        ),
+        "paginated": False,
+        "batch_param": "contract_addresses",
+        "max_per_page": None,
+    },
+    "/simple/supported_vs_currencies": {
+        "method_name": "simple_supported_vs_currencies_get",
+        "parameters": (),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/list": {
+        "method_name": "coins_list_get",
+        "parameters": (
+            {
+                "name": "include_platform",
+                "in": "query",
+                "description": "flag to include platform contract addresses (eg. 0x.... for Ethereum based tokens). \n valid values: true, false",
+                "required": False,
+                "type": "boolean",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": ("include_platform",),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/markets": {
+        "method_name": "coins_markets_get",
+        "parameters": (
+            {
+                "name": "vs_currency",
+                "in": "query",
+                "description": "The target currency of market data (usd, eur, jpy, etc.)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "ids",
+                "in": "query",
+                "description": "The ids of the coin, comma separated crytocurrency symbols (base). refers to `/coins/list`.\n<b>When left empty, returns numbers the coins observing the params `limit` and `start`</b>",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "category",
+                "in": "query",
+                "description": "filter by coin category. Refer to /coin/categories/list",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "order",
+                "in": "query",
+                "description": "valid values: <b>market_cap_desc, gecko_desc, gecko_asc, market_cap_asc, market_cap_desc, volume_asc, volume_desc, id_asc, id_desc</b>\nsort results by field.",
+                "default": "market_cap_desc",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "per_page",
+                "in": "query",
+                "description": "valid values: 1..250\n Total results per page",
+                "default": 100,
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "page",
+                "in": "query",
+                "description": "Page through results",
+                "default": 1,
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "sparkline",
+                "in": "query",
+                "description": "Include sparkline 7 days data (eg. true, false)",
+                "default": False,
+                "required": False,
+                "type": "boolean",
+            },
+            {
+                "name": "price_change_percentage",
+                "in": "query",
+                "description": "Include price change percentage in <b>1h, 24h, 7d, 14d, 30d, 200d, 1y</b> (eg. '`1h,24h,7d`' comma-separated, invalid values will be discarded)",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": ("vs_currency",),
+        "optional_query_names": (
+            "ids",
+            "category",
+            "order",
+            "per_page",
+            "page",
+            "sparkline",
+            "price_change_percentage",
+        ),
+        "paginated": True,
+        "batch_param": "ids",
+        "max_per_page": 250,
+    },
+    "/coins/{id}": {
+        "method_name": "coins_id_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the coin id (can be obtained from /coins) eg. bitcoin",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "localization",
+                "in": "query",
+                "description": "Include all localized languages in response (true/false) <b>[default: true]</b>",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "tickers",
+                "in": "query",
+                "description": "Include tickers data (true/false) <b>[default: true]</b>",
+                "required": False,
+                "type": "boolean",
+            },
+            {
+                "name": "market_data",
+                "in": "query",
+                "description": "Include market_data (true/false) <b>[default: true]</b>",
+                "required": False,
+                "type": "boolean",
+            },
+            {
+                "name": "community_data",
+                "in": "query",
+                "description": "Include community_data data (true/false) <b>[default: true]</b>",
+                "required": False,
+                "type": "boolean",
+            },
+            {
+                "name": "developer_data",
+                "in": "query",
+                "description": "Include developer_data data (true/false) <b>[default: true]</b>",
+                "required": False,
+                "type": "boolean",
+            },
+            {
+                "name": "sparkline",
+                "in": "query",
+                "description": "Include sparkline 7 days data (eg. true, false) <b>[default: false]</b>",
+                "required": False,
+                "type": "boolean",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": (),
+        "optional_query_names": (
+            "localization",
+            "tickers",
+            "market_data",
+            "community_data",
+            "developer_data",
+            "sparkline",
+        ),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/{id}/tickers": {
+        "method_name": "coins_id_tickers_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the coin id (can be obtained from /coins/list) eg. bitcoin",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "exchange_ids",
+                "in": "query",
+                "description": "filter results by exchange_ids (ref: v3/exchanges/list)",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "include_exchange_logo",
+                "in": "query",
+                "description": "flag to show exchange_logo",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "page",
+                "in": "query",
+                "description": "Page through results",
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "order",
+                "in": "query",
+                "description": "valid values: <b>trust_score_desc (default), trust_score_asc and volume_desc</b>",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "depth",
+                "in": "query",
+                "description": "flag to show 2% orderbook depth. valid values: true, false",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": (),
+        "optional_query_names": (
+            "exchange_ids",
+            "include_exchange_logo",
+            "page",
+            "order",
+            "depth",
+        ),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/{id}/history": {
+        "method_name": "coins_id_history_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the coin id (can be obtained from /coins) eg. bitcoin",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "date",
+                "in": "query",
+                "description": "The date of data snapshot in dd-mm-yyyy eg. 30-12-2017",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "localization",
+                "in": "query",
+                "description": "Set to false to exclude localized languages in response",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": ("date",),
+        "optional_query_names": ("localization",),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/{id}/market_chart": {
+        "method_name": "coins_id_market_chart_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the coin id (can be obtained from /coins) eg. bitcoin",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "vs_currency",
+                "in": "query",
+                "description": "The target currency of market data (usd, eur, jpy, etc.)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "days",
+                "in": "query",
+                "description": "Data up to number of days ago (eg. 1,14,30,max)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "interval",
+                "in": "query",
+                "description": "Data interval. Possible value: daily",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": ("vs_currency", "days"),
+        "optional_query_names": ("interval",),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/{id}/market_chart/range": {
+        "method_name": "coins_id_market_chart_range_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the coin id (can be obtained from /coins) eg. bitcoin",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "vs_currency",
+                "in": "query",
+                "description": "The target currency of market data (usd, eur, jpy, etc.)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "from",
+                "in": "query",
+                "description": "From date in UNIX Timestamp (eg. 1392577232)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "to",
+                "in": "query",
+                "description": "To date in UNIX Timestamp (eg. 1422577232)",
+                "required": True,
+                "type": "string",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": ("vs_currency", "from", "to"),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/{id}/status_updates": {
+        "method_name": "coins_id_status_updates_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the coin id (can be obtained from /coins) eg. bitcoin",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "per_page",
+                "in": "query",
+                "description": "Total results per page",
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "page",
+                "in": "query",
+                "description": "Page through results",
+                "required": False,
+                "type": "integer",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": (),
+        "optional_query_names": ("per_page", "page"),
+        "paginated": True,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/{id}/contract/{contract_address}": {
+        "method_name": "coins_id_contract_contract_address_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "Asset platform (See asset_platforms endpoint for list of options)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "contract_address",
+                "in": "path",
+                "description": "Token's contract address",
+                "required": True,
+                "type": "string",
+            },
+        ),
+        "path_names": ("id", "contract_address"),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/{id}/contract/{contract_address}/market_chart/": {
+        "method_name": "coins_id_contract_contract_address_market_chart_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "The id of the platform issuing tokens (See asset_platforms endpoint for list of options)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "contract_address",
+                "in": "path",
+                "description": "Token's contract address",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "vs_currency",
+                "in": "query",
+                "description": "The target currency of market data (usd, eur, jpy, etc.)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "days",
+                "in": "query",
+                "description": "Data up to number of days ago (eg. 1,14,30,max)",
+                "required": True,
+                "type": "string",
+            },
+        ),
+        "path_names": ("id", "contract_address"),
+        "required_query_names": ("vs_currency", "days"),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/{id}/contract/{contract_address}/market_chart/range": {
+        "method_name": "coins_id_contract_contract_address_market_chart_range_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "The id of the platform issuing tokens (See asset_platforms endpoint for list of options)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "contract_address",
+                "in": "path",
+                "description": "Token's contract address",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "vs_currency",
+                "in": "query",
+                "description": "The target currency of market data (usd, eur, jpy, etc.)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "from",
+                "in": "query",
+                "description": "From date in UNIX Timestamp (eg. 1392577232)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "to",
+                "in": "query",
+                "description": "To date in UNIX Timestamp (eg. 1422577232)",
+                "required": True,
+                "type": "string",
+            },
+        ),
+        "path_names": ("id", "contract_address"),
+        "required_query_names": ("vs_currency", "from", "to"),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/{id}/ohlc": {
+        "method_name": "coins_id_ohlc_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the coin id (can be obtained from /coins/list) eg. bitcoin",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "vs_currency",
+                "in": "query",
+                "description": "The target currency of market data (usd, eur, jpy, etc.)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "days",
+                "in": "query",
+                "description": " Data up to number of days ago (1/7/14/30/90/180/365/max)",
+                "required": True,
+                "type": "integer",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": ("vs_currency", "days"),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/asset_platforms": {
+        "method_name": "asset_platforms_get",
+        "parameters": (),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/categories/list": {
+        "method_name": "coins_categories_list_get",
+        "parameters": (),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/coins/categories": {
+        "method_name": "coins_categories_get",
+        "parameters": (
+            {
+                "name": "order",
+                "in": "query",
+                "description": "valid values: <b>market_cap_desc (default), market_cap_asc, name_desc, name_asc, market_cap_change_24h_desc and market_cap_change_24h_asc</b>",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": ("order",),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/exchanges": {
+        "method_name": "exchanges_get",
+        "parameters": (
+            {
+                "name": "per_page",
+                "in": "query",
+                "description": "Valid values: 1...250\nTotal results per page\nDefault value:: 100",
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "page",
+                "in": "query",
+                "description": "page through results",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": ("per_page", "page"),
+        "paginated": True,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/exchanges/list": {
+        "method_name": "exchanges_list_get",
+        "parameters": (),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/exchanges/{id}": {
+        "method_name": "exchanges_id_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the exchange id (can be obtained from /exchanges/list) eg. binance",
+                "required": True,
+                "type": "string",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/exchanges/{id}/tickers": {
+        "method_name": "exchanges_id_tickers_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the exchange id (can be obtained from /exchanges/list) eg. binance",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "coin_ids",
+                "in": "query",
+                "description": "filter tickers by coin_ids (ref: v3/coins/list)",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "include_exchange_logo",
+                "in": "query",
+                "description": "flag to show exchange_logo",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "page",
+                "in": "query",
+                "description": "Page through results",
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "depth",
+                "in": "query",
+                "description": "flag to show 2% orderbook depth i.e., cost_to_move_up_usd and cost_to_move_down_usd",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "order",
+                "in": "query",
+                "description": "valid values: <b>trust_score_desc (default), trust_score_asc and volume_desc</b>",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": (),
+        "optional_query_names": (
+            "coin_ids",
+            "include_exchange_logo",
+            "page",
+            "depth",
+            "order",
+        ),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/finance_platforms": {
+        "method_name": "finance_platforms_get",
+        "parameters": (
+            {
+                "name": "per_page",
+                "in": "query",
+                "description": "Total results per page",
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "page",
+                "in": "query",
+                "description": "page of results (paginated to 100 by default)",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": ("per_page", "page"),
+        "paginated": True,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/finance_products": {
+        "method_name": "finance_products_get",
+        "parameters": (
+            {
+                "name": "per_page",
+                "in": "query",
+                "description": "Total results per page",
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "page",
+                "in": "query",
+                "description": "page of results (paginated to 100 by default)",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "start_at",
+                "in": "query",
+                "description": "start date of the financial products",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "end_at",
+                "in": "query",
+                "description": "end date of the financial products",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": ("per_page", "page", "start_at", "end_at"),
+        "paginated": True,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/indexes": {
+        "method_name": "indexes_get",
+        "parameters": (
+            {
+                "name": "per_page",
+                "in": "query",
+                "description": "Total results per page",
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "page",
+                "in": "query",
+                "description": "Page through results",
+                "required": False,
+                "type": "integer",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": ("per_page", "page"),
+        "paginated": True,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/indexes/{market_id}/{id}": {
+        "method_name": "indexes_market_id_id_get",
+        "parameters": (
+            {
+                "name": "market_id",
+                "in": "path",
+                "description": "pass the market id (can be obtained from /exchanges/list)",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the index id (can be obtained from /indexes/list)",
+                "required": True,
+                "type": "string",
+            },
+        ),
+        "path_names": ("market_id", "id"),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/indexes/list": {
+        "method_name": "indexes_list_get",
+        "parameters": (),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/derivatives": {
+        "method_name": "derivatives_get",
+        "parameters": (
+            {
+                "name": "include_tickers",
+                "in": "query",
+                "description": "['all', 'unexpired'] - expired to show unexpired tickers, all to list all tickers, defaults to unexpired",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": ("include_tickers",),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/derivatives/exchanges": {
+        "method_name": "derivatives_exchanges_get",
+        "parameters": (
+            {
+                "name": "order",
+                "in": "query",
+                "description": "order results using following params name_asc，name_desc，open_interest_btc_asc，open_interest_btc_desc，trade_volume_24h_btc_asc，trade_volume_24h_btc_desc",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "per_page",
+                "in": "query",
+                "description": "Total results per page",
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "page",
+                "in": "query",
+                "description": "Page through results",
+                "required": False,
+                "type": "integer",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": ("order", "per_page", "page"),
+        "paginated": True,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/derivatives/exchanges/{id}": {
+        "method_name": "derivatives_exchanges_id_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the exchange id (can be obtained from derivatives/exchanges/list) eg. bitmex",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "include_tickers",
+                "in": "query",
+                "description": "['all', 'unexpired'] - expired to show unexpired tickers, all to list all tickers, leave blank to omit tickers data in response",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": (),
+        "optional_query_names": ("include_tickers",),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/derivatives/exchanges/list": {
+        "method_name": "derivatives_exchanges_list_get",
+        "parameters": (),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/exchanges/{id}/status_updates": {
+        "method_name": "exchanges_id_status_updates_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the exchange id (can be obtained from /exchanges/list) eg. binance",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "per_page",
+                "in": "query",
+                "description": "Total results per page",
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "page",
+                "in": "query",
+                "description": "Page through results",
+                "required": False,
+                "type": "integer",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": (),
+        "optional_query_names": ("per_page", "page"),
+        "paginated": True,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/exchanges/{id}/volume_chart": {
+        "method_name": "exchanges_id_volume_chart_get",
+        "parameters": (
+            {
+                "name": "id",
+                "in": "path",
+                "description": "pass the exchange id (can be obtained from /exchanges/list) eg. binance",
+                "required": True,
+                "type": "string",
+            },
+            {
+                "name": "days",
+                "in": "query",
+                "description": " Data up to number of days ago (eg. 1,14,30)",
+                "required": True,
+                "type": "integer",
+            },
+        ),
+        "path_names": ("id",),
+        "required_query_names": ("days",),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/status_updates": {
+        "method_name": "status_updates_get",
+        "parameters": (
+            {
+                "name": "category",
+                "in": "query",
+                "description": "Filtered by category (eg. general, milestone, partnership, exchange_listing, software_release, fund_movement, new_listings, event)",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "project_type",
+                "in": "query",
+                "description": "Filtered by Project Type (eg. coin, market). If left empty returns both status from coins and markets.",
+                "required": False,
+                "type": "string",
+            },
+            {
+                "name": "per_page",
+                "in": "query",
+                "description": "Total results per page",
+                "required": False,
+                "type": "integer",
+            },
+            {
+                "name": "page",
+                "in": "query",
+                "description": "Page through results",
+                "required": False,
+                "type": "integer",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": ("category", "project_type", "per_page", "page"),
+        "paginated": True,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/exchange_rates": {
+        "method_name": "exchange_rates_get",
+        "parameters": (),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/search": {
+        "method_name": "search_get",
+        "parameters": (
+            {
+                "name": "query",
+                "in": "query",
+                "description": "Search string",
+                "required": True,
+                "type": "string",
+            },
+        ),
+        "path_names": (),
+        "required_query_names": ("query",),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/search/trending": {
+        "method_name": "search_trending_get",
+        "parameters": (),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/global": {
+        "method_name": "global_get",
+        "parameters": (),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/global/decentralized_finance_defi": {
+        "method_name": "global_decentralized_finance_defi_get",
+        "parameters": (),
+        "path_names": (),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+    "/companies/public_treasury/{coin_id}": {
+        "method_name": "companies_public_treasury_coin_id_get",
+        "parameters": (
+            {
+                "name": "coin_id",
+                "in": "path",
+                "description": "bitcoin or ethereum",
+                "required": False,
+                "type": "string",
+            },
+        ),
+        "path_names": ("coin_id",),
+        "required_query_names": (),
+        "optional_query_names": (),
+        "paginated": False,
+        "batch_param": None,
+        "max_per_page": None,
+    },
+}
@@ -1,11 +1,13 @@
 import json
 import re
-import pkg_resources
+import keyword
+import importlib
+import threading
 import urllib.parse as urlparse
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 from copy import copy
-
-import toml
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
 
 from coingecko_py.utils.constants import (
     POETRY_PROJECT_FILE_PATH,
@@ -15,6 +17,8 @@ from coingecko_py.utils.constants import (
     SWAGGER_API_CLIENT_PATH,
     SWAGGER_REQUIREMENTS_PATH,
     URL_TO_METHOD_PATH,
+    SPEC_INDEX_MODULE_PATH,
+    ENDPOINTS_MODULE_PATH,
     TEST_API_CALLS_PATH,
     TEST_API_RESPONSES_PATH,
     SWAGGER_API_DOCS_PATH,
@@ -22,7 +26,281 @@ from coingecko_py.utils.constants import (
 )
 
 
+class EndpointMeta(NamedTuple):
+    """Immutable view of a single endpoint from the processed spec"""
+
+    url_template: str
+    method_name: str
+    parameters: Tuple[Mapping, ...]
+    path_names: Tuple[str, ...]
+    required_query_names: Tuple[str, ...]
+    optional_query_names: Tuple[str, ...]
+    paginated: bool
+    # first query parameter documented as a comma separated list (e.g. ids), calls can be merged on it
+    batch_param: Optional[str]
+    # upper bound of per_page from its description (e.g. "valid values: 1..250")
+    max_per_page: Optional[int]
+
+
+_is_comma_separated = re.compile(r"comma[- ]?separated", re.IGNORECASE).search
+_valid_range = re.compile(r"valid values: *\d+ *\.\. *(\d+)").search
+_is_unreserved = re.compile(r"[A-Za-z0-9_.~-]*\Z").match
+
+
+def _quote_query_value(value):
+    # mirrors the quoting urlencode applies to each key / value, skipping quote_plus
+    # for the common case of values made up of unreserved characters only
+    if isinstance(value, bytes):
+        return quote_plus(value)
+    if not isinstance(value, str):
+        value = str(value)
+    if _is_unreserved(value):
+        return value
+    return quote_plus(value)
+
+
+class UrlBuilder:
+    """Precompiled url builder for a single url template.
+
+    Tokenizing the template and quoting the known query keys happens once, so building
+    a url is a str.format call plus one quote per query value. Produces the same url as
+    ApiMeta.materialize_url_template.
+    """
+
+    __slots__ = ("url_template", "url_base", "path_format", "_quoted_keys")
+
+    def __init__(self, url_template, url_base, query_names=()):
+        self.url_template = url_template
+        self.url_base = url_base
+        # transform /coins/{id}/contract/{contract_address} ---> /coins/{0}/contract/{1}
+        path_format = url_template
+        for i, p in enumerate(re.findall(r"({[^}]*})", url_template)):
+            path_format = path_format.replace(p, "{" + str(i) + "}")
+        self.path_format = path_format
+        self._quoted_keys = {name: quote_plus(name) for name in query_names}
+
+    def __call__(self, path_args, query_args, url_base=None):
+        url = (url_base or self.url_base) + self.path_format.format(*path_args)
+        if query_args:
+            quoted_keys = self._quoted_keys
+            url += "?" + "&".join(
+                [
+                    (quoted_keys.get(k) or _quote_query_value(k))
+                    + "="
+                    + _quote_query_value(v)
+                    for k, v in query_args.items()
+                ]
+            )
+        return url
+
+
+class SpecIndex(NamedTuple):
+    """Immutable index over the processed spec and url_to_method mapping.
+
+    Loaded once from the generated spec_index module and shared by every lookup.
+    """
+
+    url_base: str
+    api_version: str
+    url_to_method: Mapping[str, str]
+    endpoints: Mapping[str, EndpointMeta]
+    paginated_method_names: Tuple[str, ...]
+    url_builders: Mapping[str, UrlBuilder]
+    method_to_url: Mapping[str, str]
+
+
+def build_spec_index(spec: dict, url_to_method: dict) -> SpecIndex:
+    """Derives the index from the processed spec, used by the generator (see
+    render_spec_index_module). At runtime the index is loaded from the generated module.
+    """
+    schemes = spec["schemes"]
+    assert len(schemes) == 1
+    url_parts = [schemes[0], spec["host"], spec["basePath"], "", "", ""]
+    url_base = urlparse.urlunparse(url_parts)
+    endpoints = dict()
+    for url_template, method_name in url_to_method.items():
+        params = spec["paths"][url_template]["get"].get("parameters", [])
+        names = {p["name"] for p in params}
+        query = [p for p in params if p["in"] == "query"]
+        batch_params = [
+            p["name"] for p in query if _is_comma_separated(p.get("description", ""))
+        ]
+        max_per_page = None
+        for p in query:
+            match = _valid_range(p.get("description", ""))
+            if p["name"] == "per_page" and match:
+                max_per_page = int(match.group(1))
+        endpoints[url_template] = dict(
+            method_name=method_name,
+            parameters=params,
+            path_names=tuple(p["name"] for p in params if p["in"] == "path"),
+            required_query_names=tuple(p["name"] for p in query if p["required"]),
+            optional_query_names=tuple(p["name"] for p in query if not p["required"]),
+            paginated="page" in names and "per_page" in names,
+            batch_param=batch_params[0] if batch_params else None,
+            max_per_page=max_per_page,
+        )
+    return make_spec_index(url_base, spec["info"]["version"], endpoints)
+
+
+def make_spec_index(url_base: str, api_version: str, endpoints: dict) -> SpecIndex:
+    """endpoints maps each url template to the fields of its EndpointMeta"""
+    endpoint_metas = dict()
+    url_builders = dict()
+    for url_template, fields in endpoints.items():
+        e = EndpointMeta(
+            url_template=url_template,
+            **{
+                **fields,
+                "parameters": tuple(
+                    MappingProxyType(dict(p)) for p in fields["parameters"]
+                ),
+            },
+        )
+        endpoint_metas[url_template] = e
+        url_builders[url_template] = UrlBuilder(
+            url_template, url_base, e.required_query_names + e.optional_query_names
+        )
+    url_to_method = {k: e.method_name for k, e in endpoint_metas.items()}
+    return SpecIndex(
+        url_base=url_base,
+        api_version=api_version,
+        url_to_method=MappingProxyType(url_to_method),
+        endpoints=MappingProxyType(endpoint_metas),
+        paginated_method_names=tuple(
+            e.method_name for e in endpoint_metas.values() if e.paginated
+        ),
+        url_builders=MappingProxyType(url_builders),
+        method_to_url=MappingProxyType({v: k for k, v in url_to_method.items()}),
+    )
+
+
+def render_spec_index_module(index: SpecIndex) -> str:
+    """Returns the source of the generated spec_index module, holding index as literals"""
+    lines = [
+        '"""Endpoint metadata of the processed spec, loaded by ApiMeta.get_spec_index.',
+        "",
+        "Generated by coingecko_py.scripts.swagger.generate_spec_index_module, do not edit.",
+        '"""',
+        "",
+        f"URL_BASE = {index.url_base!r}",
+        f"API_VERSION = {index.api_version!r}",
+        "# url template ---> fields of its EndpointMeta",
+        "ENDPOINTS = {",
+    ]
+    for url_template, e in index.endpoints.items():
+        fields = e._asdict()
+        del fields["url_template"]
+        fields["parameters"] = tuple(dict(p) for p in e.parameters)
+        lines.append(f"    {url_template!r}: {fields!r},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+# names swagger-codegen prefixes with _ when used as python argument names (e.g. from ---> _from)
+SWAGGER_RESERVED_WORDS = frozenset(
+    keyword.kwlist
+    + ["self", "property", "print", "exec", "float", "int", "str", "date", "datetime"]
+)
+
+
+def python_name(name):
+    """Returns the python argument name of a parameter, as in the swagger generated api"""
+    return f"_{name}" if name in SWAGGER_RESERVED_WORDS else name
+
+
+# spec parameter type ---> python type named in docstrings
+_PYTHON_TYPES = dict(string="str", integer="int", boolean="bool")
+
+
+def _docstring_text(text):
+    return " ".join(text.split()).replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+
+
+def render_endpoints_module(index: SpecIndex) -> str:
+    """Returns the source of the generated endpoints module, holding a thin method per endpoint.
+
+    Each method takes the arguments of the swagger generated method of the same name (path and
+    required query parameters positionally, optional query parameters by keyword), checks the
+    required ones and passes the path and query args straight to api_client.call_endpoint. As in
+    the swagger generated api, a *_with_http_info method per endpoint returns (data, status code,
+    headers) of the response instead.
+    """
+    lines = [
+        '"""Api methods of the processed spec, each passing its arguments straight to the api client',
+        "rather than through the generic swagger ApiClient.call_api.",
+        "",
+        "Generated by coingecko_py.scripts.swagger.generate_endpoints_module, do not edit.",
+        '"""',
+        "",
+        "",
+        "class CoingeckoEndpoints:",
+        "    def __init__(self, api_client):",
+        "        self.api_client = api_client",
+    ]
+    for url_template, e in index.endpoints.items():
+        params = {p["name"]: p for p in e.parameters}
+        positional = e.path_names + e.required_query_names
+        signature = ["self"] + [python_name(n) for n in positional] + ["*"]
+        signature += [f"{python_name(n)}=None" for n in e.optional_query_names]
+        signature.append("_preload_content=True")
+        lines += [
+            "",
+            f"    def {e.method_name}({', '.join(signature)}):",
+            f'        """GET {url_template}',
+            "",
+        ]
+        for name in positional + e.optional_query_names:
+            p = params[name]
+            description = _docstring_text(p.get("description", ""))
+            required = " (required)" if name in positional else ""
+            lines.append(
+                f"        :param {_PYTHON_TYPES.get(p.get('type'), 'str')} {python_name(name)}: {description}{required}"
+            )
+        lines.append('        """')
+        for name in positional:
+            lines += [
+                f"        if {python_name(name)} is None:",
+                "            raise ValueError(",
+                f'                "Missing the required parameter `{python_name(name)}` when calling `{e.method_name}`"',
+                "            )",
+            ]
+        # query args in spec order, so urls are the same as those of the swagger generated api
+        query_names = [p["name"] for p in e.parameters if p["in"] == "query"]
+        leading = list()
+        for name in query_names:
+            if name not in e.required_query_names:
+                break
+            leading.append(name)
+        items = ", ".join(f"{n!r}: {python_name(n)}" for n in leading)
+        lines.append(f"        query_args = {{{items}}}")
+        for name in query_names[len(leading) :]:
+            if name in e.required_query_names:
+                lines.append(f"        query_args[{name!r}] = {python_name(name)}")
+            else:
+                lines += [
+                    f"        if {python_name(name)} is not None:",
+                    f"            query_args[{name!r}] = {python_name(name)}",
+                ]
+        path_args = "".join(f"{python_name(n)}, " for n in e.path_names)
+        lines.append(
+            f"        return self.api_client.call_endpoint({url_template!r}, ({path_args}), query_args, _preload_content is False)"
+        )
+        lines += [
+            "",
+            f"    def {e.method_name}_with_http_info(self, *args, **kwargs):",
+            f'        """GET {url_template}, returns (data, status code, headers)"""',
+            "        return self.api_client.call_with_http_info(",
+            f"            CoingeckoEndpoints.{e.method_name}, self, *args, **kwargs",
+            "        )",
+        ]
+    return "\n".join(lines) + "\n"
+
+
 class ApiMeta:
+    def __init__(self):
+        self._spec_index: Optional[SpecIndex] = None
+        self._spec_index_lock = threading.Lock()
 
     """GENERIC I/O"""
 
@@ -57,7 +335,7 @@ class ApiMeta:
         return self.read(TEST_API_CALLS_PATH)
 
     def get_url_to_method(self):
-        return self.read(URL_TO_METHOD_PATH)
+        return dict(self.get_spec_index().url_to_method)
 
     def get_test_api_responses(self):
         return self.read(TEST_API_RESPONSES_PATH)
@@ -82,52 +360,81 @@ class ApiMeta:
     def write_test_api_responses(self, test_api_responses):
         self.write(TEST_API_RESPONSES_PATH, test_api_responses)
 
+    def write_spec_index_module(self, source):
+        self.write(SPEC_INDEX_MODULE_PATH, source, is_json=False)
+
+    def write_endpoints_module(self, source):
+        self.write(ENDPOINTS_MODULE_PATH, source, is_json=False)
+
+    """ SPEC INDEX """
+
+    def get_spec_index(self) -> SpecIndex:
+        """Returns the in-memory index over the processed spec, loaded once from the generated
+        spec_index module (a single import, no file reads or json parsing).
+        """
+        if self._spec_index is None:
+            with self._spec_index_lock:
+                if self._spec_index is None:
+                    from coingecko_py.swagger_generated import spec_index
+
+                    self._spec_index = make_spec_index(
+                        spec_index.URL_BASE,
+                        spec_index.API_VERSION,
+                        spec_index.ENDPOINTS,
+                    )
+        return self._spec_index
+
+    def reload_spec_index(self) -> SpecIndex:
+        """Reloads the index after the spec_index module is regenerated"""
+        from coingecko_py.swagger_generated import spec_index
+
+        with self._spec_index_lock:
+            importlib.reload(spec_index)
+            self._spec_index = None
+        return self.get_spec_index()
+
+    def get_endpoint(self, url_template) -> EndpointMeta:
+        return self.get_spec_index().endpoints[url_template]
+
+    def get_endpoint_by_method(self, method_name) -> EndpointMeta:
+        index = self.get_spec_index()
+        return index.endpoints[index.method_to_url[method_name]]
+
+    def get_url_builder(self, url_template) -> UrlBuilder:
+        return self.get_spec_index().url_builders[url_template]
+
     """ OTHER """
 
     def get_parameters(self, url_template):
-        spec = self.get_spec_processed()
-        return spec["paths"][url_template]["get"].get("parameters", [])
+        return list(self.get_endpoint(url_template).parameters)
 
     def get_url_base(self):
-        spec = self.get_spec_processed()
-        host = spec["host"]
-        basePath = spec["basePath"]
-        schemes = spec["schemes"]
-        assert len(schemes) == 1
-        scheme = schemes[0]
-        url_parts = [scheme, host, basePath, "", "", ""]
-        url = urlparse.urlunparse(url_parts)
-        return url
+        return self.get_spec_index().url_base
 
     def get_api_method_names(self):
-        return list(self.get_url_to_method().values())
+        return list(self.get_spec_index().url_to_method.values())
 
     def get_paginated_method_names(self):
-        url_to_methods = self.get_url_to_method()
-        paged_method_names = list()
-        for url_template, method_name in url_to_methods.items():
-            params = filter(
-                lambda p: p["name"] in ["page", "per_page"],
-                self.get_parameters(url_template),
-            )
-            if len(list(params)) == 2:
-                paged_method_names.append(method_name)
-        return paged_method_names
+        return list(self.get_spec_index().paginated_method_names)
 
     def get_swagger_requirements(self):
+        # build time only dependencies, imported here as they're slow to import
+        import pkg_resources
+
         with open(SWAGGER_REQUIREMENTS_PATH, "r") as f:
             reqs = list(pkg_resources.parse_requirements(f))
             return reqs
 
     def get_poetry_dependencies(self):
+        import toml
+
         with open(POETRY_PROJECT_FILE_PATH, "r") as f:
             poetry = toml.loads(f.read())
             deps = poetry["tool"]["poetry"]["dependencies"]
             return deps
 
     def get_api_version(self):
-        spec = self.get_spec_processed()
-        return spec["info"]["version"]
+        return self.get_spec_index().api_version
 
     def materialize_url_template(self, url_template, path_args, query_args):
         """Converts url template to url to request from api by adding prefix and encoding
@@ -145,25 +452,8 @@ class ApiMeta:
         output:
             https://api.coingecko.com/api/v3/coins/ethereum/contract/0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984/market_chart/range?vs_currency=eur&from=1622520000&to=1638334800
         """
-        url_base = self.get_url_base()
-        url_base_parts = list(urlparse.urlparse(url_base))
-        # transform /coins/{id}/contract/{contract_address} ---> /coins/{0}/contract/{1}
-        path_tokens = re.findall(r"({[^}]*})", url_template)
-        url = url_template
-        for i, p in enumerate(path_tokens):
-            url = url.replace(p, "{" + str(i) + "}")
-        # construct full url
-        url_parts = list(urlparse.urlparse(url))
-        url_parts[0] = url_base_parts[0]
-        url_parts[1] = url_base_parts[1]
-        # add path_args to path
-        url_parts[2] = url_base_parts[2] + url.format(*path_args)
-        # add query_args as query string parameters
-        query = dict(urlparse.parse_qsl(url_parts[4]))
-        query.update(query_args)
-        url_parts[4] = urlencode(query)
-        url = urlparse.urlunparse(url_parts)
-        return url
+        build_url = self.get_url_builder(url_template)
+        return build_url(path_args, query_args, url_base=self.get_url_base())
 
     def transform_path_query_to_args_kwargs(self, url_template, path_args, query_args):
         """converts set of path_args and query_args to set of args and kwargs
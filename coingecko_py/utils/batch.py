@@ -0,0 +1,134 @@
+import copy
+from urllib.parse import quote_plus
+
+from coingecko_py.utils.api_meta import api_meta, EndpointMeta
+from coingecko_py.utils.utils import without_keys
+
+# conservative limit on the length of a merged request url
+MAX_BATCH_URL_LENGTH = 2000
+
+
+def _split_ids(value):
+    """Splits a comma separated list into unique ids: "btc, eth,btc" ---> ("btc", "eth")"""
+    return tuple(dict.fromkeys(i.strip() for i in value.split(",") if i.strip()))
+
+
+def batch_key(endpoint: EndpointMeta, args, kwargs):
+    """Returns (key, ids) for a call that can be merged with other calls on the batch parameter of
+    its endpoint, otherwise None. Calls with equal keys differ only in their ids.
+    """
+    param = endpoint.batch_param
+    if param is None:
+        return None
+    if kwargs.get("_preload_content") is False:
+        # raw results (see RawResponse) can't be split between the merged calls
+        return None
+    if endpoint.paginated and ("page" in kwargs or "per_page" in kwargs):
+        # merging changes the page size, so calls that page through results aren't merged
+        return None
+    # required parameters can be passed by position or keyword, so calls are keyed on keywords
+    positional = endpoint.path_names + endpoint.required_query_names
+    kwargs = {**dict(zip(positional, args)), **kwargs}
+    value = kwargs.pop(param, None)
+    if not isinstance(value, str) or not _split_ids(value):
+        return None
+    key = (endpoint.method_name, repr(sorted(kwargs.items())))
+    return key, _split_ids(value)
+
+
+def _with_ids(endpoint: EndpointMeta, args, kwargs, ids):
+    """Returns args and kwargs of the call with its batch parameter replaced by ids"""
+    param = endpoint.batch_param
+    value = ",".join(ids)
+    kwargs = dict(kwargs)
+    if (
+        param in kwargs
+        or param not in endpoint.path_names + endpoint.required_query_names
+    ):
+        kwargs[param] = value
+    else:
+        i = (endpoint.path_names + endpoint.required_query_names).index(param)
+        args = tuple(args[:i]) + (value,) + tuple(args[i + 1 :])
+    if endpoint.paginated and endpoint.max_per_page:
+        # without this only the first page (default 100 results) of a merged call is returned
+        kwargs["per_page"] = endpoint.max_per_page
+    return tuple(args), kwargs
+
+
+def _url_length(endpoint: EndpointMeta, args, kwargs):
+    """Estimates the length of the request url of a call, excluding its batch parameter value"""
+    length = len(api_meta.get_url_base()) + len(endpoint.url_template)
+    positional = endpoint.path_names + endpoint.required_query_names
+    params = {**dict(zip(positional, args)), **kwargs}
+    for name, value in without_keys(params, endpoint.batch_param).items():
+        length += len(quote_plus(str(value)))
+        if name not in endpoint.path_names:
+            length += len(name) + 2
+    if endpoint.paginated and endpoint.max_per_page:
+        # per_page added by _with_ids
+        length += len("per_page") + len(str(endpoint.max_per_page)) + 2
+    return length + len(endpoint.batch_param) + 2
+
+
+def merge_batch(endpoint: EndpointMeta, calls, max_url_length=MAX_BATCH_URL_LENGTH):
+    """Merges calls that share a batch_key into as few calls as fit the url length limit (and, for
+    paginated endpoints, a single page of results).
+
+    calls is a list of (fn, args, kwargs, ids, consumer). Returns a list of (fn, args, kwargs,
+    consumers), where each consumer is paired with the ids it requested, or None if its call
+    wasn't merged with any other.
+    """
+    max_ids = endpoint.max_per_page if endpoint.paginated else None
+    batches = list()
+    batch_ids, batch = dict(), list()
+    batch_length = 0
+    for call in calls:
+        fn, args, kwargs, ids, consumer = call
+        if not batch:
+            base_length = _url_length(endpoint, args, kwargs)
+        new_ids = [i for i in ids if i not in batch_ids]
+        # a comma is quoted as %2C
+        new_length = sum(len(quote_plus(i)) + 3 for i in new_ids)
+        too_long = base_length + batch_length + new_length > max_url_length
+        too_many = max_ids is not None and len(batch_ids) + len(new_ids) > max_ids
+        if batch and (too_long or too_many):
+            batches.append((batch_ids, batch))
+            batch_ids, batch = dict(), list()
+            batch_length = 0
+            new_ids = list(dict.fromkeys(ids))
+            new_length = sum(len(quote_plus(i)) + 3 for i in new_ids)
+        batch_ids.update(dict.fromkeys(new_ids))
+        batch_length += new_length
+        batch.append(call)
+    if batch:
+        batches.append((batch_ids, batch))
+
+    merged = list()
+    for ids, batch in batches:
+        fn, args, kwargs, _, consumer = batch[0]
+        if len(batch) == 1:
+            merged.append((fn, args, kwargs, [(consumer, None)]))
+            continue
+        args, kwargs = _with_ids(endpoint, args, kwargs, list(ids))
+        consumers = [(consumer, call_ids) for _, _, _, call_ids, consumer in batch]
+        merged.append((fn, args, kwargs, consumers))
+    return merged
+
+
+def split_batch_result(res, ids):
+    """Returns the part of the result of a merged call that corresponds to ids.
+
+    Results are either keyed by id (e.g. simple/price) or a list of items with an "id" (e.g.
+    coins/markets). Ids are compared case insensitively, as contract addresses are returned
+    in lowercase.
+    """
+    wanted = {i.lower() for i in ids}
+    if isinstance(res, dict):
+        return {k: copy.deepcopy(v) for k, v in res.items() if k.lower() in wanted}
+    if isinstance(res, list):
+        return [
+            copy.deepcopy(item)
+            for item in res
+            if isinstance(item, dict) and str(item.get("id", "")).lower() in wanted
+        ]
+    return copy.deepcopy(res)
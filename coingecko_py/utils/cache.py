@@ -0,0 +1,264 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from coingecko_py.utils.api_meta import api_meta
+
+# response headers stored with cached content. Per-Page and Total are needed for page range queries
+CACHED_HEADERS = ("Content-Type", "Date", "Link", "Per-Page", "Total")
+
+
+def _cached_headers(headers) -> dict:
+    """Returns the CACHED_HEADERS present in headers (matched case insensitively)"""
+    headers = {k.lower(): v for k, v in headers.items()}
+    return {k: headers[k.lower()] for k in CACHED_HEADERS if k.lower() in headers}
+
+
+def _validate_ttls(ttls) -> dict:
+    """Checks the keys of a per endpoint ttl mapping are api method names"""
+    ttls = dict(ttls or dict())
+    unknown = set(ttls) - set(api_meta.get_api_method_names())
+    if unknown:
+        raise ValueError(f"ttls has unknown api method names: {sorted(unknown)}")
+    return ttls
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    content BLOB NOT NULL,
+    headers TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+class SqliteCache:
+    """Persistent HTTP response cache stored in a SQLite database.
+
+    Entries are keyed by normalized url (see utils.sort_querystring) and hold the zlib compressed
+    response content plus the headers in CACHED_HEADERS. An entry is fresh for ttl seconds, which
+    can be overridden per endpoint with ttls, a mapping of api method name (e.g. coins_list_get)
+    to seconds. A ttl of 0 disables caching, None caches forever. When max_bytes is set, the least
+    recently used entries are evicted once the compressed content exceeds it.
+
+    The database uses write ahead logging, so several threads and processes on the same host can
+    share a cache file. Each thread uses its own connection.
+    """
+
+    def __init__(self, path, ttl=300, ttls=None, max_bytes=None, timeout=30):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.ttls = _validate_ttls(ttls)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # autocommit, transactions are opened explicitly where needed
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_ttl(self, endpoint=None):
+        return self.ttls.get(endpoint, self.ttl)
+
+    def get(self, key, endpoint=None, revalidate=None):
+        """Returns (content, headers) of a fresh entry for key, otherwise None.
+        Expired entries are never served, so revalidate is unused.
+        """
+        ttl = self.get_ttl(endpoint)
+        if ttl == 0:
+            return None
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT content, headers, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        content, headers, created = row
+        now = time.time()
+        if ttl is not None and now - created > ttl:
+            return None
+        conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return zlib.decompress(content), json.loads(headers)
+
+    def put(self, key, content: bytes, headers, endpoint=None) -> None:
+        if self.get_ttl(endpoint) == 0:
+            return
+        compressed = zlib.compress(content)
+        headers = _cached_headers(headers)
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, compressed, json.dumps(headers), now, now, len(compressed)),
+            )
+            if self.max_bytes is not None:
+                self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, conn) -> None:
+        """Deletes least recently used entries until the cache is within max_bytes"""
+        (size,) = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        excess = size - self.max_bytes
+        if excess <= 0:
+            return
+        keys = list()
+        for key, entry_size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ):
+            keys.append((key,))
+            excess -= entry_size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+    def size(self) -> int:
+        """Total bytes of compressed content in the cache"""
+        (size,) = (
+            self._conn()
+            .execute("SELECT COALESCE(SUM(size), 0) FROM responses")
+            .fetchone()
+        )
+        return size
+
+    def count(self) -> int:
+        """Number of entries in the cache"""
+        (count,) = self._conn().execute("SELECT COUNT(*) FROM responses").fetchone()
+        return count
+
+    def clear(self) -> None:
+        self._conn().execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class MemoryCache:
+    """In-process HTTP response cache with per endpoint ttls and least recently used eviction.
+
+    Has the same interface as SqliteCache. Entries are fresh for ttl seconds (overridden per api
+    method name with ttls). An expired entry is still served for stale_ttl seconds after it
+    expires, while a single background refresh of it runs (stale-while-revalidate). At most
+    max_entries entries and, if set, max_bytes bytes of content are held.
+
+    The hits, stale_hits, misses and evictions counters can be used to tune the cache.
+    """
+
+    def __init__(
+        self, ttl=60, ttls=None, stale_ttl=0, max_entries=1024, max_bytes=None
+    ):
+        self.ttl = ttl
+        self.ttls = _validate_ttls(ttls)
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def get_ttl(self, endpoint=None):
+        return self.ttls.get(endpoint, self.ttl)
+
+    def get(self, key, endpoint=None, revalidate=None):
+        """Returns (content, headers) of the entry for key, otherwise None.
+
+        If the entry is stale and revalidate is given, revalidate() is called to start a background
+        refresh (unless one is already running) and the stale entry is returned. The refresh should
+        call put, or refresh_done if it fails.
+        """
+        ttl = self.get_ttl(endpoint)
+        if ttl == 0:
+            return None
+        refresh = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            content, headers, created = entry
+            age = time.monotonic() - created
+            if ttl is None or age <= ttl:
+                self.hits += 1
+            elif revalidate is not None and age <= ttl + self.stale_ttl:
+                self.stale_hits += 1
+                refresh = key not in self._refreshing
+                self._refreshing.add(key)
+            else:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+        if refresh:
+            revalidate()
+        return content, dict(headers)
+
+    def put(self, key, content: bytes, headers, endpoint=None) -> None:
+        if self.get_ttl(endpoint) == 0:
+            return
+        headers = _cached_headers(headers)
+        with self._lock:
+            self._refreshing.discard(key)
+            self._pop(key)
+            self._entries[key] = (content, headers, time.monotonic())
+            self._bytes += len(content)
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[0])
+
+    def refresh_done(self, key) -> None:
+        """Marks a background refresh of key as finished without an updated entry"""
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def stats(self) -> dict:
+        return dict(
+            hits=self.hits,
+            stale_hits=self.stale_hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(self._entries),
+            bytes=self._bytes,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
@@ -0,0 +1,57 @@
+from coingecko_py.utils.utils import optional_import
+
+# "arrays" ---> dict of column name to 1d array, "structured" ---> numpy structured array
+COLUMNAR_MODES = ("arrays", "structured")
+
+# api method name ---> names of the columns of each point. Market chart results are a dict of series
+# (prices, market_caps, total_volumes) that are each converted, the others are a single series.
+_SERIES = ("timestamp", "value")
+COLUMNAR_METHODS = {
+    "coins_id_market_chart_get": _SERIES,
+    "coins_id_market_chart_range_get": _SERIES,
+    "coins_id_contract_contract_address_market_chart_get": _SERIES,
+    "coins_id_contract_contract_address_market_chart_range_get": _SERIES,
+    "coins_id_ohlc_get": ("timestamp", "open", "high", "low", "close"),
+    "exchanges_id_volume_chart_get": ("timestamp", "volume"),
+}
+
+
+def validate_columnar(method_name, mode) -> None:
+    if mode not in COLUMNAR_MODES:
+        raise ValueError(f"columnar: {mode} must be one of {list(COLUMNAR_MODES)}")
+    if method_name not in COLUMNAR_METHODS:
+        raise ValueError(f"columnar results are not supported by {method_name}")
+    if optional_import("numpy") is None:
+        raise ImportError(
+            "columnar results require numpy. Install it with: pip install coingecko_py[numpy]"
+        )
+
+
+def to_columns(points, names, mode):
+    """Converts a list of [timestamp, value, ...] points to columns: int64 ms timestamps followed
+    by float64 values. Values may be numeric strings (e.g. volume_chart), nulls become nan.
+    """
+    import numpy as np
+
+    values = np.array(points, dtype=np.float64).reshape(len(points), len(names))
+    # ms timestamps are well within the integers float64 represents exactly
+    timestamps = values[:, 0].astype(np.int64)
+    if mode == "arrays":
+        columns = {names[0]: timestamps}
+        for i, name in enumerate(names[1:], 1):
+            columns[name] = np.ascontiguousarray(values[:, i])
+        return columns
+    dtype = [(names[0], np.int64)] + [(name, np.float64) for name in names[1:]]
+    array = np.empty(len(points), dtype=dtype)
+    array[names[0]] = timestamps
+    for i, name in enumerate(names[1:], 1):
+        array[name] = values[:, i]
+    return array
+
+
+def to_columnar(method_name, res, mode):
+    """Converts the decoded json result of a COLUMNAR_METHODS endpoint to numpy arrays"""
+    names = COLUMNAR_METHODS[method_name]
+    if names is _SERIES:
+        return {key: to_columns(points, names, mode) for key, points in res.items()}
+    return to_columns(res, names, mode)
@@ -1,20 +1,60 @@
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+# Paths of the spec, the generated client and build outputs. Each defaults to its location in the
+# source tree, relative to this package so the working directory doesn't matter, and can be
+# overridden by an environment variable of the same name (the build scripts also load .env).
+PACKAGE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_PATH = os.path.dirname(PACKAGE_PATH)
 
-POETRY_PROJECT_FILE_PATH = os.environ["POETRY_PROJECT_FILE_PATH"]
-RAW_SPEC_PATH = os.environ["RAW_SPEC_PATH"]
-FORMATTED_SPEC_PATH = os.environ["FORMATTED_SPEC_PATH"]
-DIFF_SPEC_PATH = os.environ["DIFF_SPEC_PATH"]
-SWAGGER_CLIENT_PATH = os.environ["SWAGGER_CLIENT_PATH"]
-SWAGGER_CLIENT_NAME = os.environ["SWAGGER_CLIENT_NAME"]
-SWAGGER_API_CLIENT_PATH = os.environ["SWAGGER_API_CLIENT_PATH"]
-SWAGGER_REQUIREMENTS_PATH = os.environ["SWAGGER_REQUIREMENTS_PATH"]
-SWAGGER_DATA_PATH = os.environ["SWAGGER_DATA_PATH"]
-URL_TO_METHOD_PATH = os.environ["URL_TO_METHOD_PATH"]
-TEST_API_CALLS_PATH = os.environ["TEST_API_CALLS_PATH"]
-TEST_API_RESPONSES_PATH = os.environ["TEST_API_RESPONSES_PATH"]
-SWAGGER_API_DOCS_PATH = os.environ["SWAGGER_API_DOCS_PATH"]
-PROCESSED_DOCS_PATH = os.environ["PROCESSED_DOCS_PATH"]
-COVERAGE_PATH = os.environ["COVERAGE_PATH"]
+
+def _env_path(name, *default):
+    return os.environ.get(name, os.path.join(*default))
+
+
+SWAGGER_DATA_PATH = _env_path("SWAGGER_DATA_PATH", PACKAGE_PATH, "swagger_data", "")
+RAW_SPEC_PATH = _env_path("RAW_SPEC_PATH", SWAGGER_DATA_PATH, "swagger.json")
+FORMATTED_SPEC_PATH = _env_path(
+    "FORMATTED_SPEC_PATH", SWAGGER_DATA_PATH, "swagger_processed.json"
+)
+DIFF_SPEC_PATH = _env_path(
+    "DIFF_SPEC_PATH", SWAGGER_DATA_PATH, "swagger_processed_diff.txt"
+)
+URL_TO_METHOD_PATH = _env_path(
+    "URL_TO_METHOD_PATH", SWAGGER_DATA_PATH, "url_to_method.json"
+)
+TEST_API_CALLS_PATH = _env_path(
+    "TEST_API_CALLS_PATH", SWAGGER_DATA_PATH, "test_api_calls.json"
+)
+TEST_API_RESPONSES_PATH = _env_path(
+    "TEST_API_RESPONSES_PATH", SWAGGER_DATA_PATH, "test_api_responses.json"
+)
+
+SWAGGER_CLIENT_NAME = os.environ.get("SWAGGER_CLIENT_NAME", "coingecko")
+SWAGGER_CLIENT_PATH = _env_path(
+    "SWAGGER_CLIENT_PATH", PACKAGE_PATH, "swagger_generated", ""
+)
+SWAGGER_API_CLIENT_PATH = _env_path(
+    "SWAGGER_API_CLIENT_PATH",
+    SWAGGER_CLIENT_PATH,
+    "swagger_client",
+    "api",
+    f"{SWAGGER_CLIENT_NAME}_api.py",
+)
+SPEC_INDEX_MODULE_PATH = _env_path(
+    "SPEC_INDEX_MODULE_PATH", SWAGGER_CLIENT_PATH, "spec_index.py"
+)
+ENDPOINTS_MODULE_PATH = _env_path(
+    "ENDPOINTS_MODULE_PATH", SWAGGER_CLIENT_PATH, "endpoints.py"
+)
+SWAGGER_REQUIREMENTS_PATH = _env_path(
+    "SWAGGER_REQUIREMENTS_PATH", SWAGGER_CLIENT_PATH, "requirements.txt"
+)
+SWAGGER_API_DOCS_PATH = _env_path(
+    "SWAGGER_API_DOCS_PATH", SWAGGER_CLIENT_PATH, "docs", "CoinGeckoApi.md"
+)
+
+POETRY_PROJECT_FILE_PATH = _env_path(
+    "POETRY_PROJECT_FILE_PATH", PROJECT_PATH, "pyproject.toml"
+)
+PROCESSED_DOCS_PATH = _env_path("PROCESSED_DOCS_PATH", PROJECT_PATH, "docs", "API.md")
+COVERAGE_PATH = _env_path("COVERAGE_PATH", PROJECT_PATH, "cov.xml")
@@ -0,0 +1,38 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def stdlib_loads(content: bytes):
+    """The stdlib parser only parses str, so content is decoded first (strictly as utf-8, where
+    json.loads on bytes would also detect utf-16 and utf-32)
+    """
+    return json.loads(content.decode("utf-8", "strict"))
+
+
+def get_json_loads(json_loads=None):
+    """Returns the callable used to decode response content (bytes) to python objects.
+
+    json_loads if given, otherwise orjson.loads when orjson is installed, otherwise stdlib_loads.
+    The callable may raise any ValueError (UnicodeDecodeError and json.JSONDecodeError are both
+    subclasses) on invalid content, see is_utf8.
+    """
+    if json_loads is not None:
+        return json_loads
+    if orjson is not None:
+        return orjson.loads
+    return stdlib_loads
+
+
+def is_utf8(content: bytes) -> bool:
+    """Used to classify a decode failure, as decoders like orjson raise a single error type for
+    invalid utf-8 and invalid json.
+    """
+    try:
+        content.decode("utf-8", "strict")
+    except UnicodeDecodeError:
+        return False
+    return True
@@ -0,0 +1,149 @@
+import re
+import json
+import codecs
+
+# api method name ---> key of the array streamed from endpoints that return an object
+STREAM_KEYS = {
+    "coins_id_tickers_get": "tickers",
+    "exchanges_id_tickers_get": "tickers",
+}
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = " \t\n\r,]}"
+
+
+class JsonArrayParser:
+    """Incremental parser that yields the elements of a json array as its content arrives in chunks.
+
+    The content is either an array, or if key is given an object whose key member is the array to
+    stream (other members are skipped). Each element is parsed with json.JSONDecoder.raw_decode
+    once the buffer holds all of it, and consumed content is dropped, so the buffer holds at most
+    about one element plus a chunk.
+
+        parser = JsonArrayParser()
+        for chunk in chunks:
+            for element in parser.feed(chunk):
+                ...
+        parser.close()
+
+    Invalid utf-8 raises UnicodeDecodeError, invalid json raises json.JSONDecodeError.
+    """
+
+    def __init__(self, key=None):
+        self.key = key
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")("strict")
+        self._buf = ""
+        self._state = "start"
+        self._member = None
+
+    def feed(self, chunk: bytes) -> list:
+        """Returns the elements completed by chunk"""
+        self._buf += self._utf8.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> list:
+        """Returns any remaining elements, raising if the content ended before the array did"""
+        self._buf += self._utf8.decode(b"", final=True)
+        elements = self._parse(final=True)
+        if self._state != "done":
+            raise json.JSONDecodeError("Unexpected end of content", self._buf, 0)
+        return elements
+
+    def _error(self, msg, pos):
+        raise json.JSONDecodeError(msg, self._buf, pos)
+
+    def _decode_value(self, pos, final):
+        """Returns (value, end) of the value at pos, or None if the buffer doesn't hold all of it"""
+        try:
+            value, end = self._decoder.raw_decode(self._buf, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        # a number is only complete once followed by a delimiter, "1" may be the start of "1.5e3"
+        if (
+            not final
+            and not isinstance(value, (dict, list, str))
+            and (end == len(self._buf) or self._buf[end] not in _DELIMITERS)
+        ):
+            return None
+        return value, end
+
+    def _parse(self, final):
+        elements = list()
+        buf = self._buf
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos == len(buf):
+                break
+            c = buf[pos]
+            state = self._state
+            if state == "start":
+                if c == "[" and self.key is None:
+                    self._state = "first_element"
+                elif c == "{" and self.key is not None:
+                    self._state = "first_member"
+                else:
+                    self._error("Expecting '[' or '{'", pos)
+                pos += 1
+            elif state in ("first_element", "element"):
+                if state == "first_element" and c == "]":
+                    self._state = "done" if self.key is None else "member_end"
+                    pos += 1
+                    continue
+                decoded = self._decode_value(pos, final)
+                if decoded is None:
+                    break
+                element, pos = decoded
+                elements.append(element)
+                self._state = "element_end"
+            elif state == "element_end":
+                if c == ",":
+                    self._state = "element"
+                elif c == "]":
+                    self._state = "done" if self.key is None else "member_end"
+                else:
+                    self._error("Expecting ',' or ']'", pos)
+                pos += 1
+            elif state in ("first_member", "member"):
+                if state == "first_member" and c == "}":
+                    self._state = "done"
+                    pos += 1
+                    continue
+                if c != '"':
+                    self._error("Expecting property name", pos)
+                decoded = self._decode_value(pos, final)
+                if decoded is None:
+                    break
+                self._member, pos = decoded
+                self._state = "colon"
+            elif state == "colon":
+                if c != ":":
+                    self._error("Expecting ':'", pos)
+                pos += 1
+                self._state = "array" if self._member == self.key else "skip_value"
+            elif state == "array":
+                if c != "[":
+                    self._error(f"Expecting '[' for {self.key}", pos)
+                pos += 1
+                self._state = "first_element"
+            elif state == "skip_value":
+                decoded = self._decode_value(pos, final)
+                if decoded is None:
+                    break
+                pos = decoded[1]
+                self._state = "member_end"
+            elif state == "member_end":
+                if c == ",":
+                    self._state = "member"
+                elif c == "}":
+                    self._state = "done"
+                else:
+                    self._error("Expecting ',' or '}'", pos)
+                pos += 1
+            else:
+                self._error("Extra data", pos)
+        self._buf = buf[pos:]
+        return elements
@@ -0,0 +1,60 @@
+DAY = 24 * 60 * 60
+
+# The api picks the granularity of market chart data from the length of the requested range:
+# up to 1 day ---> 5 minute, 1 to 90 days ---> hourly, above 90 days ---> daily.
+# (min span (exclusive), max span) of a window that returns data at each granularity.
+GRANULARITY_SPANS = {
+    "5m": (0, DAY),
+    "hourly": (DAY, 90 * DAY),
+    "daily": (90 * DAY, 365 * DAY),
+}
+
+# seconds a short window is extended past the min span of its granularity
+_SPAN_MARGIN = 60 * 60
+
+
+def plan_windows(start, end, granularity):
+    """Splits the range [start, end] (unix seconds) into windows that each return data at granularity.
+
+    Windows span at most the max span of the granularity. Windows shorter than its min span
+    would return finer data, so they are extended backwards (overlapping the previous window,
+    or before start). stitch_market_chart removes the overlap.
+    """
+    if granularity not in GRANULARITY_SPANS:
+        raise ValueError(
+            f"granularity: {granularity} must be one of {list(GRANULARITY_SPANS)}"
+        )
+    start, end = int(start), int(end)
+    if end < start:
+        raise ValueError(f"to: {end} less than from: {start}")
+    min_span, max_span = GRANULARITY_SPANS[granularity]
+    windows = list()
+    window_start = start
+    while True:
+        window_end = min(window_start + max_span, end)
+        windows.append((window_start, window_end))
+        if window_end >= end:
+            break
+        window_start = window_end
+    return [
+        (min(s, e - min_span - _SPAN_MARGIN) if min_span else s, e) for s, e in windows
+    ]
+
+
+def stitch_market_chart(results, start, end):
+    """Merges market chart results of consecutive windows into a single result.
+
+    Each series (prices, market_caps, total_volumes) is sorted by timestamp, points with a
+    duplicate timestamp are dropped and points outside of [start, end] are removed.
+    """
+    start_ms, end_ms = int(start) * 1000, int(end) * 1000
+    stitched = dict()
+    for res in results:
+        for key, points in res.items():
+            if key not in stitched:
+                stitched[key] = dict()
+            series = stitched[key]
+            for point in points:
+                if start_ms <= point[0] <= end_ms:
+                    series.setdefault(point[0], point)
+    return {key: sorted(series.values()) for key, series in stitched.items()}
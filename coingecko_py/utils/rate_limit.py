@@ -0,0 +1,106 @@
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+
+
+class TokenBucket:
+    """Client side rate limiter.
+
+    The bucket holds up to burst tokens and is refilled continuously at calls_per_minute / 60
+    tokens per second. Each request takes a token, waiting for the refill when the bucket is
+    empty. This paces requests so the server side rate limit (and the 429 backoff) isn't hit.
+    """
+
+    def __init__(self, calls_per_minute, burst=1):
+        if calls_per_minute <= 0:
+            raise ValueError(f"calls_per_minute: {calls_per_minute} must be positive")
+        if burst < 1:
+            raise ValueError(f"burst: {burst} must be at least 1")
+        self.calls_per_minute = calls_per_minute
+        self.burst = burst
+        self._rate = calls_per_minute / 60
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    @property
+    def fill_level(self) -> float:
+        """Number of tokens currently in the bucket. Negative when callers are waiting on a refill."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self) -> float:
+        """Takes a token and returns the number of seconds to wait before it may be used.
+
+        Tokens are handed out in the order they are reserved, so concurrent callers are
+        spaced out rather than all waking at the next refill.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> None:
+        """Blocks until a token is available"""
+        secs = self.reserve()
+        if secs > 0:
+            time.sleep(secs)
+
+
+def parse_retry_after(value):
+    """Parses a Retry-After header (delay in seconds or an HTTP date) to seconds from now.
+    Returns None if the header is missing or malformed.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class Backoff:
+    """Sleep durations between retries of a rate limited call.
+
+    Uses the server's Retry-After when given, otherwise decorrelated jitter
+    (https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/) capped at
+    max_sleep, so concurrent workers don't retry in lockstep. next_sleep returns None once
+    sleeping would take the call past deadline seconds.
+    """
+
+    def __init__(self, base=1, max_sleep=60, deadline=None):
+        self.base = base
+        self.max_sleep = max_sleep
+        self.deadline = deadline
+        self._sleep = base
+        self._start = time.monotonic()
+
+    def next_sleep(self, retry_after=None):
+        if retry_after is not None:
+            secs = retry_after
+        else:
+            secs = min(self.max_sleep, random.uniform(self.base, self._sleep * 3))
+            self._sleep = secs
+        if self.deadline is not None:
+            elapsed = time.monotonic() - self._start
+            if elapsed + secs > self.deadline:
+                return None
+        return secs
@@ -0,0 +1,50 @@
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key.
+
+    The first caller for a key runs fn. Callers arriving while it is in flight wait for it and
+    receive the same result (or exception) instead of running fn themselves. Once the call
+    completes the key is forgotten, so later callers run fn again.
+    """
+
+    def __init__(self):
+        self._calls = dict()
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """Number of keys with a call in flight"""
+        with self._lock:
+            return len(self._calls)
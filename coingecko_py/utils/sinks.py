@@ -0,0 +1,146 @@
+import json
+
+from coingecko_py.coingecko_py import RawResponse
+from coingecko_py.utils.json_decode import get_json_loads
+from coingecko_py.utils.utils import optional_import
+
+# checks the content of raw results is json before it's written as is, orjson when installed
+_json_loads = get_json_loads()
+
+
+def _json_default(o):
+    """Serializes numpy arrays (columnar results) as lists"""
+    if hasattr(o, "tolist"):
+        return o.tolist()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _dumps(data) -> str:
+    if isinstance(data, RawResponse):
+        # the content of a raw result is already json, so it's written as is unless it spans lines
+        try:
+            parsed = _json_loads(data.content)
+        except ValueError:
+            raise ValueError(
+                f"Content of raw result {data} isn't json, so it can't be written to a sink"
+            )
+        text = data.content.decode("utf-8")
+        if "\n" not in text:
+            return text
+        data = parsed
+    return json.dumps(data, separators=(",", ":"), default=_json_default)
+
+
+class Sink:
+    """Receives the results of execute_queued as each queued call completes, instead of them being
+    collected in memory. Each result is a row of (qid, page, data), where page is the page number
+    for calls of a page range query and otherwise None.
+
+    execute_queued calls flush once all queued calls completed. Closing the sink is left to the
+    caller, so a sink can be reused over several execute_queued calls.
+    """
+
+    def write(self, qid, page, data) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class NdjsonSink(Sink):
+    """Writes a json object {"qid": ..., "page": ..., "data": ...} per line to path (or a text file
+    object). Lines are buffered and written once buffer_size characters accumulate.
+    """
+
+    def __init__(self, path, buffer_size=2 ** 20, mode="w"):
+        if hasattr(path, "write"):
+            self._file, self._owns_file = path, False
+        else:
+            self._file, self._owns_file = open(path, mode, encoding="utf-8"), True
+        self.buffer_size = buffer_size
+        self._buffer = list()
+        self._buffered = 0
+        self.rows = 0
+
+    def write(self, qid, page, data) -> None:
+        # data is spliced in, so the content of raw results isn't decoded
+        row = _dumps(dict(qid=qid, page=page))
+        line = row[:-1] + ',"data":' + _dumps(data) + "}\n"
+        self._buffer.append(line)
+        self._buffered += len(line)
+        self.rows += 1
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._file.write("".join(self._buffer))
+            self._buffer, self._buffered = list(), 0
+        self._file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+
+class ParquetSink(Sink):
+    """Writes rows to a Parquet file at path, in row groups of row_group_size rows. Rows are
+    buffered until a row group is full, the last (smaller) row group is written on close, so a
+    sink reused over several execute_queued calls doesn't write a small row group for each.
+
+    The schema is qid (string), page (int64, null unless a page range query) and data (string),
+    where data is the json encoded result. Results of different endpoints rarely share a schema,
+    so they are not expanded into columns. Requires pyarrow.
+    """
+
+    def __init__(self, path, row_group_size=10000, compression="snappy"):
+        pa = optional_import("pyarrow")
+        if pa is None:
+            raise ImportError(
+                "ParquetSink requires pyarrow. Install it with: pip install coingecko_py[parquet]"
+            )
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self.path = path
+        self.row_group_size = row_group_size
+        self.schema = pa.schema(
+            [("qid", pa.string()), ("page", pa.int64()), ("data", pa.string())]
+        )
+        self._writer = pq.ParquetWriter(path, self.schema, compression=compression)
+        self._columns = dict(qid=list(), page=list(), data=list())
+        self.rows = 0
+
+    def write(self, qid, page, data) -> None:
+        self._columns["qid"].append(qid)
+        self._columns["page"].append(page)
+        self._columns["data"].append(_dumps(data))
+        self.rows += 1
+        if len(self._columns["qid"]) >= self.row_group_size:
+            self._write_row_group()
+
+    def _write_row_group(self) -> None:
+        table = self._pa.Table.from_pydict(self._columns, schema=self.schema)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self._columns = dict(qid=list(), page=list(), data=list())
+
+    def flush(self) -> None:
+        # a Parquet file is only readable once closed, so rows are held for a full row group
+        pass
+
+    def close(self) -> None:
+        if self._writer is not None:
+            if self._columns["qid"]:
+                self._write_row_group()
+            self._writer.close()
+            self._writer = None
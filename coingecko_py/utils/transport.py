@@ -0,0 +1,268 @@
+import socket
+import weakref
+import threading
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from coingecko_py.utils.utils import optional_import
+
+# default seconds to wait for a connection and for each read of the response
+DEFAULT_TIMEOUT = 120
+
+
+def default_retries() -> Retry:
+    """Retries of connection failures and gateway errors, handled below the api client's own
+    rate limit backoff
+    """
+    return Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+
+
+class Transport:
+    """Sends the GET requests of an api client and returns requests.Response objects, so status
+    and decode handling is the same for every transport.
+
+    pool_maxsize is the number of connections kept open per host, which should be at least the
+    number of threads sending requests (max_workers). With keep_alive=False a connection is closed
+    after each request. timeout is in seconds.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        keep_alive=True,
+        timeout=DEFAULT_TIMEOUT,
+        retries=None,
+    ):
+        self.pool_maxsize = max(pool_maxsize, DEFAULT_POOLSIZE)
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        # a Retry or a number of retries
+        self.retries = default_retries() if retries is None else Retry.from_int(retries)
+        self.headers = dict() if keep_alive else {"Connection": "close"}
+
+    def get(self, url, stream=False) -> requests.Response:
+        """Sends a GET request. If stream, the body is read with response.iter_content."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class RequestsTransport(Transport):
+    """Sends requests on a requests.Session"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        for prefix in ["https://", "http://"]:
+            adapter = HTTPAdapter(
+                max_retries=self.retries, pool_maxsize=self.pool_maxsize
+            )
+            self.session.mount(prefix, adapter)
+
+    def get(self, url, stream=False) -> requests.Response:
+        return self.session.get(url, timeout=self.timeout, stream=stream)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Urllib3Transport(Transport):
+    """Sends requests on a urllib3.PoolManager, skipping the per request overhead of requests
+    (hooks, cookies, redirect and proxy resolution). Only the response object of requests is used.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool = urllib3.PoolManager(
+            maxsize=self.pool_maxsize,
+            retries=self.retries,
+            timeout=urllib3.Timeout(connect=self.timeout, read=self.timeout),
+            headers={"Accept-Encoding": "gzip, deflate", **self.headers},
+        )
+
+    def get(self, url, stream=False) -> requests.Response:
+        # errors are mapped to the requests exceptions requests.adapters.HTTPAdapter raises
+        try:
+            resp = self.pool.request("GET", url, preload_content=not stream)
+        except urllib3.exceptions.MaxRetryError as e:
+            if isinstance(e.reason, urllib3.exceptions.ResponseError):
+                raise requests.exceptions.RetryError(e)
+            if isinstance(e.reason, urllib3.exceptions.ConnectTimeoutError):
+                raise requests.exceptions.ConnectTimeout(e)
+            raise requests.exceptions.ConnectionError(e)
+        except urllib3.exceptions.TimeoutError as e:
+            raise requests.exceptions.Timeout(e)
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.exceptions.ConnectionError(e)
+        response = requests.Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.url = url
+        if stream:
+            # iter_content reads from raw
+            response.raw = resp
+        else:
+            response._content = resp.data
+        return response
+
+    def close(self) -> None:
+        self.pool.clear()
+
+
+class _HttpxRaw:
+    """Adapts a streamed httpx.Response to the raw interface read by requests.Response.iter_content"""
+
+    def __init__(self, transport, response):
+        self._transport = transport
+        self._response = response
+
+    def stream(self, chunk_size, decode_content=True):
+        httpx = self._transport._httpx
+        chunks = self._response.aiter_bytes(chunk_size)
+        while True:
+            try:
+                yield self._transport._run(chunks.__anext__())
+            except StopAsyncIteration:
+                break
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.ConnectionError(e)
+            except httpx.TransportError as e:
+                raise requests.exceptions.ChunkedEncodingError(e)
+
+    def close(self):
+        self._transport._run(self._response.aclose())
+
+
+def _stop_event_loop(loop, thread, client) -> None:
+    """Closes client and stops the event loop thread it runs on (see HttpxTransport)"""
+    if threading.current_thread() is thread:
+        # finalized on the loop thread itself, which can only be told to stop
+        loop.call_soon_threadsafe(loop.stop)
+        return
+    # imported here rather than at module level, as only HttpxTransport uses it
+    import asyncio
+
+    asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+class HttpxTransport(Transport):
+    """Sends requests with httpx over HTTP/2, so concurrent requests (max_workers) are multiplexed
+    as streams of one connection rather than each holding a connection of the pool.
+
+    HTTP/2 is negotiated with the server (TLS ALPN), falling back to HTTP/1.1 when the server
+    doesn't support it. Plain http urls use HTTP/1.1, unless http2_prior_knowledge in which case
+    HTTP/2 is used without negotiation (h2c), e.g. for a local test server.
+
+    Requests are sent by an httpx.AsyncClient on an event loop thread owned by the transport, as the
+    sync httpx HTTP/2 connection can send the streams of concurrent threads out of order.
+    """
+
+    def __init__(self, *args, http2_prior_knowledge=False, **kwargs):
+        httpx = optional_import("httpx")
+        if httpx is None:
+            raise ImportError(
+                "HttpxTransport requires httpx. Install it with: pip install coingecko_py[http2]"
+            )
+        super().__init__(*args, **kwargs)
+        self._httpx = httpx
+        # connection specific headers are invalid in HTTP/2, connections are closed by the pool
+        self.headers = dict()
+        limits = httpx.Limits(
+            max_connections=self.pool_maxsize,
+            max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0,
+        )
+        # httpx only retries connection failures, gateway errors are retried in get
+        transport = httpx.AsyncHTTPTransport(
+            http1=not http2_prior_knowledge,
+            http2=True,
+            limits=limits,
+            retries=self.retries.total or 0,
+            # as urllib3 does, small frames (e.g. WINDOW_UPDATE) aren't held back by nagle
+            socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+        )
+        self.client = httpx.AsyncClient(transport=transport, timeout=self.timeout)
+        # imported here rather than at module level, as only this transport uses it
+        import asyncio
+
+        self._run_coroutine = asyncio.run_coroutine_threadsafe
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        # a transport that's never closed stops its thread once garbage collected (or at exit)
+        self._finalizer = weakref.finalize(
+            self, _stop_event_loop, self._loop, self._thread, self.client
+        )
+
+    def _run(self, coro):
+        """Runs coro on the event loop thread, returning its result"""
+        return self._run_coroutine(coro, self._loop).result()
+
+    def _send(self, url, stream):
+        httpx = self._httpx
+        request = self.client.build_request("GET", url)
+        try:
+            return self._run(self.client.send(request, stream=stream))
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e)
+
+    def get(self, url, stream=False) -> requests.Response:
+        retries = self.retries
+        while True:
+            resp = self._send(url, stream)
+            if not retries.is_retry("GET", resp.status_code):
+                break
+            if stream:
+                self._run(resp.aclose())
+            try:
+                retries = retries.increment("GET", url)
+            except urllib3.exceptions.MaxRetryError as e:
+                raise requests.exceptions.RetryError(e)
+            retries.sleep()
+        response = requests.Response()
+        response.status_code = resp.status_code
+        response.reason = resp.reason_phrase
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.url = url
+        if stream:
+            response.raw = _HttpxRaw(self, resp)
+        else:
+            response._content = resp.content
+        return response
+
+    def close(self) -> None:
+        self._finalizer()
+
+
+TRANSPORTS = dict(
+    requests=RequestsTransport, urllib3=Urllib3Transport, httpx=HttpxTransport
+)
+
+
+def get_transport_class(name=None) -> type:
+    """Returns the Transport class of the named kind (a key of TRANSPORTS, default requests)"""
+    name = name or "requests"
+    if name not in TRANSPORTS:
+        raise ValueError(f"transport: {name} must be one of {list(TRANSPORTS)}")
+    return TRANSPORTS[name]
+
+
+def get_transport(transport=None, **kwargs) -> Transport:
+    """Returns transport if it's a Transport, otherwise a new transport of the named kind
+    (see get_transport_class) constructed with kwargs
+    """
+    if isinstance(transport, Transport):
+        return transport
+    return get_transport_class(transport)(**kwargs)
@@ -1,3 +1,4 @@
+import importlib
 from typing import List
 from collections import OrderedDict
 from contextlib import contextmanager
@@ -5,6 +6,17 @@ import urllib.parse as urlparse
 from urllib.parse import urlencode, urlunparse
 
 
+def optional_import(name):
+    """Returns the module name, or None if it isn't installed. Optional dependencies that are slow
+    to import (numpy, pyarrow, httpx) are imported with this where they are used, rather than at
+    module level, so importing coingecko_py doesn't pay for them.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
 def without_keys(d: dict, *rm_keys):
     """Returns copy of dictionary with each key in rm_keys removed"""
     return {k: v for k, v in d.items() if k not in rm_keys}
@@ -0,0 +1,65 @@
+"""Compares the memory held by a decoded market chart result (lists of [timestamp, value]) with its
+columnar numpy equivalents, along with the time to decode and convert it.
+
+    python -m tests.benchmarks.bench_columnar
+"""
+import gc
+import json
+import time
+import tracemalloc
+
+from coingecko_py.utils.columnar import to_columnar
+
+# a year of 5 minute data
+NUM_POINTS = 365 * 24 * 12
+METHOD = "coins_id_market_chart_range_get"
+
+
+def measure(fn):
+    """Returns (result, bytes allocated and still held by result, seconds)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    res = fn()
+    secs = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return res, held, secs
+
+
+def main():
+    start = 1_600_000_000_000
+    series = [[start + i * 300_000, 10_000 + i / 7] for i in range(NUM_POINTS)]
+    content = json.dumps(
+        dict(prices=series, market_caps=series, total_volumes=series)
+    ).encode("utf-8")
+    del series
+
+    res, lists_bytes, lists_secs = measure(lambda: json.loads(content))
+    print(f"{'output':12} {'MB held':>8} {'bytes/point':>12} {'ms':>8}")
+    print(
+        f"{'lists':12} {lists_bytes / 2**20:8.1f} "
+        f"{lists_bytes / (3 * NUM_POINTS):12.1f} {lists_secs * 1e3:8.1f}"
+    )
+    for mode in ["arrays", "structured"]:
+        _, held, secs = measure(lambda: to_columnar(METHOD, json.loads(content), mode))
+        print(
+            f"{mode:12} {held / 2**20:8.1f} {held / (3 * NUM_POINTS):12.1f} "
+            f"{secs * 1e3:8.1f}   {lists_bytes / held:.1f}x less memory"
+        )
+
+    columns = to_columnar(METHOD, res, "arrays")
+    start = time.perf_counter()
+    mean_list = sum(v for _, v in res["prices"]) / NUM_POINTS
+    list_secs = time.perf_counter() - start
+    start = time.perf_counter()
+    mean_array = columns["prices"]["value"].mean()
+    array_secs = time.perf_counter() - start
+    assert abs(mean_list - mean_array) < 1e-6
+    print(
+        f"mean of prices: lists {list_secs * 1e3:.2f} ms, arrays {array_secs * 1e3:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
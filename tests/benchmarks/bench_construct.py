@@ -0,0 +1,51 @@
+"""Time and file reads of constructing CoingeckoApi clients, compared with wrapping every api method
+on each instance and creating the transport eagerly, as construction used to.
+
+    python -m tests.benchmarks.bench_construct
+"""
+import builtins
+import time
+from functools import partial
+from unittest.mock import patch
+
+from coingecko_py import CoingeckoApi
+from coingecko_py.coingecko_py import ApiEndpoint
+from coingecko_py.utils.api_meta import api_meta
+
+NUM_CLIENTS = 10000
+
+
+class EagerCoingeckoApi(CoingeckoApi):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.api_client.transport
+        paginated_method_names = api_meta.get_paginated_method_names()
+        for name in api_meta.get_api_method_names():
+            endpoint = getattr(type(self), name)
+            assert isinstance(endpoint, ApiEndpoint)
+            v = endpoint.fn.__get__(self)
+            page_range_query = name in paginated_method_names
+            setattr(self, name, partial(self._wrap_api_endpoint, v, page_range_query))
+
+
+def measure(cls):
+    """Returns (seconds per construction, files opened)"""
+    cls()
+    with patch.object(builtins, "open", wraps=builtins.open) as patch_open:
+        start = time.perf_counter()
+        for _ in range(NUM_CLIENTS):
+            cls()
+        secs = (time.perf_counter() - start) / NUM_CLIENTS
+    return secs, patch_open.call_count
+
+
+def main():
+    print(f"{NUM_CLIENTS} clients")
+    print(f"{'construction':14} {'us/client':>10} {'file reads':>11}")
+    for name, cls in [("eager", EagerCoingeckoApi), ("lazy", CoingeckoApi)]:
+        secs, reads = measure(cls)
+        print(f"{name:14} {secs * 1e6:10.1f} {reads:11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Per call python overhead of the generated endpoint methods (swagger_generated.endpoints) compared
+with the swagger generated *_with_http_info methods and ApiClient.call_api, up to the request being
+sent (call_endpoint is a no-op, so no url is built and no request is made).
+
+    python -m tests.benchmarks.bench_endpoints
+"""
+import timeit
+
+from coingecko_py.coingecko_py import CoingeckoApiClient
+from coingecko_py.swagger_generated.endpoints import CoingeckoEndpoints
+from coingecko_py.swagger_generated.swagger_client import (
+    CoingeckoApi as CoingeckoApiSwagger,
+)
+
+NUM_CALLS = 100000
+
+# label ---> (method name, args, kwargs)
+CALLS = {
+    "ping": ("ping_get", (), {}),
+    "coins_markets": (
+        "coins_markets_get",
+        ("usd",),
+        dict(ids="bitcoin,ethereum", order="market_cap_desc", per_page=250, page=1),
+    ),
+    "market_chart_range": (
+        "coins_id_market_chart_range_get",
+        ("bitcoin", "usd", "1392577232", "1422577232"),
+        {},
+    ),
+}
+
+
+class NoopClient(CoingeckoApiClient):
+    def call_endpoint(self, resource_path, path_args, query_args, raw=False):
+        pass
+
+
+def main():
+    api_client = NoopClient()
+    apis = dict(
+        swagger=CoingeckoApiSwagger(api_client), lean=CoingeckoEndpoints(api_client)
+    )
+    print(f"{'call':20} {'swagger us':>11} {'lean us':>8} {'speedup':>8}")
+    for label, (name, args, kwargs) in CALLS.items():
+        us = dict()
+        for api_name, api in apis.items():
+            fn = getattr(api, name)
+            secs = timeit.timeit(lambda: fn(*args, **kwargs), number=NUM_CALLS)
+            us[api_name] = secs / NUM_CALLS * 1e6
+        speedup = us["swagger"] / us["lean"]
+        print(f"{label:20} {us['swagger']:11.2f} {us['lean']:8.2f} {speedup:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
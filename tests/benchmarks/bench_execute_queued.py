@@ -0,0 +1,50 @@
+"""Throughput of execute_queued against a local mock server with simulated round trip
+latency, for increasing values of max_workers.
+
+    python -m tests.benchmarks.bench_execute_queued
+"""
+import time
+
+from coingecko_py import CoingeckoApi
+from tests.mock_server import MockServer
+
+LATENCY = 0.02
+NUM_COINS = 200
+PAGE_RANGE_QUERIES = 10
+WORKERS = [1, 2, 4, 8, 16, 32]
+
+
+def run(url_base, max_workers):
+    cg = CoingeckoApi(url_base=url_base, max_workers=max_workers, log_level=30)
+    for i in range(NUM_COINS):
+        cg.coins_id_market_chart_get(f"coin-{i}", "usd", 365, qid=f"coin-{i}")
+    for i in range(PAGE_RANGE_QUERIES):
+        cg.coins_markets_get("usd", qid=f"markets-{i}", page_start=1, page_end=5)
+    num_calls = NUM_COINS + PAGE_RANGE_QUERIES * 5
+    start = time.perf_counter()
+    results = cg.execute_queued()
+    elapsed = time.perf_counter() - start
+    assert len(results) == NUM_COINS + PAGE_RANGE_QUERIES
+    assert all(len(results[f"markets-{i}"]) == 5 for i in range(PAGE_RANGE_QUERIES))
+    return num_calls, elapsed
+
+
+def main():
+    with MockServer(latency=LATENCY) as server:
+        print(f"simulated latency: {LATENCY * 1000:.0f}ms")
+        print(
+            f"{'max_workers':>11} {'calls':>6} {'seconds':>8} {'calls/s':>8} {'speedup':>8}"
+        )
+        baseline = None
+        for max_workers in WORKERS:
+            num_calls, elapsed = run(server.url_base, max_workers)
+            throughput = num_calls / elapsed
+            baseline = baseline or throughput
+            print(
+                f"{max_workers:11} {num_calls:6} {elapsed:8.2f} {throughput:8.1f} "
+                f"{throughput / baseline:7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Cold import time of coingecko_py and of the api clients, each measured in a fresh interpreter
+(median of REPEAT runs) and checked against a budget. Exits with status 1 if over budget.
+
+    python -m tests.benchmarks.bench_import
+"""
+import os
+import sys
+import statistics
+import subprocess
+
+from coingecko_py.utils import constants
+
+REPEAT = 9
+# statement ---> budget in ms
+STATEMENTS = {
+    # the package imports nothing until a name is accessed
+    "import coingecko_py": 5,
+    "from coingecko_py import CoingeckoApi": 50,
+    "from coingecko_py import AsyncCoingeckoApi": 150,
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement):
+    """Returns the median seconds to run statement in a fresh interpreter"""
+    # run outside the source tree without the .env paths, as an installed package would be
+    env = {k: v for k, v in os.environ.items() if not hasattr(constants, k)}
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    secs = list()
+    for _ in range(REPEAT):
+        out = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement)],
+            env=env,
+            cwd="/",
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        secs.append(float(out.stdout))
+    return statistics.median(secs)
+
+
+def main():
+    over_budget = False
+    print(f"{'statement':45} {'ms':>7} {'budget':>7}")
+    for statement, budget in STATEMENTS.items():
+        ms = measure(statement) * 1e3
+        over_budget |= ms > budget
+        status = "" if ms <= budget else "OVER BUDGET"
+        print(f"{statement:45} {ms:7.1f} {budget:7} {status}")
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
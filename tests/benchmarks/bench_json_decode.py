@@ -0,0 +1,52 @@
+"""Compares decoding the recorded payload of every endpoint (test_api_responses.json) with the
+original str decode + json.loads against the decoders of utils.json_decode. Payloads are repeated
+to a minimum size so small responses aren't dominated by call overhead.
+
+    python -m tests.benchmarks.bench_json_decode
+"""
+import json
+import timeit
+
+from coingecko_py.utils.api_meta import api_meta
+from coingecko_py.utils.json_decode import orjson, stdlib_loads
+
+NUMBER = 200
+MIN_BYTES = 2 ** 16
+
+
+def loads_reference(content: bytes):
+    """handle_response decoding as it was before decoders were pluggable"""
+    return json.loads(content.decode("utf-8", "strict"))
+
+
+def main():
+    decoders = dict(reference=loads_reference, stdlib=stdlib_loads)
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    else:
+        print("orjson is not installed, pip install orjson to include it")
+    totals = dict.fromkeys(decoders, 0.0)
+    print(
+        f"{'endpoint':60} {'KB':>7} " + " ".join(f"{k + ' ms':>12}" for k in decoders)
+    )
+    for url_template, response in api_meta.get_test_api_responses().items():
+        payload = json.dumps(response)
+        repeat = max(1, MIN_BYTES // len(payload))
+        content = ("[" + ",".join([payload] * repeat) + "]").encode("utf-8")
+        row = f"{url_template:60} {len(content) / 2**10:7.1f} "
+        for name, loads in decoders.items():
+            assert loads(content) == loads_reference(content), (name, url_template)
+            secs = timeit.timeit(lambda: loads(content), number=NUMBER) / NUMBER
+            totals[name] += secs
+            row += f"{secs * 1e3:12.3f} "
+        print(row)
+    row = f"{'total':60} {'':7} " + " ".join(
+        f"{secs * 1e3:12.3f}" for secs in totals.values()
+    )
+    print(row)
+    for name, secs in totals.items():
+        print(f"{name}: {totals['reference'] / secs:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compares peak memory and time of decoding a large coins/list style payload at once with
+iterating its elements through JsonArrayParser in chunks, as with stream=True.
+
+    python -m tests.benchmarks.bench_json_stream
+"""
+import gc
+import json
+import time
+import tracemalloc
+
+from coingecko_py.coingecko_py import STREAM_CHUNK_SIZE
+from coingecko_py.utils.json_stream import JsonArrayParser
+
+NUM_ELEMENTS = 100000
+
+
+def measure(fn):
+    """Returns (peak bytes allocated, seconds)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    secs = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, secs
+
+
+def main():
+    elements = [
+        dict(
+            id=f"coin-{i}",
+            symbol=f"c{i}",
+            name=f"Coin {i}",
+            platforms={"ethereum": f"0x{i:040x}"},
+        )
+        for i in range(NUM_ELEMENTS)
+    ]
+    content = json.dumps(elements).encode("utf-8")
+    del elements
+    chunks = [
+        content[i : i + STREAM_CHUNK_SIZE]
+        for i in range(0, len(content), STREAM_CHUNK_SIZE)
+    ]
+
+    def load():
+        count = 0
+        for _ in json.loads(content.decode("utf-8")):
+            count += 1
+        assert count == NUM_ELEMENTS
+
+    def stream():
+        count = 0
+        parser = JsonArrayParser()
+        for chunk in chunks:
+            for _ in parser.feed(chunk):
+                count += 1
+        count += len(parser.close())
+        assert count == NUM_ELEMENTS
+
+    print(f"payload: {len(content) / 2**20:.1f} MB, {NUM_ELEMENTS} elements")
+    print(f"{'mode':8} {'peak MB':>8} {'ms':>8}")
+    for name, fn in [("loads", load), ("stream", stream)]:
+        peak, secs = measure(fn)
+        print(f"{name:8} {peak / 2**20:8.1f} {secs * 1e3:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
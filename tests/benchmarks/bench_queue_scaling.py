@@ -0,0 +1,102 @@
+"""Time and memory of queueing and executing 10k, 100k and 1M calls against a stub transport that
+answers without any I/O, so only the queue bookkeeping of execute_queued is measured. Results are
+written to a sink that counts them, so they aren't retained.
+
+Calls are either distinct single calls (a qid each), the pages of bounded page range queries of
+10 pages each, or the pages of one bounded page range query.
+Time per call stays flat when queueing scales linearly, peak memory per call when the memory held
+per queued call is bounded.
+
+    python -m tests.benchmarks.bench_queue_scaling
+"""
+import gc
+import time
+import tracemalloc
+
+import requests
+
+from coingecko_py import CoingeckoApi
+from coingecko_py.utils.sinks import Sink
+from coingecko_py.utils.transport import Transport
+
+SIZES = [10000, 100000, 1000000]
+
+
+class StubTransport(Transport):
+    """Answers every request with the same response, an empty json object"""
+
+    def __init__(self):
+        super().__init__()
+        self.response = requests.Response()
+        self.response.status_code = 200
+        self.response._content = b"{}"
+
+    def get(self, url, stream=False) -> requests.Response:
+        return self.response
+
+
+class CountingSink(Sink):
+    def __init__(self):
+        self.count = 0
+
+    def write(self, qid, page, data) -> None:
+        self.count += 1
+
+
+def queue_single(cg, n):
+    for i in range(n):
+        cg.coins_id_get(f"coin-{i}", qid=str(i))
+
+
+def queue_ranges(cg, n):
+    for i in range(n // 10):
+        cg.coins_markets_get("usd", qid=str(i), page_start=1, page_end=10)
+
+
+def queue_pages(cg, n):
+    cg.coins_markets_get("usd", qid="markets", page_start=1, page_end=n)
+
+
+def run(queue, n):
+    """Returns (seconds queueing, seconds executing)"""
+    cg = CoingeckoApi(transport=StubTransport(), log_level=30)
+    sink = CountingSink()
+    start = time.perf_counter()
+    queue(cg, n)
+    queued = time.perf_counter()
+    cg.execute_queued(sink=sink)
+    executed = time.perf_counter()
+    assert sink.count == n
+    return queued - start, executed - queued
+
+
+def peak_memory(queue, n):
+    """Returns the peak bytes allocated while queueing and executing"""
+    gc.collect()
+    tracemalloc.start()
+    run(queue, n)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    print(
+        f"{'calls':8} {'n':>8} {'queue us/call':>14} {'execute us/call':>16} {'peak bytes/call':>16}"
+    )
+    workloads = [
+        ("single", queue_single),
+        ("ranges", queue_ranges),
+        ("pages", queue_pages),
+    ]
+    for name, queue in workloads:
+        for n in SIZES:
+            secs_queue, secs_execute = run(queue, n)
+            peak = peak_memory(queue, n)
+            print(
+                f"{name:8} {n:8} {secs_queue / n * 1e6:14.2f} {secs_execute / n * 1e6:16.2f} {peak / n:16.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
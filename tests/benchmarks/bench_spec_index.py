@@ -0,0 +1,31 @@
+"""Cold load time of the spec index (endpoint metadata used by every api call), each measured in a
+fresh interpreter: reading and parsing the processed spec and url_to_method json files as
+ApiMeta used to, and importing the generated spec_index module.
+
+    python -m tests.benchmarks.bench_spec_index
+"""
+from tests.benchmarks.bench_import import measure
+
+SETUP = "from coingecko_py.utils import api_meta"
+
+# name ---> statement
+STATEMENTS = {
+    "json": """
+m = api_meta.api_meta
+api_meta.build_spec_index(
+    m.get_spec_processed(), m.read(api_meta.URL_TO_METHOD_PATH)
+)""",
+    "module": "api_meta.api_meta.get_spec_index()",
+}
+
+
+def main():
+    base = measure(SETUP)
+    print(f"{'load':8} {'ms':>7}")
+    for name, statement in STATEMENTS.items():
+        ms = (measure(f"{SETUP}\n{statement}") - base) * 1e3
+        print(f"{name:8} {ms:7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Per request overhead of each transport (utils.transport) against a local mock server with no
+simulated latency, sequentially through the api client and concurrently through execute_queued.
+Also compares api client construction before and after skipping the swagger ApiClient setup,
+and connections used by execute_queued over HTTP/1.1 and HTTP/2 (httpx, h2c) with latency.
+
+    python -m tests.benchmarks.bench_transport
+"""
+import time
+import timeit
+
+from coingecko_py import CoingeckoApi
+from coingecko_py.swagger_generated.swagger_client import ApiClient as ApiClientSwagger
+from coingecko_py.utils.transport import TRANSPORTS, HttpxTransport
+from coingecko_py.utils.utils import optional_import
+from tests.mock_server import MockServer, MockH2Server
+
+NUM_CALLS = 1000
+NUM_QUEUED = 2000
+MAX_WORKERS = 8
+NUM_CLIENTS = 50
+LATENCY = 0.02
+
+
+def run_sequential(cg):
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        cg.ping_get()
+    return (time.perf_counter() - start) / NUM_CALLS
+
+
+def run_queued(cg):
+    for i in range(NUM_QUEUED):
+        cg.coins_id_get(f"coin-{i}", qid=str(i))
+    start = time.perf_counter()
+    results = cg.execute_queued()
+    elapsed = time.perf_counter() - start
+    assert len(results) == NUM_QUEUED
+    return NUM_QUEUED / elapsed
+
+
+def run_multiplexed(server, transport):
+    cg = CoingeckoApi(
+        url_base=server.url_base,
+        transport=transport,
+        max_workers=MAX_WORKERS * 4,
+        log_level=30,
+    )
+    throughput = run_queued(cg)
+    cg.api_client.close()
+    return throughput
+
+
+def main():
+    with MockServer() as server:
+        print(
+            f"{'transport':10} {'keep_alive':>10} {'us/call':>8} {'queued calls/s':>15}"
+        )
+        for name in TRANSPORTS:
+            for keep_alive in [True, False]:
+                cg = CoingeckoApi(
+                    url_base=server.url_base,
+                    transport=name,
+                    keep_alive=keep_alive,
+                    max_workers=MAX_WORKERS,
+                    log_level=30,
+                )
+                # warm up the connection pool
+                cg.ping_get()
+                secs = run_sequential(cg)
+                throughput = run_queued(cg)
+                cg.api_client.close()
+                print(
+                    f"{name:10} {str(keep_alive):>10} {secs * 1e6:8.0f} {throughput:15.0f}"
+                )
+    # ApiClient.__init__ creates a ThreadPool and a urllib3 pool that requests never used
+    swagger = timeit.timeit(ApiClientSwagger, number=NUM_CLIENTS) / NUM_CLIENTS
+    client = timeit.timeit(CoingeckoApi, number=NUM_CLIENTS) / NUM_CLIENTS
+    print(f"swagger ApiClient(): {swagger * 1e3:.2f} ms")
+    print(f"CoingeckoApi(): {client * 1e3:.2f} ms")
+    if optional_import("httpx") is None:
+        print(
+            "httpx is not installed, pip install coingecko_py[http2] to include HTTP/2"
+        )
+        return
+    print(
+        f"\nsimulated latency: {LATENCY * 1000:.0f}ms, max_workers: {MAX_WORKERS * 4}"
+    )
+    print(f"{'protocol':10} {'connections':>11} {'queued calls/s':>15}")
+    with MockServer(latency=LATENCY) as server:
+        throughput = run_multiplexed(server, "requests")
+        print(f"{'HTTP/1.1':10} {server.connections:11} {throughput:15.0f}")
+    with MockH2Server(latency=LATENCY) as server:
+        transport = HttpxTransport(
+            pool_maxsize=MAX_WORKERS * 4, http2_prior_knowledge=True
+        )
+        throughput = run_multiplexed(server, transport)
+        print(f"{'HTTP/2':10} {server.connections:11} {throughput:15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compares the precompiled per-endpoint UrlBuilder with the original regex / urlparse
+based implementation of materialize_url_template, using the test api call of every
+endpoint.
+
+    python -m tests.benchmarks.bench_url_builder
+"""
+import re
+import timeit
+import urllib.parse as urlparse
+from urllib.parse import urlencode
+
+from coingecko_py.utils.api_meta import api_meta
+
+NUMBER = 20000
+
+
+def materialize_url_template_reference(url_template, path_args, query_args):
+    """materialize_url_template as it was before url templates were precompiled"""
+    url_base = api_meta.get_url_base()
+    url_base_parts = list(urlparse.urlparse(url_base))
+    path_tokens = re.findall(r"({[^}]*})", url_template)
+    url = url_template
+    for i, p in enumerate(path_tokens):
+        url = url.replace(p, "{" + str(i) + "}")
+    url_parts = list(urlparse.urlparse(url))
+    url_parts[0] = url_base_parts[0]
+    url_parts[1] = url_base_parts[1]
+    url_parts[2] = url_base_parts[2] + url.format(*path_args)
+    query = dict(urlparse.parse_qsl(url_parts[4]))
+    query.update(query_args)
+    url_parts[4] = urlencode(query)
+    url = urlparse.urlunparse(url_parts)
+    return url
+
+
+def main():
+    test_api_calls = api_meta.get_test_api_calls()
+    total_reference = total_compiled = 0.0
+    print(f"{'endpoint':60} {'reference us':>13} {'compiled us':>12} {'speedup':>8}")
+    for url_template, test_call in test_api_calls.items():
+        path_args, query_args = test_call["path"], test_call["query"]
+        build_url = api_meta.get_url_builder(url_template)
+        expected = materialize_url_template_reference(
+            url_template, path_args, query_args
+        )
+        assert build_url(path_args, query_args) == expected, url_template
+        reference = timeit.timeit(
+            lambda: materialize_url_template_reference(
+                url_template, path_args, query_args
+            ),
+            number=NUMBER,
+        )
+        compiled = timeit.timeit(
+            lambda: build_url(path_args, query_args), number=NUMBER
+        )
+        total_reference += reference
+        total_compiled += compiled
+        print(
+            f"{url_template:60} {reference / NUMBER * 1e6:13.2f} "
+            f"{compiled / NUMBER * 1e6:12.2f} {reference / compiled:7.1f}x"
+        )
+    n = NUMBER * len(test_api_calls)
+    print(
+        f"{'mean':60} {total_reference / n * 1e6:13.2f} "
+        f"{total_compiled / n * 1e6:12.2f} {total_reference / total_compiled:7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
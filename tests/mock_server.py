@@ -0,0 +1,228 @@
+"""Local stand-in for the coingecko api, used by benchmarks and tests that need a real
+socket rather than the `responses` mock.
+
+    with MockServer(latency=0.02) as server:
+        cg = CoingeckoApi(url_base=server.url_base)
+
+MockH2Server serves the same handler over HTTP/2 (requires h2).
+"""
+import json
+import time
+import socket
+import threading
+import urllib.parse as urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def default_handler(path, query):
+    """Echoes the request back. Paged requests report 5 pages of 100 items."""
+    headers = {"Per-Page": "100", "Total": "500"}
+    return 200, headers, json.dumps({"path": path, "query": query}).encode("utf-8")
+
+
+class MockServer:
+    """Threaded HTTP/1.1 server on an ephemeral local port.
+
+    handler(path, query) -> (status, headers, body bytes). Every response is delayed by
+    latency seconds to simulate a network round trip.
+    """
+
+    def __init__(self, handler=default_handler, latency=0.0, base_path="/api/v3"):
+        self.handler = handler
+        self.latency = latency
+        self.base_path = base_path
+        self.requests = list()
+        # number of connections accepted
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url_base(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.base_path}"
+
+    def _make_handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body are separate writes, which nagle + delayed ack would stall
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                url_parts = urlparse.urlparse(self.path)
+                path = url_parts.path[len(server.base_path) :]
+                query = dict(urlparse.parse_qsl(url_parts.query))
+                with server._lock:
+                    server.requests.append((path, query))
+                if server.latency:
+                    time.sleep(server.latency)
+                status, headers, body = server.handler(path, query)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if self.headers.get("Connection", "").lower() == "close":
+                    self.send_header("Connection", "close")
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        ThreadingHTTPServer.request_queue_size = 128
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class MockH2Server(MockServer):
+    """HTTP/2 server over cleartext, for clients with prior knowledge (h2c). Each stream is answered
+    on its own thread, so concurrent requests on one connection are delayed by latency concurrently.
+    max_streams is the peak number of concurrently open streams.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_streams = 0
+        self._open_streams = 0
+        self._sockets = list()
+
+    @property
+    def url_base(self):
+        host, port = self._server.getsockname()[:2]
+        return f"http://{host}:{port}{self.base_path}"
+
+    def _accept(self):
+        # polled, as closing the listening socket doesn't interrupt accept
+        self._server.settimeout(0.05)
+        while not self._stopped:
+            try:
+                sock, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            sock.settimeout(None)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                self.connections += 1
+                self._sockets.append(sock)
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self, sock):
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        config = h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        conn = h2.connection.H2Connection(config=config)
+        # guards conn and sock, notified when the client opens flow control windows
+        cond = threading.Condition()
+        with cond:
+            conn.initiate_connection()
+            sock.sendall(conn.data_to_send())
+        while True:
+            try:
+                data = sock.recv(2 ** 16)
+            except OSError:
+                break
+            if not data:
+                break
+            with cond:
+                events = conn.receive_data(data)
+                sock.sendall(conn.data_to_send())
+                cond.notify_all()
+            for event in events:
+                if isinstance(event, h2.events.RequestReceived):
+                    args = (conn, sock, cond, event.stream_id, dict(event.headers))
+                    threading.Thread(
+                        target=self._respond, args=args, daemon=True
+                    ).start()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    sock.close()
+                    return
+        sock.close()
+
+    def _respond(self, conn, sock, cond, stream_id, request_headers):
+        url_parts = urlparse.urlparse(request_headers[":path"])
+        path = url_parts.path[len(self.base_path) :]
+        query = dict(urlparse.parse_qsl(url_parts.query))
+        with self._lock:
+            self.requests.append((path, query))
+            self._open_streams += 1
+            self.max_streams = max(self.max_streams, self._open_streams)
+        if self.latency:
+            time.sleep(self.latency)
+        status, headers, body = self.handler(path, query)
+        headers = {
+            ":status": str(status),
+            "content-type": "application/json",
+            "content-length": str(len(body)),
+            **{k.lower(): v for k, v in headers.items()},
+        }
+        try:
+            with cond:
+                conn.send_headers(stream_id, list(headers.items()), end_stream=not body)
+                sock.sendall(conn.data_to_send())
+                while body:
+                    window = min(
+                        conn.local_flow_control_window(stream_id),
+                        conn.max_outbound_frame_size,
+                    )
+                    if window <= 0:
+                        cond.wait()
+                        continue
+                    chunk, body = body[:window], body[window:]
+                    conn.send_data(stream_id, chunk, end_stream=not body)
+                    sock.sendall(conn.data_to_send())
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                self._open_streams -= 1
+
+    def start(self):
+        self._server = socket.create_server(("127.0.0.1", 0))
+        self._stopped = False
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped = True
+        self._thread.join()
+        self._server.close()
+        with self._lock:
+            for sock in self._sockets:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                sock.close()
@@ -1,5 +1,9 @@
+import os
+import sys
 import subprocess
 
+BENCHMARKS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "benchmarks")
+
 
 def run_tests():
     subprocess.run("pytest ./tests --cov -vvv".split(" "))
@@ -7,3 +11,11 @@ def run_tests():
     # -k test_failed_body_byte_decode
     # subprocess.run("poetry run pytest ./tests --cov -vvv".split(" "))
     # subprocess.run("poetry run pytest ./tests --cov -vvv".split(" "))
+
+
+def run_benchmarks():
+    for f in sorted(os.listdir(BENCHMARKS_DIR)):
+        if f.startswith("bench_") and f.endswith(".py"):
+            module = f"tests.benchmarks.{f[:-3]}"
+            print(f"\n# {module}")
+            subprocess.run([sys.executable, "-m", module])
@@ -0,0 +1,368 @@
+import json
+import time
+import random
+import asyncio
+import unittest
+from unittest.mock import patch
+from contextlib import contextmanager
+
+import pytest
+import requests
+from requests.exceptions import HTTPError
+
+from coingecko_py import error_msgs, Sink
+from coingecko_py.utils.api_meta import api_meta
+from tests.mock_server import MockServer
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from coingecko_py import AsyncCoingeckoApi
+
+PER_PAGE = 5
+TOTAL = 19
+
+
+def paged_handler(path, query):
+    """Returns the requested page number as data. Reports TOTAL items over pages of PER_PAGE."""
+    headers = {"Per-Page": str(PER_PAGE), "Total": str(TOTAL)}
+    body = {"path": path, "page": int(query.get("page", 1))}
+    return 200, headers, json.dumps(body).encode("utf-8")
+
+
+class RateLimitedHandler:
+    """first limit - 1 calls ---> 429, subsequent calls ---> 200"""
+
+    def __init__(self, limit):
+        self.calls = 0
+        self.limit = limit
+
+    def __call__(self, path, query):
+        self.calls += 1
+        if self.calls < self.limit:
+            return 429, {}, b"{}"
+        return 200, {}, json.dumps({"path": path}).encode("utf-8")
+
+
+@contextmanager
+def patch_sleep():
+    """Patches asyncio.sleep so backoff doesn't block the test. Yields the list of requested
+    sleep durations, ignoring the zero length sleeps aiohttp uses internally.
+    """
+    real_sleep = asyncio.sleep
+    slept = list()
+
+    async def sleep(secs, *args, **kwargs):
+        if secs:
+            slept.append(secs)
+        await real_sleep(0)
+
+    with patch("coingecko_py.coingecko_py_async.asyncio.sleep", new=sleep):
+        yield slept
+
+
+class TestAsyncApiClient(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(handler=paged_handler).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def run_with_client(self, fn, **kwargs):
+        async def main():
+            async with AsyncCoingeckoApi(url_base=self.server.url_base, **kwargs) as cg:
+                return await fn(cg)
+
+        return asyncio.run(main())
+
+    def test_endpoints_are_coroutines(self):
+        async def fn(cg):
+            for name in api_meta.get_api_method_names():
+                assert callable(getattr(cg, name))
+            coro = cg.ping_get()
+            assert asyncio.iscoroutine(coro)
+            return await coro
+
+        assert self.run_with_client(fn) == {"path": "/ping", "page": 1}
+
+    def test_call(self):
+        async def fn(cg):
+            return await cg.coins_id_tickers_get("bitcoin", page=2)
+
+        assert self.run_with_client(fn) == {"path": "/coins/bitcoin/tickers", "page": 2}
+        assert self.server.requests == [("/coins/bitcoin/tickers", {"page": "2"})]
+
+    def test_call_with_http_info(self):
+        async def fn(cg):
+            return await cg.coins_id_tickers_get_with_http_info("bitcoin", page=2)
+
+        data, status, headers = self.run_with_client(fn)
+        assert data == {"path": "/coins/bitcoin/tickers", "page": 2}
+        assert status == 200
+        assert headers["Per-Page"] == str(PER_PAGE)
+
+    def test_keep_alive(self):
+        async def fn(cg):
+            results = await asyncio.gather(*[cg.ping_get() for _ in range(4)])
+            assert cg.api_client.session.connector.force_close
+            return results
+
+        assert (
+            self.run_with_client(fn, keep_alive=False, timeout=5)
+            == [{"path": "/ping", "page": 1}] * 4
+        )
+        with pytest.raises(ValueError):
+            AsyncCoingeckoApi(transport="urllib3")
+
+    def test_failed(self):
+        async def fn(cg):
+            with pytest.raises(HTTPError) as exc_info:
+                await cg.ping_get()
+            return exc_info
+
+        self.server.handler = lambda path, query: (404, {}, b"{}")
+        exc_info = self.run_with_client(fn)
+        assert isinstance(exc_info.value.response, requests.Response)
+        assert exc_info.value.response.status_code == 404
+
+    def test_failed_body_json_decode(self):
+        self.server.handler = lambda path, query: (200, {}, b"{'one': 2,}")
+
+        async def fn(cg):
+            with pytest.raises(requests.exceptions.JSONDecodeError) as exc_info:
+                await cg.ping_get()
+            return exc_info
+
+        exc_info = self.run_with_client(fn)
+        assert exc_info.value.strerror == error_msgs["failed_decode_json"]
+        assert exc_info.value.response.status_code == 200
+
+    def test_connection_error(self):
+        url_base = self.server.url_base
+        self.server.stop()
+
+        async def main():
+            async with AsyncCoingeckoApi(url_base=url_base) as cg:
+                with pytest.raises(requests.exceptions.ConnectionError):
+                    await cg.ping_get()
+
+        asyncio.run(main())
+        self.server.start()
+
+    def test_execute_queued(self):
+        page_end = 3
+        num_pages = -(-TOTAL // PER_PAGE)
+
+        async def fn(cg):
+            for i in range(10):
+                cg.coins_id_get(f"coin-{i}", qid=f"coin-{i}")
+            cg.exchanges_get(qid="bounded", page_start=2, page_end=page_end)
+            cg.coins_markets_get("usd", qid="unbounded", page_start=1)
+            cg.status_updates_get(qid="unbounded-2", page_start=2)
+            assert len(self.server.requests) == 0
+            results = await cg.execute_queued()
+            assert len(cg._queued_calls) == 0
+            return results
+
+        results = self.run_with_client(fn, max_workers=4)
+        for i in range(10):
+            assert results[f"coin-{i}"] == {"path": f"/coins/coin-{i}", "page": 1}
+        assert results["bounded"] == [
+            {"path": "/exchanges", "page": page} for page in range(2, page_end + 1)
+        ]
+        assert results["unbounded"] == [
+            {"path": "/coins/markets", "page": page} for page in range(1, num_pages + 1)
+        ]
+        assert results["unbounded-2"] == [
+            {"path": "/status_updates", "page": page}
+            for page in range(2, num_pages + 1)
+        ]
+        num_calls = 10 + (page_end - 1) + num_pages + (num_pages - 1)
+        assert len(self.server.requests) == num_calls
+
+    def test_queued_call_awaitable(self):
+        async def fn(cg):
+            assert await cg.coins_id_get("coin-0", qid="awaited") is None
+            assert not asyncio.iscoroutine(cg.coins_id_get("coin-1", qid="not-awaited"))
+            await cg.coins_markets_get("usd", qid="unbounded", page_start=1, page_end=2)
+            assert len(self.server.requests) == 0
+            return await cg.execute_queued()
+
+        results = self.run_with_client(fn)
+        assert results["awaited"] == {"path": "/coins/coin-0", "page": 1}
+        assert results["not-awaited"] == {"path": "/coins/coin-1", "page": 1}
+        assert len(results["unbounded"]) == 2
+
+    def test_iter_queued(self):
+        num_pages = -(-TOTAL // PER_PAGE)
+
+        def handler(path, query):
+            time.sleep(random.uniform(0, 0.01))
+            return paged_handler(path, query)
+
+        self.server.handler = handler
+        expected = [(f"coin-{i}", None, f"/coins/coin-{i}") for i in range(5)]
+        expected += [
+            ("unbounded", p, "/coins/markets") for p in range(1, num_pages + 1)
+        ]
+        expected += [("bounded", p, "/exchanges") for p in range(1, 5)]
+
+        async def fn(cg, ordered):
+            for i in range(5):
+                cg.coins_id_get(f"coin-{i}", qid=f"coin-{i}")
+            cg.coins_markets_get("usd", qid="unbounded", page_start=1)
+            cg.exchanges_get(qid="bounded", page_start=1, page_end=4)
+            results = [
+                (qid, page, data["path"])
+                async for qid, page, data in cg.iter_queued(ordered=ordered)
+            ]
+            assert len(cg._queued_calls) == 0
+            return results
+
+        for ordered in [True, False]:
+            results = self.run_with_client(lambda cg: fn(cg, ordered), max_workers=4)
+            assert sorted(results, key=str) == sorted(expected, key=str)
+            if ordered:
+                for qid in ["unbounded", "bounded"]:
+                    pages = [page for q, page, _ in results if q == qid]
+                    assert pages == sorted(pages)
+
+    def test_iter_queued_queue_while_executing(self):
+        async def fn(cg):
+            cg.coins_id_get("coin-0", qid="first")
+            results = cg.iter_queued()
+            with pytest.raises(RuntimeError, match="can't be queued"):
+                async for qid, page, data in results:
+                    cg.coins_id_get("coin-1", qid="second")
+            # async generators are only finalized once closed
+            await results.aclose()
+            assert len(cg._queued_calls) == 0
+            cg.coins_id_get("coin-1", qid="second")
+            return await cg.execute_queued()
+
+        assert self.run_with_client(fn) == {
+            "second": {"path": "/coins/coin-1", "page": 1}
+        }
+
+    def test_coalesce_concurrent_calls(self):
+        self.server.latency = 0.1
+
+        async def fn(cg):
+            return await asyncio.gather(*[cg.ping_get() for _ in range(5)])
+
+        results = self.run_with_client(fn)
+        assert results == [{"path": "/ping", "page": 1}] * 5
+        assert len(set(id(r) for r in results)) == 5
+        assert len(self.server.requests) == 1
+        results = self.run_with_client(fn, coalesce=False)
+        assert len(self.server.requests) == 1 + 5
+
+    def test_market_chart_range_granularity(self):
+        day = 24 * 60 * 60
+        start, end = 1_600_000_000, 1_600_000_000 + 200 * day
+
+        def handler(path, query):
+            prices = [[int(query["from"]) * 1000, 0], [int(query["to"]) * 1000, 0]]
+            return 200, {}, json.dumps(dict(prices=prices)).encode("utf-8")
+
+        self.server.handler = handler
+
+        async def fn(cg):
+            return await cg.coins_id_market_chart_range_get(
+                "bitcoin", "usd", start, end, granularity="hourly"
+            )
+
+        res = self.run_with_client(fn, max_workers=4)
+        assert len(self.server.requests) == 3
+        timestamps = [t // 1000 for t, _ in res["prices"]]
+        assert timestamps == [start, start + 90 * day, start + 180 * day, end]
+
+    def test_columnar(self):
+        pytest.importorskip("numpy")
+        self.server.handler = lambda path, query: (200, {}, b"[[1, 2, 3, 4, 5]]")
+
+        async def fn(cg):
+            cg.coins_id_ohlc_get("bitcoin", "usd", "1", qid="ohlc")
+            queued = await cg.execute_queued()
+            return await cg.coins_id_ohlc_get("bitcoin", "usd", "1"), queued["ohlc"]
+
+        res, queued = self.run_with_client(fn, columnar="arrays")
+        assert res["close"].tolist() == queued["close"].tolist() == [5]
+
+    def test_execute_queued_sink(self):
+        num_pages = -(-TOTAL // PER_PAGE)
+        rows = list()
+
+        class ListSink(Sink):
+            def write(self, qid, page, data):
+                rows.append((qid, page, data["page"]))
+
+        async def fn(cg):
+            cg.coins_markets_get("usd", qid="unbounded", page_start=1)
+            return await cg.execute_queued(sink=ListSink())
+
+        assert self.run_with_client(fn, max_workers=4) is None
+        assert rows == [("unbounded", p, p) for p in range(1, num_pages + 1)]
+
+    def test_stream(self):
+        coins = [dict(id=f"coin-{i}") for i in range(1000)]
+
+        def handler(path, query):
+            if path == "/coins/list":
+                return 200, {}, json.dumps(coins).encode("utf-8")
+            return 404, {}, b"{}"
+
+        self.server.handler = handler
+
+        async def fn(cg):
+            elements = [c async for c in cg.coins_list_get(stream=True)]
+            with pytest.raises(HTTPError):
+                async for _ in cg.exchanges_list_get(stream=True):
+                    pass
+            return elements
+
+        assert self.run_with_client(fn) == coins
+
+    def test_raw(self):
+        num_pages = -(-TOTAL // PER_PAGE)
+
+        async def fn(cg):
+            cg.coins_markets_get("usd", qid="unbounded", page_start=1)
+            return await cg.ping_get(), await cg.execute_queued()
+
+        ping, results = self.run_with_client(fn, raw=True)
+        assert json.loads(ping.content) == {"path": "/ping", "page": 1}
+        assert [json.loads(r.content)["page"] for r in results["unbounded"]] == list(
+            range(1, num_pages + 1)
+        )
+        assert results["unbounded"][0].headers["Total"] == str(TOTAL)
+
+    def test_rate_limited(self):
+        num_attempts = 3
+        self.server.handler = RateLimitedHandler(num_attempts)
+
+        async def fn(cg):
+            cg.ping_get(qid="ping")
+            return await cg.execute_queued()
+
+        with patch_sleep() as slept:
+            results = self.run_with_client(fn)
+        assert results == {"ping": {"path": "/ping"}}
+        assert len(self.server.requests) == num_attempts
+        assert len(slept) == num_attempts - 1
+        assert all(1 <= secs <= 60 for secs in slept)
+
+    def test_rate_limited_failed(self):
+        self.server.handler = RateLimitedHandler(100)
+
+        async def fn(cg):
+            cg.ping_get(qid="ping")
+            with pytest.raises(Exception) as exc_info:
+                await cg.execute_queued()
+            assert len(cg._queued_calls) == 0
+            return exc_info
+
+        with patch_sleep() as slept:
+            exc_info = self.run_with_client(fn, exp_limit=2)
+        assert str(exc_info.value) == error_msgs["exp_limit_reached"]
+        assert len(self.server.requests) == 3
+        assert len(slept) == 2
@@ -1,8 +1,41 @@
+import io
+import os
+import re
+import sys
+import json
+import time
+import inspect
 import logging
+import tempfile
+import threading
+import subprocess
+import pytest
 import unittest
-from unittest.mock import patch
+from urllib.parse import urlencode
+from unittest.mock import patch, Mock
 
-from coingecko_py.utils.api_meta import api_meta
+from coingecko_py import RawResponse
+from coingecko_py.coingecko_py import CoingeckoApiClient
+from coingecko_py.utils import constants
+from coingecko_py.utils.api_meta import (
+    api_meta,
+    build_spec_index,
+    make_spec_index,
+    render_spec_index_module,
+    render_endpoints_module,
+)
+from coingecko_py.swagger_generated.endpoints import CoingeckoEndpoints
+from coingecko_py.swagger_generated.swagger_client import (
+    CoingeckoApi as CoingeckoApiSwagger,
+)
+from coingecko_py.utils.cache import SqliteCache, MemoryCache
+from coingecko_py.utils.singleflight import SingleFlight
+from coingecko_py.utils.batch import batch_key, merge_batch, split_batch_result
+from coingecko_py.utils.market_chart import DAY, plan_windows, stitch_market_chart
+from coingecko_py.utils.columnar import to_columns, to_columnar, validate_columnar
+from coingecko_py.utils.sinks import NdjsonSink, ParquetSink
+from coingecko_py.utils.json_stream import JsonArrayParser
+from coingecko_py.utils.rate_limit import TokenBucket, Backoff, parse_retry_after
 from coingecko_py.utils.utils import (
     without_keys,
     with_keys,
@@ -97,6 +130,29 @@ class TestUtils(unittest.TestCase):
         expected = f"{url_base}/coins/ethereum/contract/0xdummyaddress/market_chart/range?vs_currency=eur&to=1638334800"
         assert result == expected
 
+    def test_url_builder(self):
+        url_base = api_meta.get_url_base()
+        for url_template, test_call in api_meta.get_test_api_calls().items():
+            path_args, query_args = test_call["path"], test_call["query"]
+            path = re.sub(r"{[^}]*}", "{}", url_template).format(*path_args)
+            expected = url_base + path
+            if query_args:
+                expected += "?" + urlencode(query_args)
+            build_url = api_meta.get_url_builder(url_template)
+            assert build_url(path_args, query_args) == expected
+        # values that need quoting and non str keys / values
+        url_base = "https://dummy.com/api/v1"
+        query = {
+            "ids": "bitcoin,ethereum",
+            "vs_currencies": "usd eur",
+            "flag": True,
+            b"raw": b"a/b",
+            5: 1.5,
+        }
+        build_url = api_meta.get_url_builder("/simple/price")
+        result = build_url([], query, url_base=url_base)
+        assert result == f"{url_base}/simple/price?{urlencode(query)}"
+
     def test_transform_path_query_to_args_kwargs(self):
         url_template = "/simple/token_price/{id}"
         parameters = [
@@ -148,3 +204,603 @@ class TestUtils(unittest.TestCase):
         expected_kwargs = {"include_24hr_vol": "true", "include_market_cap": "true"}
         assert args == expected_args
         assert kwargs == expected_kwargs
+
+    def test_spec_index_cached(self):
+        index = api_meta.get_spec_index()
+        test_api_calls = api_meta.get_test_api_calls()
+        with patch.object(api_meta, "read", wraps=api_meta.read) as patch_read:
+            for url_template in index.url_to_method:
+                test_call = test_api_calls[url_template]
+                api_meta.get_parameters(url_template)
+                api_meta.materialize_url_template(
+                    url_template, test_call["path"], test_call["query"]
+                )
+            api_meta.get_paginated_method_names()
+            api_meta.get_api_method_names()
+            api_meta.get_api_version()
+        assert patch_read.call_count == 0
+        assert api_meta.get_spec_index() is index
+
+    def test_spec_index_reloaded(self):
+        index = api_meta.get_spec_index()
+        with patch.object(api_meta, "read") as patch_read:
+            new_index = api_meta.reload_spec_index()
+            assert api_meta.get_spec_index() is new_index
+        patch_read.assert_not_called()
+        assert new_index is not index
+        assert new_index.endpoints == index.endpoints
+        endpoint = new_index.endpoints["/coins/{id}/status_updates"]
+        assert endpoint.paginated
+        assert endpoint.path_names == ("id",)
+        assert endpoint.method_name == "coins_id_status_updates_get"
+
+    def test_spec_index_module(self):
+        # the generated module is in sync with the processed spec it was generated from
+        index = build_spec_index(
+            api_meta.get_spec_processed(), api_meta.read(constants.URL_TO_METHOD_PATH)
+        )
+        assert api_meta.get_spec_index().endpoints == index.endpoints
+        assert api_meta.get_spec_index().url_base == index.url_base
+        assert api_meta.get_api_version() == index.api_version
+        # rendering the loaded index reproduces the module
+        source = render_spec_index_module(index)
+        namespace = dict()
+        exec(compile(source, "spec_index.py", "exec"), namespace)
+        loaded = make_spec_index(
+            namespace["URL_BASE"], namespace["API_VERSION"], namespace["ENDPOINTS"]
+        )
+        assert loaded.endpoints == index.endpoints
+        assert loaded.paginated_method_names == index.paginated_method_names
+
+    def test_endpoints_module(self):
+        class RecordingClient(CoingeckoApiClient):
+            """Records the requests of the swagger generated and the lean api methods"""
+
+            def __init__(self):
+                super().__init__()
+                self.calls = list()
+
+            def call_endpoint(self, resource_path, path_args, query_args, raw=False):
+                self.calls.append(
+                    (resource_path, list(path_args), dict(query_args), raw)
+                )
+
+        index = api_meta.get_spec_index()
+        namespace = dict()
+        exec(compile(render_endpoints_module(index), "endpoints.py", "exec"), namespace)
+        rendered = namespace["CoingeckoEndpoints"]
+        swagger, lean = RecordingClient(), RecordingClient()
+        test_api_calls = api_meta.get_test_api_calls()
+        for url_template, method_name in index.url_to_method.items():
+            fn_swagger = getattr(CoingeckoApiSwagger(swagger), method_name)
+            fn = getattr(CoingeckoEndpoints(lean), method_name)
+            # same positional arguments as the swagger generated method
+            positional = [
+                p.name
+                for p in inspect.signature(fn).parameters.values()
+                if p.kind == p.POSITIONAL_OR_KEYWORD
+            ]
+            assert positional == list(inspect.signature(fn_swagger).parameters)[:-1]
+            assert inspect.signature(
+                getattr(rendered, method_name)
+            ) == inspect.signature(getattr(CoingeckoEndpoints, method_name))
+            # same request, for raw calls too
+            test_call = test_api_calls[url_template]
+            args, kwargs = api_meta.transform_path_query_to_args_kwargs(
+                url_template, test_call["path"], test_call["query"]
+            )
+            fn_swagger(*args, **kwargs)
+            fn(*args, **kwargs)
+            fn_swagger(*args, _preload_content=False, **kwargs)
+            fn(*args, _preload_content=False, **kwargs)
+            if args:
+                with pytest.raises(ValueError):
+                    fn(None, *args[1:], **kwargs)
+            with pytest.raises(TypeError):
+                fn(*args, unknown=1, **kwargs)
+        assert lean.calls == swagger.calls
+        assert len(lean.calls) == 2 * len(index.endpoints)
+
+    @patch("coingecko_py.utils.rate_limit.time")
+    def test_token_bucket(self, time_patch):
+        time_patch.monotonic.return_value = 100.0
+        bucket = TokenBucket(calls_per_minute=120, burst=3)
+        assert bucket.fill_level == 3
+        # burst is served immediately
+        for _ in range(3):
+            bucket.acquire()
+        time_patch.sleep.assert_not_called()
+        assert bucket.fill_level == 0
+        # subsequent callers are spaced at 1 / rate seconds
+        assert bucket.reserve() == 0.5
+        assert bucket.reserve() == 1.0
+        assert bucket.fill_level == -2
+        # refill is capped at burst
+        time_patch.monotonic.return_value = 160.0
+        assert bucket.fill_level == 3
+        time_patch.monotonic.return_value = 160.5
+        for _ in range(4):
+            bucket.acquire()
+        time_patch.sleep.assert_called_once_with(0.5)
+
+    def test_token_bucket_invalid(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(calls_per_minute=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(calls_per_minute=50, burst=0)
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("30") == 30
+        assert parse_retry_after("1.5") == 1.5
+        assert parse_retry_after("-1") == 0
+        assert parse_retry_after("soon") is None
+        # http dates in the past mean retry immediately
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        with patch("coingecko_py.utils.rate_limit.time") as time_patch:
+            time_patch.time.return_value = 1445412470.0
+            assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 10
+
+    @patch("coingecko_py.utils.rate_limit.random.uniform")
+    @patch("coingecko_py.utils.rate_limit.time")
+    def test_backoff(self, time_patch, uniform_patch):
+        time_patch.monotonic.return_value = 0.0
+        uniform_patch.side_effect = lambda low, high: high
+        backoff = Backoff(base=1, max_sleep=20, deadline=100)
+        assert [backoff.next_sleep() for _ in range(4)] == [3, 9, 20, 20]
+        assert uniform_patch.call_args_list[-1].args == (1, 60)
+        # retry after takes precedence, and doesn't change the jitter state
+        assert backoff.next_sleep(retry_after=42) == 42
+        assert backoff.next_sleep() == 20
+        # deadline
+        time_patch.monotonic.return_value = 85.0
+        assert backoff.next_sleep() is None
+        assert backoff.next_sleep(retry_after=15) == 15
+
+    @patch("coingecko_py.utils.cache.time")
+    def test_sqlite_cache(self, time_patch):
+        time_patch.time.return_value = 1000.0
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.db")
+            cache = SqliteCache(
+                path, ttl=60, ttls=dict(coins_list_get=None, ping_get=0)
+            )
+            key = (
+                "https://api.coingecko.com/api/v3/coins/markets?page=2&vs_currency=usd"
+            )
+            headers = {"per-page": "100", "Total": "1000", "Set-Cookie": "a=b"}
+            assert cache.get(key) is None
+            cache.put(key, b'[{"id": "bitcoin"}]', headers)
+            # only whitelisted headers are stored, with their original casing
+            assert cache.get(key) == (
+                b'[{"id": "bitcoin"}]',
+                {"Per-Page": "100", "Total": "1000"},
+            )
+            # shared with other connections to the same file
+            assert SqliteCache(path).get(key) is not None
+            # ttl
+            time_patch.time.return_value = 1061.0
+            assert cache.get(key) is None
+            cache.put(key, b"[]", headers, "coins_list_get")
+            time_patch.time.return_value = 1e9
+            assert cache.get(key, "coins_list_get")[0] == b"[]"
+            assert cache.get(key, "ping_get") is None
+            cache.put("ping", b"{}", dict(), "ping_get")
+            assert cache.count() == 1
+            cache.clear()
+            assert cache.count() == 0
+            cache.close()
+
+    @patch("coingecko_py.utils.cache.time")
+    def test_sqlite_cache_lru_eviction(self, time_patch):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SqliteCache(os.path.join(tmp, "cache.db"), max_bytes=2500)
+            content = {k: os.urandom(1000) for k in ["a", "b", "c"]}
+            for t, (op, k) in enumerate(
+                [("put", "a"), ("put", "b"), ("get", "a"), ("put", "c")]
+            ):
+                time_patch.time.return_value = float(t)
+                if op == "put":
+                    cache.put(k, content[k], dict())
+                else:
+                    assert cache.get(k)[0] == content[k]
+            # b was least recently used
+            assert cache.get("b") is None
+            assert cache.get("a")[0] == content["a"]
+            assert cache.get("c")[0] == content["c"]
+            assert cache.size() <= 2500
+            cache.close()
+
+    def test_sqlite_cache_threads(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SqliteCache(os.path.join(tmp, "cache.db"))
+            errors = list()
+
+            def work(i):
+                try:
+                    for j in range(20):
+                        key = f"{i}-{j}"
+                        cache.put(key, key.encode(), dict())
+                        assert cache.get(key)[0] == key.encode()
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert errors == []
+            assert cache.count() == 80
+
+    @patch("coingecko_py.utils.cache.time")
+    def test_memory_cache(self, time_patch):
+        time_patch.monotonic.return_value = 0.0
+        cache = MemoryCache(ttl=60, ttls=dict(coins_list_get=None, ping_get=0))
+        headers = {"per-page": "100", "Total": "1000", "Set-Cookie": "a=b"}
+        assert cache.get("a") is None
+        cache.put("a", b"[1]", headers)
+        assert cache.get("a") == (b"[1]", {"Per-Page": "100", "Total": "1000"})
+        cache.put("b", b"[2]", dict(), "coins_list_get")
+        cache.put("c", b"[3]", dict(), "ping_get")
+        time_patch.monotonic.return_value = 61.0
+        assert cache.get("a") is None
+        assert cache.get("b", "coins_list_get") == (b"[2]", dict())
+        assert cache.get("c", "ping_get") is None
+        assert cache.stats() == dict(
+            hits=2, stale_hits=0, misses=2, evictions=0, entries=2, bytes=6
+        )
+        with pytest.raises(ValueError):
+            MemoryCache(ttls=dict(not_an_endpoint=5))
+
+    @patch("coingecko_py.utils.cache.time")
+    def test_memory_cache_stale_while_revalidate(self, time_patch):
+        time_patch.monotonic.return_value = 0.0
+        cache = MemoryCache(ttl=60, stale_ttl=30)
+        revalidate = Mock()
+        cache.put("a", b"[1]", dict())
+        assert cache.get("a", revalidate=revalidate) == (b"[1]", dict())
+        revalidate.assert_not_called()
+        # stale: served while a single refresh runs
+        time_patch.monotonic.return_value = 70.0
+        for _ in range(3):
+            assert cache.get("a", revalidate=revalidate) == (b"[1]", dict())
+        assert revalidate.call_count == 1
+        # without revalidate stale entries aren't served
+        assert cache.get("a") is None
+        # failed refresh allows another attempt
+        cache.refresh_done("a")
+        assert cache.get("a", revalidate=revalidate) == (b"[1]", dict())
+        assert revalidate.call_count == 2
+        # refreshed
+        cache.put("a", b"[2]", dict())
+        assert cache.get("a", revalidate=revalidate) == (b"[2]", dict())
+        # past the stale window
+        time_patch.monotonic.return_value = 161.0
+        assert cache.get("a", revalidate=revalidate) is None
+        assert revalidate.call_count == 2
+        assert cache.stats()["stale_hits"] == 4
+
+    def test_memory_cache_lru_eviction(self):
+        cache = MemoryCache(max_entries=3, max_bytes=10)
+        for k in ["a", "b", "c"]:
+            cache.put(k, b"12", dict())
+        assert cache.get("a") is not None
+        cache.put("d", b"12", dict())
+        # b was least recently used
+        assert cache.get("b") is None
+        cache.put("e", b"1234567", dict())
+        # over max_entries and max_bytes, c and a evicted
+        assert cache.get("c") is None
+        assert cache.get("a") is None
+        stats = cache.stats()
+        assert stats["evictions"] == 3
+        assert stats["entries"] == 2
+        assert stats["bytes"] == 9
+
+    def test_single_flight(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = list()
+        results = list()
+
+        def fn():
+            calls.append(1)
+            started.set()
+            release.wait()
+            if len(calls) == 1:
+                raise ValueError("failed")
+            return "ok"
+
+        def call():
+            try:
+                results.append(single_flight.do("key", fn))
+            except ValueError as e:
+                results.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait()
+        followers = [threading.Thread(target=call) for _ in range(3)]
+        for t in followers:
+            t.start()
+        # give the followers time to start waiting on the leader
+        time.sleep(0.1)
+        release.set()
+        for t in [leader] + followers:
+            t.join()
+        # the leader's exception is raised in every caller
+        assert len(calls) == 1
+        assert len(results) == 4
+        assert all(isinstance(r, ValueError) for r in results)
+        assert single_flight.in_flight() == 0
+        # the key is forgotten once the call completes
+        assert single_flight.do("key", fn) == "ok"
+        assert len(calls) == 2
+
+    def test_endpoint_batch_param(self):
+        batch_params = {
+            e.method_name: (e.batch_param, e.max_per_page)
+            for e in api_meta.get_spec_index().endpoints.values()
+            if e.batch_param is not None
+        }
+        assert batch_params == dict(
+            simple_price_get=("ids", None),
+            simple_token_price_id_get=("contract_addresses", None),
+            coins_markets_get=("ids", 250),
+        )
+        endpoint = api_meta.get_endpoint_by_method("coins_markets_get")
+        assert endpoint.url_template == "/coins/markets"
+
+    def test_merge_batch(self):
+        endpoint = api_meta.get_endpoint_by_method("coins_markets_get")
+        calls = list()
+        for i in range(600):
+            kwargs = dict(ids=f"c{i}, c{i + 1}", order="id_asc")
+            key, ids = batch_key(endpoint, ("usd",), kwargs)
+            assert ids == (f"c{i}", f"c{i + 1}")
+            calls.append((None, ("usd",), kwargs, ids, i))
+        assert batch_key(endpoint, ("usd",), dict(ids="a,b", page=2)) is None
+        assert batch_key(endpoint, ("usd",), dict()) is None
+        merged = merge_batch(endpoint, calls)
+        assert len(merged) == 3
+        consumers = list()
+        for fn, args, kwargs, batch_consumers in merged:
+            assert args == ("usd",)
+            assert kwargs["order"] == "id_asc"
+            assert kwargs["per_page"] == 250
+            assert len(kwargs["ids"].split(",")) <= 250
+            consumers += batch_consumers
+        assert [c for c, ids in consumers] == list(range(600))
+        # positional batch parameter
+        endpoint = api_meta.get_endpoint_by_method("simple_price_get")
+        calls = [
+            (None, (i, "usd"), dict(), batch_key(endpoint, (i, "usd"), dict())[1], i)
+            for i in ["a", "b"]
+        ]
+        ((fn, args, kwargs, consumers),) = merge_batch(endpoint, calls)
+        assert args == ("a,b", "usd")
+        assert consumers == [("a", ("a",)), ("b", ("b",))]
+        # batch and other required parameters passed by position or keyword
+        calls = [
+            ((i, "usd"), dict()) if i == "a" else ((), dict(ids=i, vs_currencies="usd"))
+            for i in ["a", "b"]
+        ]
+        keys = [batch_key(endpoint, args, kwargs) for args, kwargs in calls]
+        assert keys[0][0] == keys[1][0]
+        assert batch_key(endpoint, ("a", "eur"), dict())[0] != keys[0][0]
+
+    def test_split_batch_result(self):
+        res = {"0xabc": {"usd": 1}, "0xdef": {"usd": 2}}
+        assert split_batch_result(res, ["0xABC"]) == {"0xabc": {"usd": 1}}
+        res = [dict(id="a"), dict(id="b"), dict(id="c")]
+        assert split_batch_result(res, ["c", "a"]) == [dict(id="a"), dict(id="c")]
+        assert split_batch_result(res, ["a"])[0] is not res[0]
+
+    def test_plan_windows(self):
+        start = 1_600_000_000
+        # windows span at most the max span of the granularity
+        windows = plan_windows(start, start + 200 * DAY, "hourly")
+        assert windows == [
+            (start, start + 90 * DAY),
+            (start + 90 * DAY, start + 180 * DAY),
+            (start + 180 * DAY, start + 200 * DAY),
+        ]
+        windows = plan_windows(start, start + 3 * DAY, "5m")
+        assert len(windows) == 3
+        assert all(e - s <= DAY for s, e in windows)
+        # short windows are extended backwards beyond the min span
+        windows = plan_windows(start, start + 400 * DAY, "daily")
+        assert windows[0] == (start, start + 365 * DAY)
+        assert windows[1][1] == start + 400 * DAY
+        assert windows[1][1] - windows[1][0] > 90 * DAY
+        windows = plan_windows(start, start + 60 * 60, "hourly")
+        assert len(windows) == 1
+        assert windows[0][1] - windows[0][0] > DAY
+        with pytest.raises(ValueError):
+            plan_windows(start, start + DAY, "weekly")
+        with pytest.raises(ValueError):
+            plan_windows(start, start - 1, "daily")
+
+    def test_stitch_market_chart(self):
+        results = [
+            {"prices": [[1000, 1], [2000, 2], [3000, 3]], "total_volumes": [[2000, 5]]},
+            {"prices": [[4000, 4], [3000, 3], [0, 0]], "total_volumes": [[3000, 6]]},
+        ]
+        assert stitch_market_chart(results, 1, 3) == {
+            "prices": [[1000, 1], [2000, 2], [3000, 3]],
+            "total_volumes": [[2000, 5], [3000, 6]],
+        }
+        assert stitch_market_chart([], 1, 3) == dict()
+
+    def test_to_columns(self):
+        np = pytest.importorskip("numpy")
+        points = [[1_600_000_000_000, 1.5], [1_600_000_300_000, "2.5"], [1, None]]
+        columns = to_columns(points, ("timestamp", "volume"), "arrays")
+        assert columns["timestamp"].dtype == np.int64
+        assert columns["timestamp"].tolist() == [
+            1_600_000_000_000,
+            1_600_000_300_000,
+            1,
+        ]
+        assert columns["volume"].dtype == np.float64
+        assert columns["volume"][:2].tolist() == [1.5, 2.5]
+        assert np.isnan(columns["volume"][2])
+        assert columns["volume"].flags["C_CONTIGUOUS"]
+        array = to_columns(points, ("timestamp", "volume"), "structured")
+        assert array.dtype.names == ("timestamp", "volume")
+        assert array["timestamp"].tolist() == columns["timestamp"].tolist()
+        assert array.nbytes == 16 * len(points)
+        assert len(to_columns([], ("timestamp", "value"), "arrays")["value"]) == 0
+        assert len(to_columns([], ("timestamp", "value"), "structured")) == 0
+
+    def test_to_columnar(self):
+        pytest.importorskip("numpy")
+        res = dict(prices=[[1, 2], [3, 4]], total_volumes=[[1, 5]])
+        columnar = to_columnar("coins_id_market_chart_get", res, "arrays")
+        assert columnar["prices"]["value"].tolist() == [2, 4]
+        assert columnar["total_volumes"]["timestamp"].tolist() == [1]
+        res = [[1, 2, 3, 4, 5]]
+        array = to_columnar("coins_id_ohlc_get", res, "structured")
+        assert array.dtype.names == ("timestamp", "open", "high", "low", "close")
+        assert array[0]["close"] == 5
+        with pytest.raises(ValueError):
+            validate_columnar("coins_id_ohlc_get", "frame")
+        with pytest.raises(ValueError):
+            validate_columnar("coins_list_get", "arrays")
+        with patch.dict(sys.modules, {"numpy": None}):
+            with pytest.raises(ImportError):
+                validate_columnar("coins_id_ohlc_get", "arrays")
+
+    def test_ndjson_sink(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.ndjson")
+            sink = NdjsonSink(path, buffer_size=100)
+            sink.write("a", None, {"x": 1})
+            # buffered until buffer_size characters accumulate
+            assert os.path.getsize(path) == 0
+            for page in range(1, 6):
+                sink.write("b", page, [page] * 10)
+            assert os.path.getsize(path) > 0
+            sink.close()
+            with open(path) as f:
+                lines = f.read().splitlines()
+        assert lines[0] == '{"qid":"a","page":null,"data":{"x":1}}'
+        assert len(lines) == 6
+        assert sink.rows == 6
+
+    def test_ndjson_sink_raw(self):
+        out = io.StringIO()
+        with NdjsonSink(out) as sink:
+            sink.write("a", 1, RawResponse(b'{"x": [1, 2]}', {}))
+            sink.write("b", None, RawResponse(b'{\n  "x": 1\n}', {}))
+        assert out.getvalue().splitlines() == [
+            '{"qid":"a","page":1,"data":{"x": [1, 2]}}',
+            '{"qid":"b","page":null,"data":{"x":1}}',
+        ]
+        # content that isn't json would make an invalid line
+        for content in [b"<html>rate limited</html>", b"\xaa"]:
+            with pytest.raises(ValueError, match="isn't json"):
+                NdjsonSink(io.StringIO()).write("c", None, RawResponse(content, {}))
+
+    def test_ndjson_sink_numpy(self):
+        np = pytest.importorskip("numpy")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.ndjson")
+            with NdjsonSink(path) as sink:
+                sink.write("a", None, {"timestamp": np.array([1, 2], dtype=np.int64)})
+            with open(path) as f:
+                assert (
+                    f.read() == '{"qid":"a","page":null,"data":{"timestamp":[1,2]}}\n'
+                )
+
+    def test_parquet_sink(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.parquet")
+            with ParquetSink(path, row_group_size=4) as sink:
+                sink.write("a", None, {"x": 1})
+                for page in range(1, 10):
+                    sink.write("b", page, [page])
+                    # reused over several execute_queued calls, which flush the sink
+                    sink.flush()
+            f = pq.ParquetFile(path)
+            assert f.metadata.num_rows == 10
+            assert f.metadata.num_row_groups == 3
+            rows = f.read().to_pylist()
+        assert rows[0] == dict(qid="a", page=None, data='{"x":1}')
+        assert rows[-1] == dict(qid="b", page=9, data="[9]")
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            with pytest.raises(ImportError):
+                ParquetSink("unused.parquet")
+
+    def test_json_array_parser(self):
+        def parse(content, key=None, chunk_size=3):
+            parser = JsonArrayParser(key)
+            elements = list()
+            for i in range(0, len(content), chunk_size):
+                elements += parser.feed(content[i : i + chunk_size])
+            return elements + parser.close()
+
+        elements = [{"id": "a", "x": [1, 2.5, "é"]}, 12345, -1.5e10, "s,]", None, True]
+        elements += [[], {}, 7]
+        content = json.dumps(elements).encode("utf-8")
+        for chunk_size in [1, 2, 3, 7, len(content)]:
+            assert parse(content, chunk_size=chunk_size) == elements
+        content = json.dumps(dict(name="x", n=123, tickers=elements, z={"k": [1]}))
+        for chunk_size in [1, 5, len(content)]:
+            assert parse(content.encode("utf-8"), "tickers", chunk_size) == elements
+        assert parse(b" [ ] ") == []
+        assert parse(b'{"name": "x"}', "tickers") == []
+        # elements are returned as soon as they are complete
+        parser = JsonArrayParser()
+        assert parser.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+        assert parser.feed(b": 2}, 3") == [{"b": 2}]
+        assert parser.feed(b"4]") == [34]
+        assert parser.close() == []
+        for content in [b"[1, 2", b"[1,,2]", b"{}", b"[1] x", b"[1.]"]:
+            with pytest.raises(json.JSONDecodeError):
+                parse(content)
+        with pytest.raises(UnicodeDecodeError):
+            parse(b"[\xaa]")
+
+    def test_lazy_import(self):
+        code = """
+import sys, json, logging
+import coingecko_py
+imported = [m for m in sys.modules if m.split(".")[0] in ("requests", "numpy")]
+from coingecko_py import CoingeckoApi
+from coingecko_py.utils.api_meta import api_meta
+cg = CoingeckoApi()
+slow = ("numpy", "pyarrow", "httpx", "aiohttp", "pkg_resources", "toml", "dotenv")
+# the swagger generated client isn't used at runtime
+slow += ("coingecko_py.swagger_generated.swagger_client",)
+print(json.dumps(dict(
+    imported=imported,
+    slow=[m for m in slow if m in sys.modules],
+    handlers=len(logging.getLogger().handlers),
+    url_base=api_meta.get_url_base(),
+)))
+"""
+        # outside the source tree, without the .env paths
+        env = {k: v for k, v in os.environ.items() if not hasattr(constants, k)}
+        env["PYTHONPATH"] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            cwd=tempfile.gettempdir(),
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        res = json.loads(out.stdout)
+        assert res["imported"] == []
+        assert res["slow"] == []
+        assert res["handlers"] == 0
+        assert res["url_base"] == "https://api.coingecko.com/api/v3"
+        import coingecko_py
+
+        assert "CoingeckoApi" in dir(coingecko_py)
+        with pytest.raises(AttributeError):
+            coingecko_py.CoingeckoClient